@@ -0,0 +1,588 @@
+#!/usr/bin/env python3
+"""
+Benchmark runner for EpicEvents CRM
+Seeds temporary SQLite databases at several sizes, times every repository
+method and CLI command end to end, and writes JSON results that can be
+compared between commits.
+
+Usage:
+    python -m benchmarks.run --sizes 100,1000,10000 --output results.json
+    python -m benchmarks.run --sizes 1000 --compare baseline.json
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from decimal import Decimal
+
+from click.testing import CliRunner
+
+from database.connection import DatabaseConnection
+from models.models import Base, Client, Contract, Department, Employee, Event
+from repositories.client_repository import ClientRepository
+from repositories.contract_repository import ContractRepository
+from repositories.employee_repository import EmployeeRepository
+from repositories.event_repository import EventRepository
+from services.auth_service import AuthService
+from utils.generate import DEFAULT_PASSWORD, generate
+from utils.init_db import install_version_triggers
+
+# Unique suffix for rows created by write benchmarks
+_counter = itertools.count(1)
+
+
+def unique(prefix):
+    return f"{prefix}.{next(_counter)}@benchmark.example.com"
+
+
+def seed_database(database_path, size, seed):
+    """Create and populate a fresh SQLite database with `size` clients."""
+    os.environ["DATABASE_URL"] = f"sqlite:///{database_path}"
+    DatabaseConnection.dispose()
+    engine = DatabaseConnection.get_engine()
+    Base.metadata.create_all(engine)
+    install_version_triggers(engine)
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate(clients=size, employees=30, chunk_size=10_000, seed=seed)
+
+
+def load_context():
+    """Pick the rows the benchmarks operate on."""
+    with DatabaseConnection.get_session() as session:
+        contract = (
+            session.query(Contract)
+            .filter(Contract.is_signed == True)  # noqa: E712
+            .order_by(Contract.id)
+            .first()
+        )
+        commercial = session.get(Employee, contract.commercial_id)
+        client = (
+            session.query(Client)
+            .filter(Client.commercial_id == commercial.id)
+            .order_by(Client.id)
+            .first()
+        )
+        event = session.query(Event).order_by(Event.id).first()
+        support = (
+            session.query(Employee)
+            .filter(Employee.department == Department.SUPPORT)
+            .order_by(Employee.id)
+            .first()
+        )
+        management = (
+            session.query(Employee)
+            .filter(Employee.department == Department.MANAGEMENT)
+            .order_by(Employee.id)
+            .first()
+        )
+        return {
+            "client_id": client.id,
+            "client_email": client.email,
+            "contract_id": contract.id,
+            "event_id": event.id,
+            "commercial_id": commercial.id,
+            "commercial_email": commercial.email,
+            "support_id": support.id,
+            "management_email": management.email,
+        }
+
+
+def new_client(session, ctx):
+    return ClientRepository(session).create(
+        {
+            "full_name": "Benchmark Client",
+            "email": unique("client"),
+            "commercial_id": ctx["commercial_id"],
+        }
+    )
+
+
+def new_contract(session, ctx, remaining_amount=Decimal("500.00")):
+    return ContractRepository(session).create(
+        {
+            "client_id": ctx["client_id"],
+            "commercial_id": ctx["commercial_id"],
+            "total_amount": Decimal("1000.00"),
+            "remaining_amount": remaining_amount,
+            "is_signed": True,
+        }
+    )
+
+
+def new_event(session, ctx):
+    return EventRepository(session).create(
+        {
+            "contract_id": ctx["contract_id"],
+            "support_id": ctx["support_id"],
+            "name": "Benchmark Event",
+            "start_date": datetime(2025, 6, 1, 9, 0),
+            "end_date": datetime(2025, 6, 1, 17, 0),
+        }
+    )
+
+
+def new_employee(session, ctx):
+    return EmployeeRepository(session).create(
+        full_name="Benchmark Employee",
+        email=unique("employee"),
+        department=Department.SUPPORT,
+        role="Benchmark",
+        password=DEFAULT_PASSWORD,
+    )
+
+
+def repository_benchmarks(ctx):
+    """Build (name, setup, run) triples.
+
+    `setup(session)` is not timed and its result is passed to
+    `run(session, prepared)`, which performs exactly one repository call.
+    """
+    none = lambda session: None  # noqa: E731
+    clients = ClientRepository
+    contracts = ContractRepository
+    employees = EmployeeRepository
+    events = EventRepository
+    return [
+        # Clients
+        ("client.get_by_id", none, lambda s, _: clients(s).get_by_id(ctx["client_id"])),
+        (
+            "client.get_by_email",
+            none,
+            lambda s, _: clients(s).get_by_email(ctx["client_email"]),
+        ),
+        ("client.get_all", none, lambda s, _: clients(s).get_all()),
+        (
+            "client.get_by_commercial",
+            none,
+            lambda s, _: clients(s).get_by_commercial(ctx["commercial_id"]),
+        ),
+        (
+            "client.get_commercial",
+            none,
+            lambda s, _: clients(s).get_commercial(ctx["commercial_id"]),
+        ),
+        ("client.create", none, lambda s, _: new_client(s, ctx)),
+        (
+            "client.update",
+            none,
+            lambda s, _: clients(s).update(ctx["client_id"], {"phone": "0102030405"}),
+        ),
+        (
+            "client.delete",
+            lambda s: new_client(s, ctx).id,
+            lambda s, client_id: clients(s).delete(client_id),
+        ),
+        # Contracts
+        (
+            "contract.get_by_id",
+            none,
+            lambda s, _: contracts(s).get_by_id(ctx["contract_id"]),
+        ),
+        ("contract.get_all", none, lambda s, _: contracts(s).get_all()),
+        (
+            "contract.get_by_client",
+            none,
+            lambda s, _: contracts(s).get_by_client(ctx["client_id"]),
+        ),
+        (
+            "contract.get_by_commercial",
+            none,
+            lambda s, _: contracts(s).get_by_commercial(ctx["commercial_id"]),
+        ),
+        (
+            "contract.get_unsigned_contracts",
+            none,
+            lambda s, _: contracts(s).get_unsigned_contracts(),
+        ),
+        (
+            "contract.get_unpaid_contracts",
+            none,
+            lambda s, _: contracts(s).get_unpaid_contracts(),
+        ),
+        (
+            "contract.get_client",
+            none,
+            lambda s, _: contracts(s).get_client(ctx["client_id"]),
+        ),
+        (
+            "contract.get_commercial",
+            none,
+            lambda s, _: contracts(s).get_commercial(ctx["commercial_id"]),
+        ),
+        ("contract.create", none, lambda s, _: new_contract(s, ctx)),
+        (
+            "contract.update",
+            none,
+            lambda s, _: contracts(s).update(
+                ctx["contract_id"], {"remaining_amount": Decimal("100.00")}
+            ),
+        ),
+        (
+            "contract.delete",
+            # Contracts with payments are kept, so delete an unpaid one
+            lambda s: new_contract(s, ctx, remaining_amount=Decimal("1000.00")).id,
+            lambda s, contract_id: contracts(s).delete(contract_id),
+        ),
+        # Employees
+        (
+            "employee.get_by_email",
+            none,
+            lambda s, _: employees(s).get_by_email(ctx["commercial_email"]),
+        ),
+        (
+            "employee.get_by_id",
+            none,
+            lambda s, _: employees(s).get_by_id(ctx["commercial_id"]),
+        ),
+        ("employee.get_all", none, lambda s, _: employees(s).get_all()),
+        (
+            "employee.get_existing_emails",
+            none,
+            lambda s, _: employees(s).get_existing_emails(
+                [ctx["commercial_email"], ctx["management_email"]]
+            ),
+        ),
+        ("employee.create", none, lambda s, _: new_employee(s, ctx)),
+        (
+            "employee.update",
+            none,
+            lambda s, _: employees(s).update(ctx["commercial_email"], role="Sales"),
+        ),
+        (
+            "employee.delete",
+            lambda s: new_employee(s, ctx).email,
+            lambda s, email: employees(s).delete(email),
+        ),
+        (
+            "employee.verify_credentials",
+            none,
+            lambda s, _: employees(s).verify_credentials(
+                ctx["commercial_email"], DEFAULT_PASSWORD
+            ),
+        ),
+        # Events
+        ("event.get_by_id", none, lambda s, _: events(s).get_by_id(ctx["event_id"])),
+        ("event.get_all", none, lambda s, _: events(s).get_all()),
+        (
+            "event.get_by_contract",
+            none,
+            lambda s, _: events(s).get_by_contract(ctx["contract_id"]),
+        ),
+        (
+            "event.get_by_support",
+            none,
+            lambda s, _: events(s).get_by_support(ctx["support_id"]),
+        ),
+        (
+            "event.get_without_support",
+            none,
+            lambda s, _: events(s).get_without_support(),
+        ),
+        (
+            "event.get_contract",
+            none,
+            lambda s, _: events(s).get_contract(ctx["contract_id"]),
+        ),
+        ("event.get_client", none, lambda s, _: events(s).get_client(ctx["client_id"])),
+        (
+            "event.get_support",
+            none,
+            lambda s, _: events(s).get_support(ctx["support_id"]),
+        ),
+        ("event.create", none, lambda s, _: new_event(s, ctx)),
+        (
+            "event.update",
+            none,
+            lambda s, _: events(s).update(ctx["event_id"], {"attendees": 42}),
+        ),
+        (
+            "event.delete",
+            lambda s: new_event(s, ctx).id,
+            lambda s, event_id: events(s).delete(event_id),
+        ),
+    ]
+
+
+def cli_benchmarks(ctx):
+    """Build (name, login email, args factory) triples for CLI commands."""
+    management = ctx["management_email"]
+    commercial = ctx["commercial_email"]
+    return [
+        ("cli.employee list", management, lambda: ["employee", "list"]),
+        (
+            "cli.employee create",
+            management,
+            lambda: [
+                "employee", "create",
+                "--full-name", "Benchmark Employee",
+                "--email", unique("employee"),
+                "--department", "support",
+                "--role", "Benchmark",
+                "--password", DEFAULT_PASSWORD,
+            ],
+        ),
+        (
+            "cli.employee update",
+            management,
+            lambda: [
+                "employee", "update",
+                "--email", commercial,
+                "--full-name", "",
+                "--department", "",
+                "--role", "Sales",
+                "--password", "",
+            ],
+        ),
+        ("cli.client list", commercial, lambda: ["client", "list"]),
+        (
+            "cli.client create",
+            commercial,
+            lambda: [
+                "client", "create",
+                "--full-name", "Benchmark Client",
+                "--email", unique("client"),
+                "--phone", "0102030405",
+                "--company-name", "Benchmark Corp",
+            ],
+        ),
+        (
+            "cli.client update",
+            commercial,
+            lambda: [
+                "client", "update",
+                "--client-id", str(ctx["client_id"]),
+                "--full-name", "",
+                "--email", "",
+                "--phone", "0102030405",
+                "--company-name", "",
+            ],
+        ),
+        ("cli.contract list", management, lambda: ["contract", "list"]),
+        ("cli.contract list --unsigned", management, lambda: ["contract", "list", "--unsigned"]),
+        ("cli.contract list --unpaid", management, lambda: ["contract", "list", "--unpaid"]),
+        (
+            "cli.contract create",
+            management,
+            lambda: [
+                "contract", "create",
+                "--client-id", str(ctx["client_id"]),
+                "--commercial-id", str(ctx["commercial_id"]),
+                "--total-amount", "1000.00",
+                "--remaining-amount", "500.00",
+            ],
+        ),
+        (
+            "cli.contract update",
+            management,
+            lambda: [
+                "contract", "update",
+                "--contract-id", str(ctx["contract_id"]),
+                "--total-amount", "",
+                "--remaining-amount", "100.00",
+                "--is-signed", "",
+            ],
+        ),
+        ("cli.event list", management, lambda: ["event", "list"]),
+        (
+            "cli.event list --without-support",
+            management,
+            lambda: ["event", "list", "--without-support"],
+        ),
+        (
+            "cli.event create",
+            commercial,
+            lambda: [
+                "event", "create",
+                "--contract-id", str(ctx["contract_id"]),
+                "--support-id", str(ctx["support_id"]),
+                "--name", "Benchmark Event",
+                "--start-date", "2025-06-01 09:00",
+                "--end-date", "2025-06-01 17:00",
+                "--location", "Paris",
+                "--attendees", "42",
+                "--notes", "Benchmark",
+            ],
+        ),
+        (
+            "cli.event update",
+            management,
+            lambda: [
+                "event", "update",
+                "--event-id", str(ctx["event_id"]),
+                "--name", "",
+                "--start-date", "",
+                "--end-date", "",
+                "--location", "",
+                "--attendees", "42",
+                "--notes", "",
+                "--support-id", "",
+            ],
+        ),
+    ]  # fmt: skip
+
+
+def summarize(name, size, durations):
+    return {
+        "size": size,
+        "name": name,
+        "runs": len(durations),
+        "min": min(durations),
+        "median": statistics.median(durations),
+        "mean": statistics.fmean(durations),
+        "max": max(durations),
+    }
+
+
+def run_repository_benchmarks(ctx, size, repeat):
+    results = []
+    for name, setup, run in repository_benchmarks(ctx):
+        durations = []
+        for _ in range(repeat):
+            with DatabaseConnection.get_session() as session:
+                prepared = setup(session)
+                start = time.perf_counter()
+                run(session, prepared)
+                durations.append(time.perf_counter() - start)
+        results.append(summarize(name, size, durations))
+        print(f"  {name:<40} median {results[-1]['median'] * 1000:9.3f} ms")
+    return results
+
+
+def run_cli_benchmarks(ctx, size, repeat):
+    # Imported here so the CLI modules pick up the benchmark environment
+    from epicevents import cli
+
+    runner = CliRunner()
+    auth_service = AuthService()
+    logged_in_as = None
+    results = []
+    for name, email, make_args in cli_benchmarks(ctx):
+        if email != logged_in_as:
+            success, _ = auth_service.authenticate(email, DEFAULT_PASSWORD)
+            if not success:
+                raise RuntimeError(f"Could not log in as {email}")
+            logged_in_as = email
+        durations = []
+        for _ in range(repeat):
+            args = make_args()
+            start = time.perf_counter()
+            result = runner.invoke(cli, args)
+            durations.append(time.perf_counter() - start)
+            if result.exit_code != 0 or result.output.lstrip().startswith("Error"):
+                raise RuntimeError(f"{name} failed: {result.output.strip()[:200]}")
+        results.append(summarize(name, size, durations))
+        print(f"  {name:<40} median {results[-1]['median'] * 1000:9.3f} ms")
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    """Print the median ratio of each benchmark against a previous run."""
+    with open(baseline_path, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    previous = {(r["size"], r["name"]): r for r in baseline["results"]}
+    print(f"\nComparison with {baseline_path} (commit {baseline.get('commit')}):")
+    for result in results:
+        before = previous.get((result["size"], result["name"]))
+        if not before:
+            continue
+        ratio = result["median"] / before["median"] if before["median"] else 0
+        print(
+            f"  [{result['size']:>8}] {result['name']:<40} "
+            f"{before['median'] * 1000:9.3f} ms -> "
+            f"{result['median'] * 1000:9.3f} ms  x{ratio:.2f}"
+        )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark repository methods and CLI commands."
+    )
+    parser.add_argument(
+        "--sizes",
+        default="100,1000,10000",
+        help="Comma-separated numbers of clients to seed",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Timed runs of each benchmark"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Data generation seed")
+    parser.add_argument(
+        "--output", default="benchmark_results.json", help="JSON results file"
+    )
+    parser.add_argument("--compare", help="Previous JSON results to compare with")
+    parser.add_argument(
+        "--skip-cli", action="store_true", help="Only benchmark repositories"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = [int(float(size)) for size in args.sizes.split(",")]
+    os.environ.setdefault("JWT_SECRET", "benchmark-secret")
+    previous_cwd = os.getcwd()
+    output_path = os.path.abspath(args.output)
+    results = []
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # The CLI stores its token in the working directory
+        os.chdir(workdir)
+        try:
+            for size in sizes:
+                print(f"\nSeeding {size} clients...")
+                database_path = os.path.join(workdir, f"bench_{size}.db")
+                seed_database(database_path, size, args.seed)
+                ctx = load_context()
+                print("Repository methods:")
+                results.extend(run_repository_benchmarks(ctx, size, args.repeat))
+                if not args.skip_cli:
+                    print("CLI commands:")
+                    results.extend(run_cli_benchmarks(ctx, size, args.repeat))
+                DatabaseConnection.dispose()
+        finally:
+            os.chdir(previous_cwd)
+
+    report = {
+        "commit": git_commit(),
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    with open(output_path, "w", encoding="utf-8") as output_file:
+        json.dump(report, output_file, indent=2)
+    print(f"\nResults written to {output_path}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"Error running benchmarks: {str(e)}")
+        sys.exit(1)
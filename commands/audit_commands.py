@@ -0,0 +1,73 @@
+import json
+from datetime import datetime
+
+import click
+
+from auth import AuthService
+from database.connection import DatabaseConnection
+from logging_config import log_exception
+from models.models import Contract, Department, Employee
+from repositories.audit_repository import AuditRepository
+
+# Tables whose changes the repositories record in the audit log
+ENTITIES = [model.__tablename__ for model in (Employee, Contract)]
+
+
+@click.group()
+def audit():
+    """Audit log commands."""
+    pass
+
+
+@audit.command()
+@click.option(
+    "--entity", type=click.Choice(ENTITIES), help="Filter by type of changed record"
+)
+@click.option("--entity-id", type=int, help="Filter by ID of the changed record")
+@click.option(
+    "--since",
+    help="Only show changes since this date (YYYY-MM-DD or YYYY-MM-DD HH:MM)",
+)
+@click.option("--limit", type=int, help="Maximum number of entries to show")
+def list(
+    entity: str = None, entity_id: int = None, since: str = None, limit: int = None
+):
+    """List audit log entries, most recent first."""
+    try:
+        auth_service = AuthService()
+        if not auth_service.has_permission(Department.MANAGEMENT):
+            click.echo("Error: Only management users can view the audit log")
+            return
+
+        since_datetime = None
+        if since:
+            for date_format in ("%Y-%m-%d %H:%M", "%Y-%m-%d"):
+                try:
+                    since_datetime = datetime.strptime(since, date_format).astimezone()
+                    break
+                except ValueError:
+                    continue
+            else:
+                click.echo("Error: Invalid date format. Use YYYY-MM-DD [HH:MM]")
+                return
+
+        with DatabaseConnection.get_read_session() as session:
+            repo = AuditRepository(session)
+            entries = repo.list(
+                entity=entity, entity_id=entity_id, since=since_datetime, limit=limit
+            )
+
+            if not entries:
+                click.echo("No audit entries found")
+                return
+
+            for entry in entries:
+                click.echo(f"\nAudit ID: {entry.id}")
+                click.echo(f"Date: {entry.created_at.astimezone()}")
+                click.echo(f"Action: {entry.action.name.lower()}")
+                click.echo(f"Entity: {entry.entity} {entry.entity_id}")
+                click.echo(f"Changes: {json.dumps(entry.changes)}")
+                click.echo("-" * 50)
+    except Exception as e:
+        log_exception(e, {"action": "list_audit", "entity": entity, "since": since})
+        click.echo(f"Error listing audit entries: {str(e)}")
@@ -1,4 +1,5 @@
 import click
+from sqlalchemy.orm.exc import StaleDataError
 
 from auth import AuthService
 from database.connection import DatabaseConnection
@@ -87,12 +88,18 @@ def create(full_name: str, email: str, phone: str = None, company_name: str = No
     default="",
     help="New company name",
 )
+@click.option(
+    "--expected-version",
+    type=int,
+    help="Refuse the update if the client changed since this version was listed",
+)
 def update(
     client_id: int,
     full_name: str = "",
     email: str = "",
     phone: str = "",
     company_name: str = "",
+    expected_version: int = None,
 ):
     """Update an existing client."""
     auth_service = AuthService()
@@ -119,6 +126,13 @@ def update(
             click.echo("Error: You can only update clients assigned to you")
             return
 
+        if expected_version is not None and client.version != expected_version:
+            click.echo(
+                f"Error: Client {client_id} was changed by another user; "
+                "list it again and retry"
+            )
+            return
+
         # Check if new email is already taken
         if email and email != client.email:
             existing_client = repo.get_by_email(email)
@@ -143,6 +157,11 @@ def update(
         try:
             updated_client = repo.update(client_id, update_data)
             click.echo(f"Successfully updated client: {updated_client.full_name}")
+        except StaleDataError:
+            click.echo(
+                f"Error: Client {client_id} was changed by another user; "
+                "list it again and retry"
+            )
         except Exception as e:
             click.echo(f"Error updating client: {str(e)}")
 
@@ -156,7 +175,7 @@ def list():
         click.echo("Error: No authenticated user found")
         return
 
-    with DatabaseConnection.get_session() as session:
+    with DatabaseConnection.get_read_session() as session:
         repo = ClientRepository(session)
 
         # All authenticated users see all clients
@@ -172,7 +191,8 @@ def list():
             click.echo(f"Email: {client.email}")
             click.echo(f"Phone: {client.phone or 'Not provided'}")
             click.echo(f"Company: {client.company_name or 'Not provided'}")
-            click.echo(f"Created At: {client.created_at}")
+            click.echo(f"Created At: {client.created_at.astimezone()}")
+            click.echo(f"Version: {client.version}")
             click.echo(
                 f"Commercial: {client.commercial.full_name if client.commercial else 'Not assigned'}"
             )
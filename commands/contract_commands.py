@@ -1,12 +1,15 @@
+from datetime import datetime
 from decimal import Decimal, InvalidOperation
 
 import click
+from sqlalchemy.orm.exc import StaleDataError
 
 from auth import AuthService
 from database.connection import DatabaseConnection
 from logging_config import log_contract_signature, log_exception
 from models.models import Department
 from repositories.contract_repository import ContractRepository
+from repositories.payment_repository import PaymentRepository
 
 
 @click.group()
@@ -141,11 +144,17 @@ def create(
     default="",
     help="Contract signed status",
 )
+@click.option(
+    "--expected-version",
+    type=int,
+    help="Refuse the update if the contract changed since this version was listed",
+)
 def update(
     contract_id: int,
     total_amount: str = "",
     remaining_amount: str = "",
     is_signed: str = "",
+    expected_version: int = None,
 ):
     """Update an existing contract."""
     try:
@@ -182,6 +191,13 @@ def update(
                 click.echo("Error: You can only update contracts assigned to you")
                 return
 
+            if expected_version is not None and contract.version != expected_version:
+                click.echo(
+                    f"Error: Contract {contract_id} was changed by another user; "
+                    "list it again and retry"
+                )
+                return
+
             update_data = {}
             if total_amount.strip():
                 try:
@@ -257,6 +273,11 @@ def update(
                 )
 
             click.echo(f"Successfully updated contract {contract_id}")
+    except StaleDataError:
+        click.echo(
+            f"Error: Contract {contract_id} was changed by another user; "
+            "list it again and retry"
+        )
     except Exception as e:
         log_exception(
             e,
@@ -274,7 +295,20 @@ def update(
 @click.option(
     "--unpaid", is_flag=True, help="Show only contracts with remaining amount"
 )
-def list(unsigned: bool = False, unpaid: bool = False):
+@click.option(
+    "--without-events", is_flag=True, help="Show only signed contracts without events"
+)
+@click.option(
+    "--next-event-before",
+    type=click.DateTime(formats=["%Y-%m-%d", "%Y-%m-%d %H:%M"]),
+    help="Show only contracts with an upcoming event before this date",
+)
+def list(
+    unsigned: bool = False,
+    unpaid: bool = False,
+    without_events: bool = False,
+    next_event_before: datetime = None,
+):
     """List contracts with optional filters. All authenticated users can list contracts."""
     try:
         auth_service = AuthService()
@@ -283,7 +317,7 @@ def list(unsigned: bool = False, unpaid: bool = False):
             click.echo("Error: No authenticated user found")
             return
 
-        with DatabaseConnection.get_session() as session:
+        with DatabaseConnection.get_read_session() as session:
             repo = ContractRepository(session)
 
             # Get contracts based on filters - all authenticated users see all contracts
@@ -291,6 +325,13 @@ def list(unsigned: bool = False, unpaid: bool = False):
                 contracts = repo.get_unsigned_contracts()
             elif unpaid:
                 contracts = repo.get_unpaid_contracts()
+            elif without_events:
+                contracts = repo.get_without_events()
+            elif next_event_before:
+                # click.DateTime parses naive datetimes, in local time
+                contracts = repo.get_with_next_event_before(
+                    next_event_before.astimezone()
+                )
             else:
                 contracts = repo.get_all()
 
@@ -305,10 +346,146 @@ def list(unsigned: bool = False, unpaid: bool = False):
                 click.echo(f"Total Amount: {contract.total_amount}")
                 click.echo(f"Remaining Amount: {contract.remaining_amount}")
                 click.echo(f"Signed: {contract.is_signed}")
-                click.echo(f"Created At: {contract.created_at}")
+                click.echo(f"Events: {contract.event_count}")
+                next_event = (
+                    contract.next_event_date.astimezone()
+                    if contract.next_event_date
+                    else "None scheduled"
+                )
+                click.echo(f"Next Event: {next_event}")
+                click.echo(f"Created At: {contract.created_at.astimezone()}")
+                click.echo(f"Version: {contract.version}")
                 click.echo("-" * 50)
     except Exception as e:
         log_exception(
-            e, {"action": "list_contracts", "unsigned": unsigned, "unpaid": unpaid}
+            e,
+            {
+                "action": "list_contracts",
+                "unsigned": unsigned,
+                "unpaid": unpaid,
+                "without_events": without_events,
+            },
         )
         click.echo(f"Error listing contracts: {str(e)}")
+
+
+@contract.command()
+@click.option(
+    "--commercial-id", type=int, help="Only count the contracts of this commercial"
+)
+def summary(commercial_id: int = None):
+    """Show the number of contracts and their amount totals."""
+    try:
+        auth_service = AuthService()
+        current_user = auth_service.get_current_user()
+        if not current_user:
+            click.echo("Error: No authenticated user found")
+            return
+
+        with DatabaseConnection.get_read_session() as session:
+            totals = ContractRepository(session).get_totals(commercial_id)
+
+        click.echo(f"Contracts: {totals['contracts']}")
+        click.echo(f"Total Amount: {totals['total_amount']}")
+        click.echo(f"Paid Amount: {totals['paid_amount']}")
+        click.echo(f"Remaining Amount: {totals['remaining_amount']}")
+    except Exception as e:
+        log_exception(e, {"action": "contract_summary", "commercial_id": commercial_id})
+        click.echo(f"Error summarizing contracts: {str(e)}")
+
+
+@contract.command()
+@click.option(
+    "--contract-id", prompt="Contract ID", required=True, type=int, help="Contract ID"
+)
+@click.option("--amount", prompt="Amount paid", required=True, help="Amount paid")
+def pay(contract_id: int, amount: str):
+    """Record a payment received on a contract."""
+    try:
+        auth_service = AuthService()
+        if not (
+            auth_service.has_permission(Department.MANAGEMENT)
+            or auth_service.has_permission(Department.COMMERCIAL)
+        ):
+            click.echo("Error: Only management or commercial users can record payments")
+            return
+
+        try:
+            amount_decimal = Decimal(amount)
+        except (ValueError, InvalidOperation):
+            click.echo("Error: Invalid amount format. Please enter a valid number")
+            return
+        if amount_decimal <= 0:
+            click.echo("Error: Amount must be greater than 0")
+            return
+        if amount_decimal != round(amount_decimal, 2):
+            click.echo("Error: Amount cannot have more than 2 decimal places")
+            return
+
+        with DatabaseConnection.get_session() as session:
+            current_user = auth_service.get_current_user()
+            if not current_user:
+                click.echo("Error: No authenticated user found")
+                return
+
+            contract = ContractRepository(session).get_by_id(contract_id)
+            if not contract:
+                click.echo(f"Error: Contract with ID {contract_id} not found")
+                return
+
+            # If commercial user, verify they own the contract
+            if (
+                current_user.department == Department.COMMERCIAL
+                and contract.commercial_id != current_user.id
+            ):
+                click.echo("Error: You can only record payments on your contracts")
+                return
+
+            payment = PaymentRepository(session).pay(
+                contract_id, amount_decimal, current_user.id
+            )
+            if not payment:
+                click.echo("Error: Amount is greater than the remaining amount")
+                return
+
+            click.echo(
+                f"Recorded payment of {payment.amount} on contract {contract_id}, "
+                f"remaining amount: {contract.remaining_amount}"
+            )
+    except Exception as e:
+        log_exception(e, {"action": "pay_contract", "contract_id": contract_id})
+        click.echo(f"Error recording payment: {str(e)}")
+
+
+@contract.command()
+@click.option(
+    "--all", "show_all", is_flag=True, help="Show reconciled contracts as well"
+)
+def reconcile(show_all: bool = False):
+    """Compare the contract balances with the payments ledger."""
+    try:
+        auth_service = AuthService()
+        if not auth_service.has_permission(Department.MANAGEMENT):
+            click.echo("Error: Only management users can reconcile payments")
+            return
+
+        with DatabaseConnection.get_read_session() as session:
+            rows = PaymentRepository(session).reconcile(mismatched_only=not show_all)
+
+        if not rows:
+            click.echo("All contract balances match the payments ledger")
+            return
+
+        for row in rows:
+            click.echo(f"\nContract ID: {row['contract_id']}")
+            click.echo(f"Total Amount: {row['total_amount']}")
+            click.echo(
+                f"Paid Amount: {row['paid_amount']} ({row['payments']} payments)"
+            )
+            click.echo(f"Remaining Amount: {row['remaining_amount']}")
+            # Positive when the balance went down without a ledger entry
+            click.echo(f"Difference: {row['difference']}")
+            click.echo("-" * 50)
+    except Exception as e:
+        log_exception(e, {"action": "reconcile_payments"})
+        click.echo(f"Error reconciling payments: {str(e)}")
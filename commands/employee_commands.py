@@ -1,10 +1,12 @@
+import csv
+
 import click
 
 from auth import AuthService
 from database.connection import DatabaseConnection
 from logging_config import log_employee_change, log_exception
 from models.models import Department
-from repositories.employee_repository import EmployeeRepository
+from repositories.employee_repository import ASSIGNMENT_COLUMNS, EmployeeRepository
 
 
 @click.group()
@@ -198,6 +200,173 @@ def delete(email):
         click.echo(f"Error deleting employee: {str(e)}")
 
 
+@employee.command()
+@click.option(
+    "--from",
+    "from_email",
+    prompt="Current employee email",
+    required=True,
+    help="Email of the employee whose assignments are moved",
+)
+@click.option(
+    "--to",
+    "to_email",
+    prompt="New employee email",
+    required=True,
+    help="Email of the employee receiving the assignments",
+)
+@click.option(
+    "--department",
+    type=click.Choice([d.value for d in ASSIGNMENT_COLUMNS]),
+    help="Assignments to move (default: the department of --from)",
+)
+@click.option("--dry-run", is_flag=True, help="Show the counts without moving anything")
+def reassign(from_email, to_email, department, dry_run):
+    """Move the clients, contracts or events of an employee to another one.
+
+    Commercial assignments are clients and contracts, support assignments
+    are events. All rows move in one transaction.
+    """
+    try:
+        auth_service = AuthService()
+        if not auth_service.has_permission(Department.MANAGEMENT):
+            click.echo("Error: Only management users can reassign employees")
+            return
+
+        if from_email == to_email:
+            click.echo("Error: --from and --to must be different employees")
+            return
+
+        with DatabaseConnection.unit_of_work() as session:
+            repository = EmployeeRepository(session)
+
+            from_employee = repository.get_by_email(from_email)
+            if not from_employee:
+                click.echo(f"Error: Employee with email {from_email} not found.")
+                return
+            to_employee = repository.get_by_email(to_email)
+            if not to_employee:
+                click.echo(f"Error: Employee with email {to_email} not found.")
+                return
+
+            department = (
+                Department(department) if department else from_employee.department
+            )
+            if department not in ASSIGNMENT_COLUMNS:
+                click.echo(
+                    f"Error: {from_email} is in {department.value}, "
+                    "use --department to choose the assignments to move"
+                )
+                return
+            if to_employee.department != department:
+                click.echo(
+                    f"Error: {to_email} is not in the {department.value} department"
+                )
+                return
+
+            if dry_run:
+                counts = repository.count_assignments(from_employee, department)
+            else:
+                counts = repository.reassign(from_employee, to_employee, department)
+
+        verb = "Would move" if dry_run else "Moved"
+        for table_name, count in counts.items():
+            click.echo(
+                f"{verb} {count} {table_name}(s) from {from_email} to {to_email}"
+            )
+    except Exception as e:
+        log_exception(
+            e, {"action": "reassign_employee", "from": from_email, "to": to_email}
+        )
+        click.echo(f"Error reassigning employee: {str(e)}")
+
+
+IMPORT_COLUMNS = ["full_name", "email", "department", "role", "password"]
+
+
+@employee.command(name="import")
+@click.option(
+    "--file",
+    "file_path",
+    prompt="CSV file",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="CSV file with columns: full_name, email, department, role, password",
+)
+def import_employees(file_path):
+    """Create employees in bulk from a CSV file."""
+    try:
+        auth_service = AuthService()
+        if not auth_service.has_permission(Department.MANAGEMENT):
+            click.echo("Error: Only management users can import employees")
+            return
+
+        with open(file_path, newline="", encoding="utf-8") as csv_file:
+            reader = csv.DictReader(csv_file)
+            missing_columns = set(IMPORT_COLUMNS) - set(reader.fieldnames or [])
+            if missing_columns:
+                click.echo(
+                    f"Error: Missing columns: {', '.join(sorted(missing_columns))}"
+                )
+                return
+            rows = [
+                {column: row[column] for column in IMPORT_COLUMNS} for row in reader
+            ]
+
+        if not rows:
+            click.echo("Error: No employees to import")
+            return
+
+        departments = {d.value for d in Department}
+        seen_emails = set()
+        # Line 1 is the CSV header
+        for line_number, row in enumerate(rows, start=2):
+            if not all((row[column] or "").strip() for column in IMPORT_COLUMNS):
+                click.echo(f"Error: Line {line_number}: all columns are required")
+                return
+            if row["department"] not in departments:
+                click.echo(
+                    f"Error: Line {line_number}: invalid department "
+                    f"{row['department']}"
+                )
+                return
+            if row["email"] in seen_emails:
+                click.echo(
+                    f"Error: Line {line_number}: duplicate email {row['email']}"
+                )
+                return
+            seen_emails.add(row["email"])
+
+        with DatabaseConnection.get_session() as session:
+            repository = EmployeeRepository(session)
+
+            existing_emails = repository.get_existing_emails(sorted(seen_emails))
+            if existing_emails:
+                click.echo(
+                    "Error: Employees with these emails already exist: "
+                    f"{', '.join(sorted(existing_emails))}"
+                )
+                return
+
+            employees = repository.bulk_create(rows)
+
+            for employee in employees:
+                log_employee_change(
+                    "created",
+                    {
+                        "employee_number": employee.employee_number,
+                        "full_name": employee.full_name,
+                        "department": employee.department.value,
+                        "role": employee.role,
+                    },
+                )
+
+            click.echo(f"Successfully imported {len(employees)} employees")
+    except Exception as e:
+        log_exception(e, {"action": "import_employees", "file": file_path})
+        click.echo(f"Error importing employees: {str(e)}")
+
+
 @employee.command()
 def list():
     """List all employees."""
@@ -205,7 +374,7 @@ def list():
     if not auth_service.get_current_user():
         click.echo("Error: Only authenticated users can list employees.")
         return
-    with DatabaseConnection.get_session() as session:
+    with DatabaseConnection.get_read_session() as session:
         repository = EmployeeRepository(session)
         employees = repository.get_all()
 
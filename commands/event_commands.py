@@ -1,6 +1,7 @@
 from datetime import datetime
 
 import click
+from sqlalchemy.orm.exc import StaleDataError
 
 from auth import AuthService
 from database.connection import DatabaseConnection
@@ -93,9 +94,13 @@ def create(
                 return
 
             try:
-                # Parse dates
-                start_datetime = datetime.strptime(start_date, "%Y-%m-%d %H:%M")
-                end_datetime = datetime.strptime(end_date, "%Y-%m-%d %H:%M")
+                # Parse dates, entered in local time
+                start_datetime = datetime.strptime(
+                    start_date, "%Y-%m-%d %H:%M"
+                ).astimezone()
+                end_datetime = datetime.strptime(
+                    end_date, "%Y-%m-%d %H:%M"
+                ).astimezone()
 
                 event_data = {
                     "contract_id": contract_id,
@@ -174,6 +179,11 @@ def create(
     default="",
     help="New support employee ID",
 )
+@click.option(
+    "--expected-version",
+    type=int,
+    help="Refuse the update if the event changed since this version was listed",
+)
 def update(
     event_id: int,
     name: str = "",
@@ -183,6 +193,7 @@ def update(
     attendees: str = "",
     notes: str = "",
     support_id: str = "",
+    expected_version: int = None,
 ):
     """Update an existing event."""
     try:
@@ -214,6 +225,14 @@ def update(
                 if event.support_id != current_user.id:
                     click.echo("Error: You can only update events assigned to you")
                     return
+
+            if expected_version is not None and event.version != expected_version:
+                click.echo(
+                    f"Error: Event {event_id} was changed by another user; "
+                    "list it again and retry"
+                )
+                return
+
             update_data = {}
             if name.strip():
                 update_data["name"] = name
@@ -221,7 +240,7 @@ def update(
                 try:
                     update_data["start_date"] = datetime.strptime(
                         start_date, "%Y-%m-%d %H:%M"
-                    )
+                    ).astimezone()
                 except ValueError:
                     click.echo("Error: Invalid start date format. Use YYYY-MM-DD HH:MM")
                     return
@@ -229,7 +248,7 @@ def update(
                 try:
                     update_data["end_date"] = datetime.strptime(
                         end_date, "%Y-%m-%d %H:%M"
-                    )
+                    ).astimezone()
                 except ValueError:
                     click.echo("Error: Invalid end date format. Use YYYY-MM-DD HH:MM")
                     return
@@ -276,6 +295,11 @@ def update(
 
             updated_event = repo.update(event_id, update_data)
             click.echo(f"Successfully updated event {event_id}")
+    except StaleDataError:
+        click.echo(
+            f"Error: Event {event_id} was changed by another user; "
+            "list it again and retry"
+        )
     except Exception as e:
         log_exception(e, {"action": "update_event", "event_id": event_id})
         click.echo(f"Error updating event: {str(e)}")
@@ -297,7 +321,7 @@ def list(
             click.echo("Error: No authenticated user found")
             return
 
-        with DatabaseConnection.get_session() as session:
+        with DatabaseConnection.get_read_session() as session:
             repo = EventRepository(session)
 
             # Get current user
@@ -332,11 +356,12 @@ def list(
                 click.echo(f"Contract ID: {event.contract_id}")
                 click.echo(f"Client: {event.contract.client.full_name}")
                 click.echo(f"Support ID: {event.support_id}")
-                click.echo(f"Start Date: {event.start_date}")
-                click.echo(f"End Date: {event.end_date}")
+                click.echo(f"Start Date: {event.start_date.astimezone()}")
+                click.echo(f"End Date: {event.end_date.astimezone()}")
                 click.echo(f"Location: {event.location}")
                 click.echo(f"Attendees: {event.attendees}")
                 click.echo(f"Notes: {event.notes}")
+                click.echo(f"Version: {event.version}")
                 click.echo("-" * 50)
     except Exception as e:
         log_exception(
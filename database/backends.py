@@ -0,0 +1,321 @@
+import os
+import time
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import URL, Engine
+from sqlalchemy.pool import StaticPool
+
+
+def get_pool_options() -> dict:
+    """Get the connection pool sizing from the environment."""
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+    }
+
+
+def get_statement_timeout_ms() -> int | None:
+    """Get the maximum statement duration in milliseconds, if configured."""
+    timeout = os.getenv("DB_STATEMENT_TIMEOUT_MS")
+    return int(timeout) if timeout else None
+
+
+def get_connect_timeout() -> int:
+    """Get the time allowed to open a server connection, in seconds."""
+    return int(os.getenv("DB_CONNECT_TIMEOUT", "10"))
+
+
+class Backend:
+    """Engine settings for a database dialect.
+
+    The default suits any server database: pooled connections sized from
+    the environment and no driver-specific arguments.
+    """
+
+    # Driver used by the asyncio engine when DATABASE_URL names none
+    async_driver = None
+    # Whether create_version_triggers keeps the table_version rows up to date
+    tracks_table_versions = False
+
+    def engine_options(self, url: URL) -> dict:
+        """Get the `create_engine` keyword arguments for the URL."""
+        return {
+            "pool_pre_ping": True,  # Enable connection health checks
+            "pool_recycle": 3600,  # Recycle connections after 1 hour
+            **get_pool_options(),
+        }
+
+    def configure(self, engine: Engine):
+        """Install engine event listeners once the engine is created."""
+
+    def read_url(self, url: URL) -> URL | None:
+        """Get a read-only URL for the database, if the dialect offers one.
+
+        Without one, reads share the main engine unless DATABASE_READ_URL
+        points at a replica.
+        """
+        return None
+
+    def async_url(self, url: URL) -> URL:
+        """Get the URL of the same database through an asyncio driver."""
+        if self.async_driver and not url.get_dialect().is_async:
+            return url.set(drivername=f"{url.get_backend_name()}+{self.async_driver}")
+        return url
+
+    def async_engine_options(self, url: URL) -> dict:
+        """Get the `create_async_engine` keyword arguments for the URL."""
+        return {"pool_pre_ping": True, "pool_recycle": 3600, **get_pool_options()}
+
+    def create_version_triggers(self, conn, table_names: list[str]):
+        """Create the triggers bumping table_version when the tables change.
+
+        Only dialects with tracks_table_versions implement it; they must
+        skip the triggers that already exist.
+        """
+        raise NotImplementedError(
+            f"Table versions are not tracked on {conn.dialect.name}"
+        )
+
+
+class SQLiteBackend(Backend):
+    async_driver = "aiosqlite"
+    tracks_table_versions = True
+
+    @staticmethod
+    def is_memory(url: URL) -> bool:
+        return url.database in (None, "", ":memory:")
+
+    @staticmethod
+    def is_read_only(url: URL) -> bool:
+        return url.query.get("mode") == "ro"
+
+    def engine_options(self, url: URL) -> dict:
+        options = {
+            "pool_pre_ping": True,
+            "pool_recycle": 3600,
+            "connect_args": {
+                "timeout": 30,  # Connection timeout in seconds for SQLite
+                # Pooled connections are handed to whichever thread checks them out
+                "check_same_thread": False,
+            },
+        }
+        if self.is_memory(url):
+            # Every connection to :memory: is a new empty database, so all
+            # threads share the single connection (one thread at a time)
+            options["poolclass"] = StaticPool
+        else:
+            options.update(get_pool_options())
+        return options
+
+    def configure(self, engine: Engine):
+        use_wal = not self.is_memory(engine.url) and not self.is_read_only(engine.url)
+
+        @event.listens_for(engine, "connect")
+        def set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            # Foreign keys, and their ON DELETE rules, are off unless enabled
+            # on each connection
+            cursor.execute("PRAGMA foreign_keys=ON")
+            if use_wal:
+                # Readers no longer block writers and see the last commit
+                cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.close()
+
+        timeout_ms = get_statement_timeout_ms()
+        if not timeout_ms or engine.dialect.is_async:
+            return
+
+        # SQLite has no statement timeout; abort from a progress handler instead
+        @event.listens_for(engine, "before_cursor_execute")
+        def set_deadline(conn, cursor, statement, parameters, context, executemany):
+            deadline = time.monotonic() + timeout_ms / 1000
+            conn.connection.driver_connection.set_progress_handler(
+                lambda: time.monotonic() > deadline, 10000
+            )
+
+        # The handler stays on the pooled connection until removed, where it
+        # would interrupt work that never set a deadline
+        @event.listens_for(engine, "after_cursor_execute")
+        def clear_deadline(conn, cursor, statement, parameters, context, executemany):
+            conn.connection.driver_connection.set_progress_handler(None, 0)
+
+        @event.listens_for(engine, "handle_error")
+        def clear_deadline_on_error(exception_context):
+            conn = exception_context.connection
+            if conn is not None and not exception_context.is_disconnect:
+                conn.connection.driver_connection.set_progress_handler(None, 0)
+
+    def read_url(self, url: URL) -> URL | None:
+        if self.is_memory(url):
+            return None
+        # Open the same file through a read-only SQLite URI
+        database = url.database
+        if not database.startswith("file:"):
+            database = f"file:{database}"
+        return url.set(
+            database=database, query={**url.query, "mode": "ro", "uri": "true"}
+        )
+
+    def async_engine_options(self, url: URL) -> dict:
+        options = {
+            "pool_pre_ping": True,
+            "pool_recycle": 3600,
+            "connect_args": {"timeout": 30},
+        }
+        if not self.is_memory(url):
+            options.update(get_pool_options())
+        return options
+
+    def create_version_triggers(self, conn, table_names: list[str]):
+        for table_name in table_names:
+            for operation in ("INSERT", "UPDATE", "DELETE"):
+                conn.execute(
+                    text(
+                        f"CREATE TRIGGER IF NOT EXISTS "
+                        f"{table_name}_version_{operation.lower()} "
+                        f"AFTER {operation} ON {table_name} "
+                        f"BEGIN "
+                        f"UPDATE table_version SET version = version + 1 "
+                        f"WHERE table_name = '{table_name}'; "
+                        f"END"
+                    )
+                )
+
+
+class PostgreSQLBackend(Backend):
+    async_driver = "asyncpg"
+    tracks_table_versions = True
+
+    def engine_options(self, url: URL) -> dict:
+        options = super().engine_options(url)
+        # libpq parameters, understood by psycopg2 and psycopg
+        connect_args = {"connect_timeout": get_connect_timeout()}
+        timeout_ms = get_statement_timeout_ms()
+        if timeout_ms:
+            connect_args["options"] = f"-c statement_timeout={timeout_ms}"
+        options["connect_args"] = connect_args
+        if url.get_driver_name() == "psycopg2":
+            # Batch executemany() UPDATEs and DELETEs as well as INSERTs
+            options["executemany_mode"] = "values_plus_batch"
+        return options
+
+    def async_engine_options(self, url: URL) -> dict:
+        options = super().async_engine_options(url)
+        connect_args = {"timeout": get_connect_timeout()}
+        timeout_ms = get_statement_timeout_ms()
+        if timeout_ms:
+            connect_args["server_settings"] = {"statement_timeout": str(timeout_ms)}
+        options["connect_args"] = connect_args
+        return options
+
+    def create_version_triggers(self, conn, table_names: list[str]):
+        conn.execute(
+            text(
+                "CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger "
+                "AS $$ BEGIN "
+                "UPDATE table_version SET version = version + 1 "
+                "WHERE table_name = TG_TABLE_NAME; "
+                "RETURN NULL; "
+                "END $$ LANGUAGE plpgsql"
+            )
+        )
+        for table_name in table_names:
+            # Once per statement, so bulk writes bump the version only once
+            # (CREATE OR REPLACE TRIGGER needs PostgreSQL 14)
+            conn.execute(
+                text(
+                    f"CREATE OR REPLACE TRIGGER {table_name}_version "
+                    f"AFTER INSERT OR UPDATE OR DELETE ON {table_name} "
+                    f"FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()"
+                )
+            )
+
+
+class MySQLBackend(Backend):
+    async_driver = "aiomysql"
+    tracks_table_versions = True
+
+    def timeout_command(self, timeout_ms: int) -> str:
+        return f"SET SESSION max_execution_time={timeout_ms}"
+
+    def engine_options(self, url: URL) -> dict:
+        options = super().engine_options(url)
+        connect_args = {"connect_timeout": get_connect_timeout()}
+        timeout_ms = get_statement_timeout_ms()
+        if timeout_ms:
+            connect_args["init_command"] = self.timeout_command(timeout_ms)
+        options["connect_args"] = connect_args
+        return options
+
+    def create_version_triggers(self, conn, table_names: list[str]):
+        # MySQL only has row triggers; IF NOT EXISTS needs MySQL 8.0.29
+        for table_name in table_names:
+            for operation in ("INSERT", "UPDATE", "DELETE"):
+                conn.execute(
+                    text(
+                        f"CREATE TRIGGER IF NOT EXISTS "
+                        f"{table_name}_version_{operation.lower()} "
+                        f"AFTER {operation} ON {table_name} FOR EACH ROW "
+                        f"UPDATE table_version SET version = version + 1 "
+                        f"WHERE table_name = '{table_name}'"
+                    )
+                )
+
+
+class MariaDBBackend(MySQLBackend):
+    def timeout_command(self, timeout_ms: int) -> str:
+        return f"SET SESSION max_statement_time={timeout_ms / 1000}"
+
+
+class MSSQLBackend(Backend):
+    tracks_table_versions = True
+
+    def engine_options(self, url: URL) -> dict:
+        options = super().engine_options(url)
+        if url.get_driver_name() == "pyodbc":
+            # Send executemany() parameter sets in a single round trip
+            options["fast_executemany"] = True
+            options["connect_args"] = {"timeout": get_connect_timeout()}
+        return options
+
+    def configure(self, engine: Engine):
+        timeout_ms = get_statement_timeout_ms()
+        if not timeout_ms or engine.dialect.driver != "pyodbc":
+            return
+
+        @event.listens_for(engine, "connect")
+        def set_query_timeout(dbapi_connection, connection_record):
+            # pyodbc only supports whole seconds
+            dbapi_connection.timeout = max(1, timeout_ms // 1000)
+
+    def create_version_triggers(self, conn, table_names: list[str]):
+        for table_name in table_names:
+            # NOCOUNT keeps the row counts of the triggering statement, which
+            # the version_id_col checks rely on
+            conn.execute(
+                text(
+                    f"CREATE OR ALTER TRIGGER {table_name}_version "
+                    f"ON {table_name} AFTER INSERT, UPDATE, DELETE AS BEGIN "
+                    f"SET NOCOUNT ON; "
+                    f"UPDATE table_version SET version = version + 1 "
+                    f"WHERE table_name = '{table_name}'; "
+                    f"END"
+                )
+            )
+
+
+# Backend name of the URL (e.g. "postgresql" for postgresql+psycopg2://)
+# to its settings. Register a Backend subclass here to support a new dialect.
+BACKENDS: dict[str, Backend] = {
+    "sqlite": SQLiteBackend(),
+    "postgresql": PostgreSQLBackend(),
+    "mysql": MySQLBackend(),
+    "mariadb": MariaDBBackend(),
+    "mssql": MSSQLBackend(),
+}
+
+
+def get_backend(url: URL) -> Backend:
+    """Get the settings for the dialect of the URL."""
+    return BACKENDS.get(url.get_backend_name(), Backend())
@@ -1,34 +1,85 @@
+import asyncio
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from contextlib import contextmanager
-from typing import Generator
+import threading
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import scoped_session, sessionmaker, Session
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Awaitable, Callable, Generator, Iterable
 from sqlalchemy.exc import OperationalError
 import time
 
+from database.backends import get_backend
+from database.profiling import SlowQueryLogger
+from database.unit_of_work import unit_of_work
+
 
 class DatabaseConnection:
     _instance = None
     _engine = None
     _Session = None
+    _async_engine = None
+    _AsyncSession = None
+    _scoped_session = None
+    _read_engine = None
+    _ReadSession = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_session_options() -> dict:
+        """Get the session settings, shared by the read and write sessions."""
+        # Objects keep their loaded state after commit, so repositories return
+        # them without another SELECT; set SESSION_EXPIRE_ON_COMMIT to reload
+        # them from the database after each commit instead
+        expire_on_commit = os.getenv("SESSION_EXPIRE_ON_COMMIT", "false")
+        return {"expire_on_commit": expire_on_commit.lower() in ("1", "true", "yes")}
+
+    @staticmethod
+    def _create_engine(database_url):
+        backend = get_backend(database_url)
+        engine = create_engine(database_url, **backend.engine_options(database_url))
+        backend.configure(engine)
+
+        # Opt-in slow-query log with query plans for diagnosing full scans
+        slow_query_log = os.getenv("SLOW_QUERY_LOG")
+        if slow_query_log:
+            SlowQueryLogger(
+                slow_query_log,
+                threshold_ms=float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "100")),
+            ).attach(engine)
+        return engine
 
     @classmethod
     def _initialize(cls):
-        if cls._Session is None:  # Only initialize if not already done
-            DATABASE_URL = os.getenv(
-                "DATABASE_URL",
-                "sqlite:///epicevents.db",
+        with cls._lock:
+            if cls._Session is not None:  # Only initialize if not already done
+                return
+            database_url = make_url(
+                os.getenv(
+                    "DATABASE_URL",
+                    "sqlite:///epicevents.db",
+                )
             )
-            # Add connection pool and timeout settings for SQLite
-            cls._engine = create_engine(
-                DATABASE_URL,
-                pool_pre_ping=True,  # Enable connection health checks
-                pool_recycle=3600,  # Recycle connections after 1 hour
-                connect_args={
-                    "timeout": 30,  # Connection timeout in seconds for SQLite
-                },
+            cls._engine = cls._create_engine(database_url)
+
+            # Reads go to a replica, or a read-only connection to the same file
+            read_url = os.getenv("DATABASE_READ_URL")
+            read_url = (
+                make_url(read_url)
+                if read_url
+                else get_backend(database_url).read_url(database_url)
+            )
+            cls._read_engine = cls._create_engine(read_url) if read_url else cls._engine
+            session_options = cls.get_session_options()
+            cls._ReadSession = sessionmaker(
+                bind=cls._read_engine, autoflush=False, **session_options
+            )
+
+            # Set last: other threads treat _Session as the "initialized" flag
+            cls._scoped_session = scoped_session(
+                sessionmaker(bind=cls._engine, **session_options)
             )
-            cls._Session = sessionmaker(bind=cls._engine)
+            cls._Session = cls._scoped_session.session_factory
 
     @classmethod
     @contextmanager
@@ -41,9 +92,163 @@ class DatabaseConnection:
         finally:
             session.close()
 
+    @classmethod
+    @contextmanager
+    def unit_of_work(cls) -> Generator[Session, None, None]:
+        """Get a session whose repository writes are committed once, on exit.
+
+        See database.unit_of_work.unit_of_work for the semantics.
+        """
+        with cls.get_session() as session, unit_of_work(session):
+            yield session
+
+    @classmethod
+    @contextmanager
+    def get_read_session(cls) -> Generator[Session, None, None]:
+        """Get a session for list and report queries.
+
+        The session reads from DATABASE_READ_URL when set, otherwise from a
+        read-only connection to the SQLite file, so long reads do not hold
+        up writes. It cannot be used to write.
+        """
+        if cls._Session is None:
+            cls._initialize()
+        session = cls._ReadSession()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    @classmethod
+    def get_scoped_session(cls) -> scoped_session:
+        """Get the thread-local session registry for multi-threaded use.
+
+        Calling the registry returns the session of the current thread,
+        creating it on first use. Worker threads must call `remove()` on the
+        registry when their work is done to close their session.
+        """
+        if cls._Session is None:
+            cls._initialize()
+        return cls._scoped_session
+
     @classmethod
     def get_engine(cls):
         """Get the database engine, initializing it if necessary."""
         if cls._engine is None:
             cls._initialize()
         return cls._engine
+
+    @classmethod
+    def get_read_engine(cls):
+        """Get the engine used by read sessions, initializing it if necessary."""
+        if cls._Session is None:
+            cls._initialize()
+        return cls._read_engine
+
+    @classmethod
+    def get_engines(cls) -> list:
+        """Get the distinct engines in use, for attaching event listeners."""
+        engine = cls.get_engine()
+        read_engine = cls.get_read_engine()
+        return [engine] if read_engine is engine else [engine, read_engine]
+
+    @classmethod
+    def _initialize_async(cls):
+        if cls._AsyncSession is None:
+            database_url = make_url(
+                os.getenv("DATABASE_URL", "sqlite:///epicevents.db")
+            )
+            # Same database through the asyncio driver
+            backend = get_backend(database_url)
+            cls._async_engine = create_async_engine(
+                backend.async_url(database_url),
+                **backend.async_engine_options(database_url),
+            )
+            backend.configure(cls._async_engine.sync_engine)
+            # Objects stay usable after commit without implicit (blocking) refresh
+            cls._AsyncSession = async_sessionmaker(
+                bind=cls._async_engine, expire_on_commit=False
+            )
+
+    @classmethod
+    @asynccontextmanager
+    async def get_async_session(cls) -> AsyncGenerator[AsyncSession, None]:
+        if cls._AsyncSession is None:
+            cls._initialize_async()
+        async with cls._AsyncSession() as session:
+            yield session
+
+    @classmethod
+    def get_async_engine(cls):
+        """Get the asyncio database engine, initializing it if necessary."""
+        if cls._async_engine is None:
+            cls._initialize_async()
+        return cls._async_engine
+
+    @classmethod
+    async def gather_in_sessions(
+        cls,
+        func: Callable[[AsyncSession, object], Awaitable],
+        items: Iterable,
+        concurrency: int = 10,
+    ) -> list:
+        """Run `func(session, item)` for every item concurrently.
+
+        Each call gets its own session, since a session cannot run several
+        statements at once. At most `concurrency` calls run at the same time.
+        Results are returned in the order of the items.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(item):
+            async with semaphore:
+                async with cls.get_async_session() as session:
+                    return await func(session, item)
+
+        return await asyncio.gather(*(run(item) for item in items))
+
+    @classmethod
+    def dispose(cls):
+        """Close all pooled connections and forget the engine.
+
+        The next session or engine request reads DATABASE_URL again.
+        """
+        if cls._scoped_session is not None:
+            cls._scoped_session.remove()
+        if cls._read_engine is not None and cls._read_engine is not cls._engine:
+            cls._read_engine.dispose()
+        if cls._engine is not None:
+            cls._engine.dispose()
+        cls._engine = None
+        cls._read_engine = None
+        cls._ReadSession = None
+        cls._Session = None
+        cls._scoped_session = None
+        # Async connections can only be closed from the event loop, see dispose_async
+        cls._async_engine = None
+        cls._AsyncSession = None
+
+    @classmethod
+    async def dispose_async(cls):
+        """Close all pooled asyncio connections and forget the async engine."""
+        if cls._async_engine is not None:
+            await cls._async_engine.dispose()
+        cls._async_engine = None
+        cls._AsyncSession = None
+
+    @classmethod
+    def get_table_versions(cls) -> dict[str, int]:
+        """Get the change counter of every tracked table in a single query.
+
+        The counters are bumped by triggers that init_db installs; databases
+        without them raise NotImplementedError rather than report tables
+        that never change.
+        """
+        engine = cls.get_engine()
+        if not get_backend(engine.url).tracks_table_versions:
+            raise NotImplementedError(
+                f"Table versions are not tracked on {engine.dialect.name}"
+            )
+        with engine.connect() as conn:
+            rows = conn.execute(text("SELECT table_name, version FROM table_version"))
+            return {table_name: version for table_name, version in rows}
@@ -0,0 +1,173 @@
+import heapq
+import itertools
+import logging
+import time
+from contextlib import contextmanager
+from logging.handlers import RotatingFileHandler
+from typing import Generator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class StatementTimer:
+    """Time the SQL statements run on an engine and pass them to `record`."""
+
+    def __init__(self):
+        # Each timer keeps its own start times so several can share an engine
+        self._info_key = f"statement_start_time_{id(self)}"
+
+    def record(self, conn, statement, parameters, duration):
+        raise NotImplementedError
+
+    def _before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        conn.info.setdefault(self._info_key, []).append(time.perf_counter())
+
+    def _after_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        duration = time.perf_counter() - conn.info[self._info_key].pop()
+        self.record(conn, statement, parameters, duration)
+
+    def attach(self, engine: Engine):
+        """Start timing the statements run on the engine."""
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def detach(self, engine: Engine):
+        """Stop timing the statements run on the engine."""
+        event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+
+
+class QueryProfiler(StatementTimer):
+    """Record the count and duration of the SQL statements run on an engine."""
+
+    def __init__(self, slowest: int = 5):
+        super().__init__()
+        self.slowest_limit = slowest
+        self.count = 0
+        self.total_time = 0.0
+        self._slowest = []  # Min-heap of (duration, sequence, statement, params)
+        self._sequence = itertools.count()
+
+    def reset(self):
+        """Forget all recorded statements."""
+        self.count = 0
+        self.total_time = 0.0
+        self._slowest = []
+
+    def record(self, conn, statement, parameters, duration):
+        self.count += 1
+        self.total_time += duration
+        entry = (duration, next(self._sequence), statement, parameters)
+        if len(self._slowest) < self.slowest_limit:
+            heapq.heappush(self._slowest, entry)
+        elif self.slowest_limit:
+            heapq.heappushpop(self._slowest, entry)
+
+    @property
+    def slowest(self) -> list[tuple[float, str, object]]:
+        """Slowest statements as (duration, statement, parameters), slowest first."""
+        return [
+            (duration, statement, parameters)
+            for duration, _, statement, parameters in sorted(
+                self._slowest, reverse=True
+            )
+        ]
+
+    def report(self) -> str:
+        """Format the recorded statistics for display."""
+        lines = [
+            f"SQL statements: {self.count}",
+            f"SQL total time: {self.total_time * 1000:.3f} ms",
+        ]
+        if self._slowest:
+            lines.append("Slowest statements:")
+            for duration, statement, parameters in self.slowest:
+                statement = " ".join(statement.split())
+                lines.append(f"  {duration * 1000:9.3f} ms  {statement}")
+                if parameters:
+                    lines.append(f"{'':15}params: {parameters}")
+        return "\n".join(lines)
+
+
+class SlowQueryLogger(StatementTimer):
+    """Log statements slower than a threshold with their SQLite query plan.
+
+    Records go to a rotating file so the log can stay enabled in production.
+    """
+
+    EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+    def __init__(
+        self,
+        path: str,
+        threshold_ms: float = 100,
+        max_bytes: int = 5 * 1024 * 1024,
+        backup_count: int = 3,
+    ):
+        super().__init__()
+        self.threshold = threshold_ms / 1000
+        self.logger = logging.getLogger(f"epicevents.slow_query.{id(self)}")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        handler = RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        self.logger.addHandler(handler)
+
+    def record(self, conn, statement, parameters, duration):
+        if duration < self.threshold:
+            return
+        lines = [
+            f"slow query: {duration * 1000:.3f} ms",
+            f"  statement: {' '.join(statement.split())}",
+            f"  params: {parameters}",
+        ]
+        plan = self.explain(conn, statement, parameters)
+        if plan:
+            lines.append("  query plan:")
+            lines.extend(f"    {detail}" for detail in plan)
+        self.logger.info("\n".join(lines))
+
+    def explain(self, conn, statement, parameters) -> list[str]:
+        """Get the EXPLAIN QUERY PLAN details of a statement, if available."""
+        if conn.dialect.name != "sqlite":
+            return []
+        if not statement.lstrip().upper().startswith(self.EXPLAINABLE):
+            return []
+        # executemany passes a list of parameter sets; explain the first one
+        if isinstance(parameters, list):
+            parameters = parameters[0] if parameters else ()
+        # Use the raw DBAPI cursor so the EXPLAIN is not timed itself
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            return [row[-1] for row in cursor.fetchall()]
+        except Exception as e:
+            return [f"unavailable: {e}"]
+        finally:
+            cursor.close()
+
+    def close(self):
+        """Close the log file."""
+        for handler in self.logger.handlers[:]:
+            handler.close()
+            self.logger.removeHandler(handler)
+
+
+@contextmanager
+def profile_queries(
+    engine: Engine, slowest: int = 5
+) -> Generator[QueryProfiler, None, None]:
+    """Record the statements run on the engine inside the block."""
+    profiler = QueryProfiler(slowest=slowest)
+    profiler.attach(engine)
+    try:
+        yield profiler
+    finally:
+        profiler.detach(engine)
@@ -0,0 +1,56 @@
+from contextlib import contextmanager
+from typing import Generator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# session.info key marking a session whose caller commits once at the end
+UNIT_OF_WORK = "unit_of_work"
+
+
+def in_unit_of_work(session: Session | AsyncSession) -> bool:
+    """Check whether the session is inside a unit of work."""
+    return session.info.get(UNIT_OF_WORK) is True
+
+
+def commit(session: Session):
+    """Commit the session, or only flush it inside a unit of work.
+
+    Repositories call this after each write so that they commit on their
+    own by default, but join the caller's transaction in a unit of work.
+    """
+    if in_unit_of_work(session):
+        session.flush()
+    else:
+        session.commit()
+
+
+async def commit_async(session: AsyncSession):
+    """Commit an asyncio session, or only flush it inside a unit of work."""
+    if in_unit_of_work(session):
+        await session.flush()
+    else:
+        await session.commit()
+
+
+@contextmanager
+def unit_of_work(session: Session) -> Generator[Session, None, None]:
+    """Run the repository writes of the block in a single transaction.
+
+    The repositories only flush, and the transaction is committed once when
+    the block exits, or rolled back if it raises. Nested units of work join
+    the outermost one.
+    """
+    if in_unit_of_work(session):
+        yield session
+        return
+
+    session.info[UNIT_OF_WORK] = True
+    try:
+        yield session
+        session.commit()
+    except BaseException:
+        session.rollback()
+        raise
+    finally:
+        session.info.pop(UNIT_OF_WORK, None)
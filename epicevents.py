@@ -1,17 +1,107 @@
+import cProfile
+import io
+import pstats
+
 import click
 
 from auth import login, logout
+from commands.audit_commands import audit
 from commands.client_commands import client
 from commands.contract_commands import contract
 from commands.employee_commands import employee
 from commands.event_commands import event
+from database.connection import DatabaseConnection
+from database.profiling import QueryProfiler
 from logging_config import init_sentry
+from metrics import CommandMetrics, write_metrics
+
+
+class CliGroup(click.Group):
+    """Root group keeping the raw command line to name metrics after it."""
+
+    def invoke(self, ctx):
+        ctx.meta["command_args"] = [*ctx.protected_args, *ctx.args]
+        return super().invoke(ctx)
 
 
-@click.group()
-def cli():
+def command_name(ctx):
+    """Full name of the invoked command, e.g. "contract list"."""
+    args = ctx.meta.get("command_args", [])
+    if not args:
+        return "cli"
+    command = cli.get_command(ctx, args[0])
+    if isinstance(command, click.Group) and len(args) > 1:
+        return f"{args[0]} {args[1]}"
+    return args[0]
+
+
+@click.group(cls=CliGroup)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Report SQL statement count, total time and slowest statements",
+)
+@click.option(
+    "--profile-python",
+    is_flag=True,
+    envvar="EPICEVENTS_PROFILE",
+    help="Profile the Python execution of the command and print the hottest calls",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False, writable=True),
+    envvar="EPICEVENTS_PROFILE_OUTPUT",
+    help="Write the raw cProfile stats to this file (for snakeviz or flameprof)",
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False, writable=True),
+    envvar="METRICS_FILE",
+    help="Record command latency, DB time, rows and errors to this Prometheus textfile",
+)
+@click.pass_context
+def cli(ctx, profile, profile_python, profile_output, metrics_file):
     """EpicEvents CRM CLI application."""
-    pass
+    if metrics_file:
+        metrics_engines = DatabaseConnection.get_engines()
+        command_metrics = CommandMetrics(command_name(ctx))
+
+        def report_metrics():
+            command_metrics.stop(*metrics_engines)
+            write_metrics(metrics_file, command_metrics)
+
+        ctx.call_on_close(report_metrics)
+        command_metrics.start(*metrics_engines)
+
+    if profile_python or profile_output:
+        python_profiler = cProfile.Profile()
+
+        def report_python():
+            python_profiler.disable()
+            if profile_output:
+                python_profiler.dump_stats(profile_output)
+                click.echo(f"Python profile written to {profile_output}", err=True)
+            if profile_python:
+                stream = io.StringIO()
+                stats = pstats.Stats(python_profiler, stream=stream)
+                stats.sort_stats("cumulative").print_stats(30)
+                click.echo(stream.getvalue(), err=True)
+
+        ctx.call_on_close(report_python)
+        python_profiler.enable()
+
+    if profile:
+        engines = DatabaseConnection.get_engines()
+        profiler = QueryProfiler()
+        for engine in engines:
+            profiler.attach(engine)
+
+        def report():
+            for engine in engines:
+                profiler.detach(engine)
+            click.echo(profiler.report(), err=True)
+
+        ctx.call_on_close(report)
 
 
 # Authentication commands
@@ -30,6 +120,9 @@ cli.add_command(client)
 # Event management commands (for commercial and management users)
 cli.add_command(event)
 
+# Audit log commands (only for management users)
+cli.add_command(audit)
+
 
 if __name__ == "__main__":
     init_sentry()
@@ -1,9 +1,21 @@
+import atexit
+import json
 import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
 
 import sentry_sdk
 from dotenv import load_dotenv
 from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
 
+from metrics import record_error
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 load_dotenv()
 
 
@@ -15,8 +27,8 @@ def init_sentry():
             SqlalchemyIntegration(),
         ],
         # Set traces_sample_rate to 1.0 to capture 100% of transactions for performance monitoring.
-        # We recommend adjusting this value in production.
-        traces_sample_rate=1.0,
+        # We recommend lowering this value in production with SENTRY_TRACES_SAMPLE_RATE.
+        traces_sample_rate=float(os.getenv("SENTRY_TRACES_SAMPLE_RATE", "1.0")),
         # By default the SDK will try to use the SENTRY_RELEASE
         # environment variable, or infer a git commit
         # SHA as release, however you may want to set
@@ -25,11 +37,137 @@ def init_sentry():
     )
 
 
+class AuditSpool:
+    """Local spool of audit messages delivered to Sentry in the background.
+
+    Commands only append a line to the spool file; a background thread ships
+    the spooled messages in batches, and whatever is left at exit is flushed
+    within a bounded timeout or kept for the next run.
+    """
+
+    def __init__(self, path, batch_size=50, flush_interval=5.0):
+        self.path = Path(path)
+        self.lock_path = Path(f"{path}.lock")
+        self.delivery_lock_path = Path(f"{path}.delivery.lock")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending = 0
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+
+    @contextmanager
+    def _locked(self, lock_path):
+        with open(lock_path, "a") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def put(self, message, level="info", extras=None):
+        """Spool a message for delivery."""
+        line = json.dumps({"message": message, "level": level, "extras": extras or {}})
+        with self._locked(self.lock_path):
+            with open(self.path, "a", encoding="utf-8") as spool_file:
+                spool_file.write(line + "\n")
+        self._pending += 1
+        if self._thread is None:
+            self.start()
+        if self._pending >= self.batch_size:
+            self._wakeup.set()
+
+    def deliver(self):
+        """Send the spooled messages to Sentry, then remove them from the spool.
+
+        Messages are only removed once Sentry has flushed them, so a process
+        stopped mid-delivery leaves them for the next run. Deliveries run one
+        at a time, and messages can be spooled meanwhile.
+        """
+        with self._locked(self.delivery_lock_path):
+            with self._locked(self.lock_path):
+                if not self.path.exists():
+                    return 0
+                lines = self.path.read_text(encoding="utf-8").splitlines()
+            for line in lines:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Partially written line from a crashed process
+                sentry_sdk.capture_message(
+                    event["message"], level=event["level"], extras=event["extras"]
+                )
+            sentry_sdk.flush()
+            with self._locked(self.lock_path):
+                # Keep the messages spooled during the delivery
+                remaining = self.path.read_text(encoding="utf-8").splitlines()
+                remaining = remaining[len(lines) :]
+                if remaining:
+                    self.path.write_text("\n".join(remaining) + "\n", encoding="utf-8")
+                else:
+                    self.path.unlink()
+        self._pending = 0
+        return len(lines)
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.deliver()
+        self.deliver()
+
+    def start(self):
+        """Start the background delivery thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="audit-spool", daemon=True
+        )
+        self._thread.start()
+
+    def close(self, timeout=2.0):
+        """Deliver the remaining messages, waiting at most `timeout` seconds.
+
+        Messages that could not be delivered in time stay in the spool file.
+        """
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+
+_audit_spool = None
+
+
+def get_audit_spool():
+    """Get the process-wide audit spool, creating it on first use."""
+    global _audit_spool
+    if _audit_spool is None:
+        _audit_spool = AuditSpool(
+            os.getenv(
+                "AUDIT_SPOOL_FILE", str(Path.cwd() / ".epicevents_audit_spool.jsonl")
+            )
+        )
+        atexit.register(
+            _audit_spool.close,
+            timeout=float(os.getenv("AUDIT_FLUSH_TIMEOUT", "2.0")),
+        )
+    return _audit_spool
+
+
+def spool_audit_message(message, extras):
+    """Spool an audit message, unless Sentry has nowhere to send it."""
+    if sentry_sdk.get_client().transport is None:
+        return
+    get_audit_spool().put(message, level="info", extras=extras)
+
+
 def log_employee_change(action, employee_data):
-    sentry_sdk.capture_message(
+    spool_audit_message(
         f"Employee {action}: {employee_data.get('full_name', 'Unknown')}",
-        level="info",
-        extras={
+        {
             "employee_number": employee_data.get("employee_number"),
             "department": employee_data.get("department"),
             "action": action,
@@ -39,10 +177,9 @@ def log_employee_change(action, employee_data):
 
 def log_contract_signature(contract_data):
     """Log contract signature."""
-    sentry_sdk.capture_message(
+    spool_audit_message(
         f"Contract signed: Contract ID {contract_data.get('id')}",
-        level="info",
-        extras={
+        {
             "contract_id": contract_data.get("id"),
             "client_id": contract_data.get("client_id"),
             "total_amount": contract_data.get("total_amount"),
@@ -52,4 +189,5 @@ def log_contract_signature(contract_data):
 
 def log_exception(exception, context=None):
     """Log unexpected exceptions."""
+    record_error()
     sentry_sdk.capture_exception(exception, extras=context or {})
@@ -0,0 +1,242 @@
+"""
+Local metrics for EpicEvents CRM
+Records per-command latency, database time, row counts and errors into
+histograms kept in a local file, rendered in the Prometheus textfile format.
+Nothing is sent over the network.
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from database.profiling import StatementTimer
+from models.models import Base
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Upper bounds of the histogram buckets, +Inf is implicit
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+ROWS_BUCKETS = (0, 1, 10, 100, 1000, 10000, 100000, 1000000)
+
+HISTOGRAMS = {
+    "duration": (
+        "epicevents_command_duration_seconds",
+        "Command latency in seconds",
+        SECONDS_BUCKETS,
+    ),
+    "db_time": (
+        "epicevents_command_db_seconds",
+        "Time spent executing SQL statements per command in seconds",
+        SECONDS_BUCKETS,
+    ),
+    "rows": (
+        "epicevents_command_rows",
+        "Rows loaded or modified per command",
+        ROWS_BUCKETS,
+    ),
+}
+
+# Collector of the command currently running, if metrics are enabled
+_current = None
+
+
+class CommandMetrics(StatementTimer):
+    """Collect the metrics of a single command execution."""
+
+    def __init__(self, command: str):
+        super().__init__()
+        self.command = command
+        self.duration = 0.0
+        self.db_time = 0.0
+        self.rows = 0
+        self.errors = 0
+        self._start = None
+
+    def record(self, conn, statement, parameters, duration):
+        self.db_time += duration
+
+    def _after_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        super()._after_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        )
+        # SQLite only reports a row count for INSERT, UPDATE and DELETE
+        if cursor.rowcount > 0:
+            self.rows += cursor.rowcount
+
+    def _on_load(self, target, context):
+        self.rows += 1
+
+    def start(self, *engines):
+        global _current
+        _current = self
+        for engine in engines:
+            self.attach(engine)
+        event.listen(Base, "load", self._on_load, propagate=True)
+        self._start = time.perf_counter()
+
+    def stop(self, *engines):
+        global _current
+        self.duration = time.perf_counter() - self._start
+        event.remove(Base, "load", self._on_load)
+        for engine in engines:
+            self.detach(engine)
+        _current = None
+
+
+def record_error():
+    """Count an error for the command currently running."""
+    if _current is not None:
+        _current.errors += 1
+
+
+def new_histogram(buckets):
+    return {"buckets": [0] * (len(buckets) + 1), "sum": 0.0, "count": 0}
+
+
+def observe(histogram, buckets, value):
+    """Add a value to a histogram (bucket counts are not cumulative)."""
+    index = next(
+        (i for i, bound in enumerate(buckets) if value <= bound), len(buckets)
+    )
+    histogram["buckets"][index] += 1
+    histogram["sum"] += value
+    histogram["count"] += 1
+
+
+def estimate_quantile(histogram, buckets, quantile):
+    """Estimate a quantile by linear interpolation inside its bucket."""
+    if not histogram["count"]:
+        return None
+    rank = quantile * histogram["count"]
+    seen = 0
+    lower = 0.0
+    for count, upper in zip(histogram["buckets"], buckets + (float("inf"),)):
+        if count and seen + count >= rank:
+            if upper == float("inf"):
+                return lower
+            return lower + (upper - lower) * (rank - seen) / count
+        seen += count
+        lower = upper
+    return lower
+
+
+def update_state(state, metrics: CommandMetrics):
+    """Add the metrics of one command execution to the accumulated state."""
+    command = state.setdefault("commands", {}).setdefault(
+        metrics.command,
+        {
+            **{name: new_histogram(h[2]) for name, h in HISTOGRAMS.items()},
+            "errors": 0,
+        },
+    )
+    for name, (_, _, buckets) in HISTOGRAMS.items():
+        observe(command[name], buckets, getattr(metrics, name))
+    command["errors"] += metrics.errors
+    return state
+
+
+def format_bound(bound):
+    return "+Inf" if bound == float("inf") else f"{bound:g}"
+
+
+def render_prometheus(state) -> str:
+    """Render the accumulated state in the Prometheus text exposition format."""
+    commands = state.get("commands", {})
+    lines = []
+    for name, (metric, description, buckets) in HISTOGRAMS.items():
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} histogram")
+        for command, values in sorted(commands.items()):
+            histogram = values[name]
+            cumulative = 0
+            for count, bound in zip(histogram["buckets"], buckets + (float("inf"),)):
+                cumulative += count
+                lines.append(
+                    f'{metric}_bucket{{command="{command}",'
+                    f'le="{format_bound(bound)}"}} {cumulative}'
+                )
+            lines.append(f'{metric}_sum{{command="{command}"}} {histogram["sum"]}')
+            lines.append(f'{metric}_count{{command="{command}"}} {histogram["count"]}')
+    lines.append("# HELP epicevents_command_errors_total Unexpected command errors")
+    lines.append("# TYPE epicevents_command_errors_total counter")
+    for command, values in sorted(commands.items()):
+        lines.append(
+            f'epicevents_command_errors_total{{command="{command}"}} '
+            f'{values["errors"]}'
+        )
+    return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def _locked(lock_path):
+    with open(lock_path, "a") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _replace(path, content):
+    """Write a file atomically so collectors never read a partial file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as tmp_file:
+        tmp_file.write(content)
+    os.replace(tmp_path, path)
+
+
+def write_metrics(path, metrics: CommandMetrics):
+    """Merge one command execution into the metrics file.
+
+    Histograms are accumulated in a JSON state file next to the Prometheus
+    textfile, since every CLI invocation is a separate process.
+    """
+    state_path = f"{path}.json"
+    with _locked(f"{path}.lock"):
+        try:
+            with open(state_path, encoding="utf-8") as state_file:
+                state = json.load(state_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            state = {}
+        update_state(state, metrics)
+        _replace(state_path, json.dumps(state))
+        _replace(path, render_prometheus(state))
+
+
+def summary(path) -> str:
+    """Summarize p50/p99 latency and error counts per command."""
+    with open(f"{path}.json", encoding="utf-8") as state_file:
+        state = json.load(state_file)
+    lines = [
+        f"{'command':<30} {'count':>8} {'p50 ms':>10} {'p99 ms':>10} "
+        f"{'db p50 ms':>10} {'errors':>7}"
+    ]
+    for command, values in sorted(state.get("commands", {}).items()):
+        duration = values["duration"]
+        p50 = estimate_quantile(duration, SECONDS_BUCKETS, 0.5)
+        p99 = estimate_quantile(duration, SECONDS_BUCKETS, 0.99)
+        db_p50 = estimate_quantile(values["db_time"], SECONDS_BUCKETS, 0.5)
+        lines.append(
+            f"{command:<30} {duration['count']:>8} {p50 * 1000:>10.1f} "
+            f"{p99 * 1000:>10.1f} {db_p50 * 1000:>10.1f} {values['errors']:>7}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    try:
+        print(summary(sys.argv[1] if len(sys.argv) > 1 else os.environ["METRICS_FILE"]))
+    except (KeyError, FileNotFoundError):
+        print("Usage: python -m metrics <metrics file> (or set METRICS_FILE)")
+        exit(1)
@@ -1,3 +1,23 @@
-from .models import Base, Employee, Client, Contract, Event, Department
+from .models import (
+    Base,
+    Employee,
+    Client,
+    Contract,
+    Event,
+    Department,
+    TableVersion,
+    AuditAction,
+    AuditLog,
+)
 
-__all__ = ["Base", "Employee", "Client", "Contract", "Event", "Department"]
+__all__ = [
+    "Base",
+    "Employee",
+    "Client",
+    "Contract",
+    "Event",
+    "Department",
+    "TableVersion",
+    "AuditAction",
+    "AuditLog",
+]
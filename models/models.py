@@ -1,19 +1,134 @@
-from datetime import datetime, UTC
+import os
+from datetime import datetime, timedelta, UTC
+from decimal import ROUND_HALF_UP, Decimal
 from sqlalchemy import (
+    BigInteger,
     Column,
     Integer,
     String,
-    DateTime,
     Boolean,
     ForeignKey,
-    Numeric,
     Enum,
+    Index,
+    JSON,
+    TypeDecorator,
 )
+from sqlalchemy.ext.hybrid import Comparator, hybrid_property
 from sqlalchemy.orm import relationship, declarative_base
 import enum
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import (
+    DEFAULT_PBKDF2_ITERATIONS,
+    check_password_hash,
+    generate_password_hash,
+)
 
 Base = declarative_base()
+# Fetch server-generated column values in the INSERT/UPDATE itself (RETURNING)
+# rather than with a SELECT when they are first accessed
+Base.__mapper_args__ = {"eager_defaults": True}
+
+# Werkzeug's default policy, spelled out so stored hashes can be compared to it
+DEFAULT_PASSWORD_HASH_METHOD = "scrypt:32768:8:1"
+
+
+def get_password_hash_method() -> str:
+    """Get the password hashing policy, e.g. "pbkdf2:sha256:600000".
+
+    Short forms such as "pbkdf2" or "scrypt" are expanded to the algorithm
+    and cost parameters werkzeug records in front of every hash.
+    """
+    return expand_password_hash_method(
+        os.getenv("PASSWORD_HASH_METHOD", DEFAULT_PASSWORD_HASH_METHOD)
+    )
+
+
+def expand_password_hash_method(method: str) -> str:
+    """Fill in werkzeug's default cost parameters of a short hash method.
+
+    Werkzeug records "pbkdf2" as "pbkdf2:sha256:<default iterations>" and
+    "scrypt" as "scrypt:32768:8:1"; complete methods are returned as is.
+    """
+    algorithm, *args = method.split(":")
+    if algorithm == "scrypt" and not args:
+        return DEFAULT_PASSWORD_HASH_METHOD
+    if algorithm == "pbkdf2" and len(args) < 2:
+        hash_name = args[0] if args else "sha256"
+        return f"pbkdf2:{hash_name}:{DEFAULT_PBKDF2_ITERATIONS}"
+    return method
+
+
+def to_cents(amount) -> int:
+    """Convert an amount to integer cents, rounding half up."""
+    return int((Decimal(str(amount)) * 100).quantize(Decimal(1), ROUND_HALF_UP))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Convert integer cents to a Decimal amount with two decimal places."""
+    return Decimal(cents).scaleb(-2)
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+class UTCDateTime(TypeDecorator):
+    """Datetime stored as integer microseconds since the Unix epoch, in UTC.
+
+    Values are read back as timezone-aware UTC datetimes. Aware values are
+    converted to UTC when stored; naive ones are taken to be in UTC already,
+    as the former DateTime columns stored them. Range filters compare plain
+    integers, which index well on every backend.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: datetime | None, dialect) -> int | None:
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return (value - EPOCH) // timedelta(microseconds=1)
+
+    def process_result_value(self, value: int | None, dialect) -> datetime | None:
+        if value is None:
+            return None
+        return EPOCH + timedelta(microseconds=value)
+
+
+class CentsComparator(Comparator):
+    """Compare a cents column with amounts, converting the amounts to cents."""
+
+    def operate(self, op, *other, **kwargs):
+        other = [
+            to_cents(value) if isinstance(value, (Decimal, int, float)) else value
+            for value in other
+        ]
+        return op(self.__clause_element__(), *other, **kwargs)
+
+    def _bulk_update_tuples(self, value):
+        # update(Contract).values(total_amount=...) sets the cents column
+        return [(self.__clause_element__(), to_cents(value))]
+
+
+def money(cents_attribute: str) -> hybrid_property:
+    """Get a Decimal accessor for an integer cents column.
+
+    Instances read and write Decimal amounts; queries compare the cents
+    column itself, so filters stay exact and can use its indexes, e.g.
+    Contract.remaining_amount > 0 becomes remaining_amount_cents > 0.
+    """
+
+    def fget(self) -> Decimal | None:
+        cents = getattr(self, cents_attribute)
+        return None if cents is None else from_cents(cents)
+
+    def fset(self, amount):
+        setattr(self, cents_attribute, None if amount is None else to_cents(amount))
+
+    def comparator(cls):
+        return CentsComparator(getattr(cls, cents_attribute))
+
+    return hybrid_property(fget, fset, custom_comparator=comparator)
 
 
 class Department(enum.Enum):
@@ -36,15 +151,21 @@ class Employee(Base):
     )  # Renamed to indicate it's hashed
     department = Column(Enum(Department), nullable=False)
     role = Column(String, nullable=False)  # Specific role within department
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    created_at = Column(UTCDateTime, default=lambda: datetime.now(UTC))
     updated_at = Column(
-        DateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC)
+        UTCDateTime,
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
     )
 
     # Relationships
-    clients = relationship("Client", back_populates="commercial")
-    contracts = relationship("Contract", back_populates="commercial")
-    events = relationship("Event", back_populates="support")
+    # The database nulls the references of deleted employees (ON DELETE SET
+    # NULL), so deleting one does not load their clients, contracts and events
+    clients = relationship("Client", back_populates="commercial", passive_deletes=True)
+    contracts = relationship(
+        "Contract", back_populates="commercial", passive_deletes=True
+    )
+    events = relationship("Event", back_populates="support", passive_deletes=True)
 
     @property
     def password(self):
@@ -52,7 +173,18 @@ class Employee(Base):
 
     @password.setter
     def password(self, password):
-        self._password_hash = generate_password_hash(password)
+        self._password_hash = generate_password_hash(
+            password, method=get_password_hash_method()
+        )
+
+    @property
+    def password_hash_method(self):
+        """Method and cost parameters the stored hash was generated with."""
+        return self._password_hash.split("$", 1)[0]
+
+    def password_needs_rehash(self):
+        """Check if the stored hash was generated with an outdated policy."""
+        return self.password_hash_method != get_password_hash_method()
 
     def verify_password(self, password):
         return check_password_hash(self._password_hash, password)
@@ -72,47 +204,142 @@ class Client(Base):
     email = Column(String, unique=True, nullable=False)
     phone = Column(String)
     company_name = Column(String)
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    created_at = Column(UTCDateTime, default=lambda: datetime.now(UTC))
     updated_at = Column(
-        DateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC)
+        UTCDateTime,
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
     )
-    commercial_id = Column(Integer, ForeignKey("employee.id"))
+    commercial_id = Column(
+        Integer, ForeignKey("employee.id", ondelete="SET NULL"), index=True
+    )
+
+    # Bumped on every write; an UPDATE or DELETE of a row changed since it
+    # was loaded matches nothing and raises StaleDataError
+    version = Column(Integer, nullable=False, server_default="1")
+
+    __mapper_args__ = {**Base.__mapper_args__, "version_id_col": version}
 
     # Relationships
     commercial = relationship("Employee", back_populates="clients")
-    contracts = relationship("Contract", back_populates="client")
+    contracts = relationship("Contract", back_populates="client", passive_deletes=True)
 
 
 class Contract(Base):
     __tablename__ = "contract"
 
     id = Column(Integer, primary_key=True)
-    client_id = Column(Integer, ForeignKey("client.id"))
-    commercial_id = Column(Integer, ForeignKey("employee.id"))
-    total_amount = Column(Numeric(10, 2), nullable=False)
-    remaining_amount = Column(Numeric(10, 2), nullable=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    client_id = Column(
+        Integer, ForeignKey("client.id", ondelete="SET NULL"), index=True
+    )
+    commercial_id = Column(
+        Integer, ForeignKey("employee.id", ondelete="SET NULL"), index=True
+    )
+    # Money is stored as integer cents: exact, and summed without conversion
+    total_amount_cents = Column(BigInteger, nullable=False)
+    remaining_amount_cents = Column(BigInteger, nullable=False)
+    total_amount = money("total_amount_cents")
+    remaining_amount = money("remaining_amount_cents")
+    created_at = Column(UTCDateTime, default=lambda: datetime.now(UTC))
     is_signed = Column(Boolean, default=False)
+    # Maintained by EventRepository on every event write, so contracts can be
+    # filtered on their events without joining the event table
+    event_count = Column(Integer, nullable=False, default=0, server_default="0")
+    next_event_date = Column(UTCDateTime, index=True)  # Earliest upcoming start_date
+    version = Column(Integer, nullable=False, server_default="1")  # See Client
+
+    __table_args__ = (
+        Index("ix_contract_is_signed_event_count", "is_signed", "event_count"),
+    )
+    __mapper_args__ = {**Base.__mapper_args__, "version_id_col": version}
 
     # Relationships
     client = relationship("Client", back_populates="contracts")
     commercial = relationship("Employee", back_populates="contracts")
-    events = relationship("Event", back_populates="contract")
+    events = relationship("Event", back_populates="contract", passive_deletes=True)
+    # The database refuses to delete a contract with payments; never unlink them
+    payments = relationship("Payment", back_populates="contract", passive_deletes="all")
 
 
 class Event(Base):
     __tablename__ = "event"
 
     id = Column(Integer, primary_key=True)
-    contract_id = Column(Integer, ForeignKey("contract.id"))
-    support_id = Column(Integer, ForeignKey("employee.id"))
+    contract_id = Column(Integer, ForeignKey("contract.id", ondelete="SET NULL"))
+    support_id = Column(
+        Integer, ForeignKey("employee.id", ondelete="SET NULL"), index=True
+    )
     name = Column(String, nullable=False)
-    start_date = Column(DateTime, nullable=False)
-    end_date = Column(DateTime, nullable=False)
+    start_date = Column(UTCDateTime, nullable=False, index=True)
+    end_date = Column(UTCDateTime, nullable=False)
     location = Column(String)
     attendees = Column(Integer)
     notes = Column(String)
+    version = Column(Integer, nullable=False, server_default="1")  # See Client
+
+    __table_args__ = (
+        # Recomputing the event columns of a contract reads only this index
+        Index("ix_event_contract_id_start_date", "contract_id", "start_date"),
+    )
+    __mapper_args__ = {**Base.__mapper_args__, "version_id_col": version}
 
     # Relationships
     contract = relationship("Contract", back_populates="events")
     support = relationship("Employee", back_populates="events")
+
+
+class Payment(Base):
+    """Ledger entry of a payment or balance correction of a contract; never updated."""
+
+    __tablename__ = "payment"
+
+    id = Column(Integer, primary_key=True)
+    contract_id = Column(
+        Integer, ForeignKey("contract.id", ondelete="RESTRICT"), index=True
+    )
+    employee_id = Column(Integer, ForeignKey("employee.id", ondelete="SET NULL"))
+    amount_cents = Column(BigInteger, nullable=False)
+    amount = money("amount_cents")
+    created_at = Column(UTCDateTime, nullable=False, default=lambda: datetime.now(UTC))
+
+    # Relationships
+    contract = relationship("Contract", back_populates="payments")
+    employee = relationship("Employee")
+
+
+class TableVersion(Base):
+    __tablename__ = "table_version"
+
+    table_name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)  # Bumped on every change
+
+
+class AuditAction(enum.Enum):
+    CREATE = "C"
+    UPDATE = "U"
+    DELETE = "D"
+    SIGN = "S"
+
+
+class AuditLog(Base):
+    __tablename__ = "audit_log"
+    __table_args__ = (
+        Index("ix_audit_log_entity_created_at", "entity", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    created_at = Column(
+        UTCDateTime, nullable=False, index=True, default=lambda: datetime.now(UTC)
+    )
+    # Stored as the one-letter code to keep rows compact
+    action = Column(
+        Enum(
+            AuditAction,
+            values_callable=lambda actions: [action.value for action in actions],
+            length=1,
+        ),
+        nullable=False,
+    )
+    entity = Column(String, nullable=False)  # Table name of the changed row
+    entity_id = Column(Integer, nullable=False)
+    changes = Column(JSON)  # {field: [old, new]} for updates, snapshot otherwise
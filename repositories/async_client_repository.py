@@ -0,0 +1,78 @@
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.unit_of_work import commit_async
+from models.models import Client, Employee
+from repositories.batch import get_many_async
+
+
+class AsyncClientRepository:
+    """Asyncio variant of ClientRepository.
+
+    Relationships are not loaded implicitly in async sessions; use the
+    foreign key columns or query related rows explicitly.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _first(self, query):
+        result = await self.session.execute(query)
+        return result.scalars().first()
+
+    async def _all(self, query) -> List[Client]:
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def create(self, client_data: dict) -> Client:
+        """Create a new client."""
+        client = Client(**client_data)
+        self.session.add(client)
+        await commit_async(self.session)
+        return client
+
+    async def get_by_id(self, client_id: int) -> Optional[Client]:
+        """Get a client by ID."""
+        return await self._first(select(Client).filter(Client.id == client_id))
+
+    async def get_many(self, client_ids: Iterable[int]) -> Dict[int, Client]:
+        """Get clients by ID, keyed by ID, with one query per chunk of IDs."""
+        return await get_many_async(self.session, Client, client_ids)
+
+    async def get_by_email(self, email: str) -> Optional[Client]:
+        """Get a client by email."""
+        return await self._first(select(Client).filter(Client.email == email))
+
+    async def get_all(self) -> List[Client]:
+        """Get all clients."""
+        return await self._all(select(Client))
+
+    async def get_by_commercial(self, commercial_id: int) -> List[Client]:
+        """Get all clients for a specific commercial employee."""
+        return await self._all(
+            select(Client).filter(Client.commercial_id == commercial_id)
+        )
+
+    async def update(self, client_id: int, client_data: dict) -> Optional[Client]:
+        """Update a client."""
+        client = await self.get_by_id(client_id)
+        if client:
+            for key, value in client_data.items():
+                setattr(client, key, value)
+            await commit_async(self.session)
+        return client
+
+    async def delete(self, client_id: int) -> bool:
+        """Delete a client."""
+        client = await self.get_by_id(client_id)
+        if client:
+            await self.session.delete(client)
+            await commit_async(self.session)
+            return True
+        return False
+
+    async def get_commercial(self, commercial_id: int) -> Optional[Employee]:
+        """Get a commercial employee by ID."""
+        return await self._first(select(Employee).filter(Employee.id == commercial_id))
@@ -0,0 +1,139 @@
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.unit_of_work import commit_async
+from models.models import AuditAction, Client, Contract, Employee, Payment
+from repositories.audit_repository import AuditRepository, diff, snapshot
+from repositories.batch import get_many_async
+from repositories.contract_repository import AUDITED_FIELDS
+from repositories.payment_repository import balance_adjustment
+
+
+class AsyncContractRepository:
+    """Asyncio variant of ContractRepository.
+
+    Relationships are not loaded implicitly in async sessions; use the
+    foreign key columns or query related rows explicitly.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _first(self, query):
+        result = await self.session.execute(query)
+        return result.scalars().first()
+
+    async def _all(self, query) -> List[Contract]:
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def create(self, contract_data: dict) -> Contract:
+        """Create a new contract."""
+        contract = Contract(**contract_data)
+        self.session.add(contract)
+        await self.session.flush()
+        AuditRepository(self.session).add(
+            AuditAction.CREATE,
+            Contract.__tablename__,
+            contract.id,
+            snapshot(contract, AUDITED_FIELDS),
+        )
+        # Keep the payments ledger consistent with the remaining amount
+        payment = balance_adjustment(contract)
+        if payment:
+            self.session.add(payment)
+        await commit_async(self.session)
+        return contract
+
+    async def get_by_id(self, contract_id: int) -> Optional[Contract]:
+        """Get a contract by its ID."""
+        return await self._first(select(Contract).filter(Contract.id == contract_id))
+
+    async def get_many(self, contract_ids: Iterable[int]) -> Dict[int, Contract]:
+        """Get contracts by ID, keyed by ID, with one query per chunk of IDs."""
+        return await get_many_async(self.session, Contract, contract_ids)
+
+    async def get_all(self) -> List[Contract]:
+        """Get all contracts."""
+        return await self._all(select(Contract))
+
+    async def get_by_client(self, client_id: int) -> List[Contract]:
+        """Get all contracts for a specific client."""
+        return await self._all(
+            select(Contract).filter(Contract.client_id == client_id)
+        )
+
+    async def get_by_commercial(self, commercial_id: int) -> List[Contract]:
+        """Get all contracts for a specific commercial employee."""
+        return await self._all(
+            select(Contract).filter(Contract.commercial_id == commercial_id)
+        )
+
+    async def get_unsigned_contracts(self, commercial_id: int = None) -> List[Contract]:
+        """Get all unsigned contracts, optionally filtered by commercial."""
+        query = select(Contract).filter(Contract.is_signed == False)
+        if commercial_id:
+            query = query.filter(Contract.commercial_id == commercial_id)
+        return await self._all(query)
+
+    async def get_unpaid_contracts(self, commercial_id: int = None) -> List[Contract]:
+        """Get all contracts with remaining amount > 0, optionally filtered by commercial."""
+        query = select(Contract).filter(Contract.remaining_amount_cents > 0)
+        if commercial_id:
+            query = query.filter(Contract.commercial_id == commercial_id)
+        return await self._all(query)
+
+    async def update(self, contract_id: int, contract_data: dict) -> Optional[Contract]:
+        """Update a contract."""
+        contract = await self.get_by_id(contract_id)
+        if contract:
+            before = snapshot(contract, AUDITED_FIELDS)
+            paid_cents = contract.total_amount_cents - contract.remaining_amount_cents
+            for key, value in contract_data.items():
+                setattr(contract, key, value)
+            # Balance corrections are recorded in the ledger, as payments are
+            payment = balance_adjustment(contract, paid_cents)
+            if payment:
+                self.session.add(payment)
+            changes = diff(before, snapshot(contract, AUDITED_FIELDS))
+            action = (
+                AuditAction.SIGN
+                if contract.is_signed and not before["is_signed"]
+                else AuditAction.UPDATE
+            )
+            AuditRepository(self.session).add(
+                action, Contract.__tablename__, contract.id, changes
+            )
+            await commit_async(self.session)
+        return contract
+
+    async def delete(self, contract_id: int) -> bool:
+        """Delete a contract, unless it has payments; see ContractRepository."""
+        contract = await self.get_by_id(contract_id)
+        if contract and not await self.has_payments(contract_id):
+            AuditRepository(self.session).add(
+                AuditAction.DELETE,
+                Contract.__tablename__,
+                contract.id,
+                snapshot(contract, AUDITED_FIELDS),
+            )
+            await self.session.delete(contract)
+            await commit_async(self.session)
+            return True
+        return False
+
+    async def has_payments(self, contract_id: int) -> bool:
+        """Check whether the payments ledger has entries for a contract."""
+        return await self.session.scalar(
+            select(exists().where(Payment.contract_id == contract_id))
+        )
+
+    async def get_client(self, client_id: int) -> Optional[Client]:
+        """Get a client by ID."""
+        return await self._first(select(Client).filter(Client.id == client_id))
+
+    async def get_commercial(self, commercial_id: int) -> Optional[Employee]:
+        """Get a commercial employee by ID."""
+        return await self._first(select(Employee).filter(Employee.id == commercial_id))
@@ -0,0 +1,135 @@
+import asyncio
+from datetime import UTC, datetime
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.unit_of_work import commit_async
+from models.models import AuditAction, Department, Employee
+from repositories.audit_repository import AuditRepository, diff, snapshot
+from repositories.batch import get_many_async
+from repositories.employee_repository import AUDITED_FIELDS, EmployeeRepository
+
+
+class AsyncEmployeeRepository:
+    """Asyncio variant of EmployeeRepository.
+
+    Password hashing is CPU bound, so it runs in a worker thread to keep the
+    event loop responsive.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    generate_employee_number = EmployeeRepository.generate_employee_number
+
+    async def get_by_email(self, email: str) -> Employee | None:
+        """Get employee by email."""
+        result = await self.session.execute(select(Employee).filter_by(email=email))
+        return result.scalars().first()
+
+    async def get_all(self) -> list[Employee]:
+        """Get all employees."""
+        result = await self.session.execute(select(Employee))
+        return list(result.scalars().all())
+
+    async def get_existing_emails(self, emails: list[str]) -> set[str]:
+        """Get the subset of the given emails already used by an employee."""
+        result = await self.session.execute(
+            select(Employee.email).filter(Employee.email.in_(emails))
+        )
+        return set(result.scalars().all())
+
+    async def create(
+        self,
+        full_name: str,
+        email: str,
+        department: Department,
+        role: str,
+        password: str,
+    ) -> Employee:
+        """Create a new employee."""
+        employee = Employee(
+            employee_number=self.generate_employee_number(),
+            full_name=full_name,
+            email=email,
+            department=department,
+            role=role,
+            created_at=datetime.now(UTC),
+        )
+        await asyncio.to_thread(setattr, employee, "password", password)
+        self.session.add(employee)
+        await self.session.flush()
+        AuditRepository(self.session).add(
+            AuditAction.CREATE,
+            Employee.__tablename__,
+            employee.id,
+            snapshot(employee, AUDITED_FIELDS),
+        )
+        await commit_async(self.session)
+        return employee
+
+    async def update(self, email: str, **kwargs) -> Employee | None:
+        """Update an employee."""
+        employee = await self.get_by_email(email)
+        if not employee:
+            return None
+
+        before = snapshot(employee, AUDITED_FIELDS)
+        password = kwargs.pop("password", None)
+        for key, value in kwargs.items():
+            if hasattr(employee, key) and value is not None:
+                if key == "department" and isinstance(value, str):
+                    value = Department(value)
+                setattr(employee, key, value)
+
+        changes = diff(before, snapshot(employee, AUDITED_FIELDS))
+        if password is not None:
+            await asyncio.to_thread(setattr, employee, "password", password)
+            changes["password"] = "changed"
+        employee.updated_at = datetime.now(UTC)
+        AuditRepository(self.session).add(
+            AuditAction.UPDATE, Employee.__tablename__, employee.id, changes
+        )
+        await commit_async(self.session)
+        return employee
+
+    async def delete(self, email: str) -> bool:
+        """Delete an employee."""
+        employee = await self.get_by_email(email)
+        if not employee:
+            return False
+
+        AuditRepository(self.session).add(
+            AuditAction.DELETE,
+            Employee.__tablename__,
+            employee.id,
+            snapshot(employee, AUDITED_FIELDS),
+        )
+        await self.session.delete(employee)
+        await commit_async(self.session)
+        return True
+
+    async def verify_credentials(
+        self, email: str, password: str
+    ) -> tuple[bool, Employee | None]:
+        """Verify credentials, rehashing the password if the policy changed."""
+        employee = await self.get_by_email(email)
+        if employee and await asyncio.to_thread(employee.verify_password, password):
+            if employee.password_needs_rehash():
+                await asyncio.to_thread(setattr, employee, "password", password)
+                await commit_async(self.session)
+            return True, employee
+        return False, None
+
+    async def get_by_id(self, employee_id: int) -> Employee | None:
+        """Get an employee by ID."""
+        result = await self.session.execute(
+            select(Employee).filter(Employee.id == employee_id)
+        )
+        return result.scalars().first()
+
+    async def get_many(self, employee_ids: Iterable[int]) -> dict[int, Employee]:
+        """Get employees by ID, keyed by ID, with one query per chunk of IDs."""
+        return await get_many_async(self.session, Employee, employee_ids)
@@ -0,0 +1,99 @@
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.unit_of_work import commit_async
+from models.models import Client, Contract, Employee, Event
+from repositories.batch import get_many_async
+from repositories.event_repository import (
+    CONTRACT_STATS_FIELDS,
+    refresh_contract_stats,
+)
+
+
+class AsyncEventRepository:
+    """Asyncio variant of EventRepository.
+
+    Relationships are not loaded implicitly in async sessions; use the
+    foreign key columns or query related rows explicitly.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _first(self, query):
+        result = await self.session.execute(query)
+        return result.scalars().first()
+
+    async def _all(self, query) -> List[Event]:
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def create(self, event_data: dict) -> Event:
+        """Create a new event."""
+        event = Event(**event_data)
+        self.session.add(event)
+        await self.session.execute(refresh_contract_stats([event.contract_id]))
+        await commit_async(self.session)
+        return event
+
+    async def get_by_id(self, event_id: int) -> Optional[Event]:
+        """Get an event by ID."""
+        return await self._first(select(Event).filter(Event.id == event_id))
+
+    async def get_many(self, event_ids: Iterable[int]) -> Dict[int, Event]:
+        """Get events by ID, keyed by ID, with one query per chunk of IDs."""
+        return await get_many_async(self.session, Event, event_ids)
+
+    async def get_all(self) -> List[Event]:
+        """Get all events."""
+        return await self._all(select(Event))
+
+    async def get_by_contract(self, contract_id: int) -> List[Event]:
+        """Get all events for a specific contract."""
+        return await self._all(select(Event).filter(Event.contract_id == contract_id))
+
+    async def get_by_support(self, support_id: int) -> List[Event]:
+        """Get all events assigned to a specific support employee."""
+        return await self._all(select(Event).filter(Event.support_id == support_id))
+
+    async def get_without_support(self) -> List[Event]:
+        """Get all events that don't have a support employee assigned."""
+        return await self._all(select(Event).filter(Event.support_id.is_(None)))
+
+    async def update(self, event_id: int, event_data: dict) -> Optional[Event]:
+        """Update an existing event."""
+        event = await self.get_by_id(event_id)
+        if event:
+            previous_contract_id = event.contract_id
+            for key, value in event_data.items():
+                setattr(event, key, value)
+            if CONTRACT_STATS_FIELDS & event_data.keys():
+                await self.session.execute(
+                    refresh_contract_stats([previous_contract_id, event.contract_id])
+                )
+            await commit_async(self.session)
+        return event
+
+    async def delete(self, event_id: int) -> bool:
+        """Delete an event."""
+        event = await self.get_by_id(event_id)
+        if event:
+            await self.session.delete(event)
+            await self.session.execute(refresh_contract_stats([event.contract_id]))
+            await commit_async(self.session)
+            return True
+        return False
+
+    async def get_contract(self, contract_id: int) -> Optional[Contract]:
+        """Get a contract by ID."""
+        return await self._first(select(Contract).filter(Contract.id == contract_id))
+
+    async def get_client(self, client_id: int) -> Optional[Client]:
+        """Get a client by ID."""
+        return await self._first(select(Client).filter(Client.id == client_id))
+
+    async def get_support(self, support_id: int) -> Optional[Employee]:
+        """Get a support employee by ID."""
+        return await self._first(select(Employee).filter(Employee.id == support_id))
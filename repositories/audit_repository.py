@@ -0,0 +1,70 @@
+import enum
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from models.models import AuditAction, AuditLog
+
+
+def to_json_value(value):
+    """Convert a column value to something JSON can store."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def snapshot(obj, fields: list[str]) -> dict:
+    """Get the JSON values of the given fields of a model instance."""
+    return {field: to_json_value(getattr(obj, field)) for field in fields}
+
+
+def diff(before: dict, after: dict) -> dict:
+    """Get {field: [old, new]} for the fields whose value changed."""
+    return {
+        field: [before.get(field), value]
+        for field, value in after.items()
+        if before.get(field) != value
+    }
+
+
+class AuditRepository:
+    """Audit log entries, added to the caller's transaction without committing."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def add(
+        self, action: AuditAction, entity: str, entity_id: int, changes: dict
+    ) -> AuditLog:
+        """Record a change in the current transaction."""
+        entry = AuditLog(
+            action=action, entity=entity, entity_id=entity_id, changes=changes
+        )
+        self.session.add(entry)
+        return entry
+
+    def list(
+        self,
+        entity: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[AuditLog]:
+        """Get audit entries, most recent first, with optional filters."""
+        query = self.session.query(AuditLog)
+        if entity:
+            query = query.filter(AuditLog.entity == entity)
+        if entity_id is not None:
+            query = query.filter(AuditLog.entity_id == entity_id)
+        if since:
+            query = query.filter(AuditLog.created_at >= since)
+        query = query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+        if limit:
+            query = query.limit(limit)
+        return query.all()
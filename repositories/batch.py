@@ -0,0 +1,53 @@
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+
+# Ids per IN (...) query, well under SQLite's bound parameter limit
+CHUNK_SIZE = 500
+
+
+def _split_cached(session: Session, model, ids: Iterable[int]) -> tuple[dict, list]:
+    """Split ids into objects already in the identity map and ids to query."""
+    found = {}
+    missing = []
+    for id_ in dict.fromkeys(ids):  # Drop duplicates, keep order
+        obj = session.identity_map.get(identity_key(model, id_))
+        if obj is not None and obj not in session.deleted:
+            found[id_] = obj
+        else:
+            missing.append(id_)
+    return found, missing
+
+
+def _chunks(ids: list, chunk_size: int):
+    for start in range(0, len(ids), chunk_size):
+        yield ids[start : start + chunk_size]
+
+
+def get_many(
+    session: Session, model, ids: Iterable[int], chunk_size: int = CHUNK_SIZE
+) -> dict:
+    """Get {id: object} for the ids that exist, one query per chunk of ids.
+
+    Objects already loaded in the session are reused without a query.
+    """
+    found, missing = _split_cached(session, model, ids)
+    for chunk in _chunks(missing, chunk_size):
+        for obj in session.scalars(select(model).where(model.id.in_(chunk))):
+            found[obj.id] = obj
+    return found
+
+
+async def get_many_async(
+    session: AsyncSession, model, ids: Iterable[int], chunk_size: int = CHUNK_SIZE
+) -> dict:
+    """Asyncio variant of get_many."""
+    found, missing = _split_cached(session.sync_session, model, ids)
+    for chunk in _chunks(missing, chunk_size):
+        result = await session.scalars(select(model).where(model.id.in_(chunk)))
+        for obj in result:
+            found[obj.id] = obj
+    return found
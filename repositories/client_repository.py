@@ -1,8 +1,10 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from sqlalchemy.orm import Session
 
+from database.unit_of_work import commit
 from models.models import Client, Employee
+from repositories.batch import get_many
 
 
 class ClientRepository:
@@ -13,14 +15,17 @@ class ClientRepository:
         """Create a new client."""
         client = Client(**client_data)
         self.session.add(client)
-        self.session.commit()
-        self.session.refresh(client)
+        commit(self.session)
         return client
 
     def get_by_id(self, client_id: int) -> Optional[Client]:
         """Get a client by ID."""
         return self.session.query(Client).filter(Client.id == client_id).first()
 
+    def get_many(self, client_ids: Iterable[int]) -> Dict[int, Client]:
+        """Get clients by ID, keyed by ID, with one query per chunk of IDs."""
+        return get_many(self.session, Client, client_ids)
+
     def get_by_email(self, email: str) -> Optional[Client]:
         """Get a client by email."""
         return self.session.query(Client).filter(Client.email == email).first()
@@ -43,8 +48,7 @@ class ClientRepository:
         if client:
             for key, value in client_data.items():
                 setattr(client, key, value)
-            self.session.commit()
-            self.session.refresh(client)
+            commit(self.session)
         return client
 
     def delete(self, client_id: int) -> bool:
@@ -52,7 +56,7 @@ class ClientRepository:
         client = self.get_by_id(client_id)
         if client:
             self.session.delete(client)
-            self.session.commit()
+            commit(self.session)
             return True
         return False
 
@@ -1,7 +1,29 @@
+from sqlalchemy import exists, func, or_, select
 from sqlalchemy.orm import Session
-from models.models import Contract, Client, Employee
-from typing import List, Optional
-from decimal import Decimal
+from database.unit_of_work import commit
+from models.models import (
+    AuditAction,
+    Contract,
+    Client,
+    Employee,
+    Event,
+    Payment,
+    from_cents,
+)
+from repositories.audit_repository import AuditRepository, diff, snapshot
+from repositories.batch import get_many
+from repositories.payment_repository import balance_adjustment
+from typing import Dict, Iterable, List, Optional
+from datetime import UTC, datetime
+
+# Fields recorded in the audit log
+AUDITED_FIELDS = [
+    "client_id",
+    "commercial_id",
+    "total_amount",
+    "remaining_amount",
+    "is_signed",
+]
 
 
 class ContractRepository:
@@ -12,14 +34,28 @@ class ContractRepository:
         """Create a new contract."""
         contract = Contract(**contract_data)
         self.session.add(contract)
-        self.session.commit()
-        self.session.refresh(contract)
+        self.session.flush()
+        AuditRepository(self.session).add(
+            AuditAction.CREATE,
+            Contract.__tablename__,
+            contract.id,
+            snapshot(contract, AUDITED_FIELDS),
+        )
+        # Keep the payments ledger consistent with the remaining amount
+        payment = balance_adjustment(contract)
+        if payment:
+            self.session.add(payment)
+        commit(self.session)
         return contract
 
     def get_by_id(self, contract_id: int) -> Optional[Contract]:
         """Get a contract by its ID."""
         return self.session.query(Contract).filter(Contract.id == contract_id).first()
 
+    def get_many(self, contract_ids: Iterable[int]) -> Dict[int, Contract]:
+        """Get contracts by ID, keyed by ID, with one query per chunk of IDs."""
+        return get_many(self.session, Contract, contract_ids)
+
     def get_all(self) -> List[Contract]:
         """Get all contracts."""
         return self.session.query(Contract).all()
@@ -47,32 +83,114 @@ class ContractRepository:
 
     def get_unpaid_contracts(self, commercial_id: int = None) -> List[Contract]:
         """Get all contracts with remaining amount > 0, optionally filtered by commercial."""
-        query = self.session.query(Contract).filter(
-            Contract.remaining_amount > Decimal("0")
-        )
+        query = self.session.query(Contract).filter(Contract.remaining_amount_cents > 0)
         if commercial_id:
             query = query.filter(Contract.commercial_id == commercial_id)
         return query.all()
 
+    def get_totals(self, commercial_id: int = None) -> dict:
+        """Get the contract count and amount totals, optionally for a commercial.
+
+        Amounts are summed as integer cents by the database and converted
+        once, so the totals are exact.
+        """
+        query = select(
+            func.count(Contract.id),
+            func.coalesce(func.sum(Contract.total_amount_cents), 0),
+            func.coalesce(func.sum(Contract.remaining_amount_cents), 0),
+        )
+        if commercial_id:
+            query = query.where(Contract.commercial_id == commercial_id)
+        count, total_cents, remaining_cents = self.session.execute(query).one()
+        return {
+            "contracts": count,
+            "total_amount": from_cents(total_cents),
+            "remaining_amount": from_cents(remaining_cents),
+            "paid_amount": from_cents(total_cents - remaining_cents),
+        }
+
+    def get_without_events(self) -> List[Contract]:
+        """Get signed contracts that have no event yet."""
+        return (
+            self.session.query(Contract)
+            .filter(Contract.is_signed == True, Contract.event_count == 0)
+            .all()
+        )
+
+    def get_with_next_event_before(self, before: datetime) -> List[Contract]:
+        """Get contracts whose next upcoming event starts before the given date."""
+        now = datetime.now(UTC)
+        # next_event_date rolls forward on event writes only; when it has
+        # passed since, look for the real next event in the event table
+        upcoming = (
+            select(Event.id)
+            .where(
+                Event.contract_id == Contract.id,
+                Event.start_date >= now,
+                Event.start_date < before,
+            )
+            .exists()
+        )
+        return (
+            self.session.query(Contract)
+            .filter(
+                Contract.next_event_date < before,
+                or_(Contract.next_event_date >= now, upcoming),
+            )
+            .order_by(Contract.next_event_date)
+            .all()
+        )
+
     def update(self, contract_id: int, contract_data: dict) -> Optional[Contract]:
         """Update a contract."""
         contract = self.get_by_id(contract_id)
         if contract:
+            before = snapshot(contract, AUDITED_FIELDS)
+            paid_cents = contract.total_amount_cents - contract.remaining_amount_cents
             for key, value in contract_data.items():
                 setattr(contract, key, value)
-            self.session.commit()
-            self.session.refresh(contract)
+            # Balance corrections are recorded in the ledger, as payments are
+            payment = balance_adjustment(contract, paid_cents)
+            if payment:
+                self.session.add(payment)
+            changes = diff(before, snapshot(contract, AUDITED_FIELDS))
+            # A signature is recorded with its own action code for compliance
+            action = (
+                AuditAction.SIGN
+                if contract.is_signed and not before["is_signed"]
+                else AuditAction.UPDATE
+            )
+            AuditRepository(self.session).add(
+                action, Contract.__tablename__, contract.id, changes
+            )
+            commit(self.session)
         return contract
 
     def delete(self, contract_id: int) -> bool:
-        """Delete a contract."""
+        """Delete a contract.
+
+        Contracts with payments are kept, since the ledger references them;
+        returns False for them, as for unknown contracts.
+        """
         contract = self.get_by_id(contract_id)
-        if contract:
+        if contract and not self.has_payments(contract_id):
+            AuditRepository(self.session).add(
+                AuditAction.DELETE,
+                Contract.__tablename__,
+                contract.id,
+                snapshot(contract, AUDITED_FIELDS),
+            )
             self.session.delete(contract)
-            self.session.commit()
+            commit(self.session)
             return True
         return False
 
+    def has_payments(self, contract_id: int) -> bool:
+        """Check whether the payments ledger has entries for a contract."""
+        return self.session.scalar(
+            select(exists().where(Payment.contract_id == contract_id))
+        )
+
     def get_client(self, client_id: int) -> Optional[Client]:
         """Get a client by ID."""
         return self.session.query(Client).filter(Client.id == client_id).first()
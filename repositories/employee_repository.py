@@ -1,10 +1,40 @@
 import random
 import string
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
+from itertools import repeat
+from typing import Iterable
 
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
+from werkzeug.security import generate_password_hash
 
-from models.models import Department, Employee
+from database.unit_of_work import commit
+from models.models import (
+    AuditAction,
+    Client,
+    Contract,
+    Department,
+    Employee,
+    Event,
+    get_password_hash_method,
+)
+from repositories.audit_repository import AuditRepository, diff, snapshot
+from repositories.batch import get_many
+
+# Fields recorded in the audit log (never the password hash)
+AUDITED_FIELDS = ["employee_number", "full_name", "email", "department", "role"]
+
+# Columns assigning rows to an employee, by department of the assignee
+ASSIGNMENT_COLUMNS = {
+    Department.COMMERCIAL: [Client.commercial_id, Contract.commercial_id],
+    Department.SUPPORT: [Event.support_id],
+}
+
+
+def _hash_password(password: str, method: str) -> str:
+    """Hash a password in a worker process."""
+    return generate_password_hash(password, method=method)
 
 
 class EmployeeRepository:
@@ -42,23 +72,95 @@ class EmployeeRepository:
         )
         employee.password = password
         self.session.add(employee)
-        self.session.commit()
+        self.session.flush()
+        AuditRepository(self.session).add(
+            AuditAction.CREATE,
+            Employee.__tablename__,
+            employee.id,
+            snapshot(employee, AUDITED_FIELDS),
+        )
+        commit(self.session)
         return employee
 
+    def get_existing_emails(self, emails: list[str]) -> set[str]:
+        """Get the subset of the given emails already used by an employee."""
+        rows = (
+            self.session.query(Employee.email).filter(Employee.email.in_(emails)).all()
+        )
+        return {email for (email,) in rows}
+
+    def bulk_create(
+        self, employees_data: list[dict], max_workers: int | None = None
+    ) -> list[Employee]:
+        """Create many employees in one transaction.
+
+        Passwords are hashed in a process pool since hashing dominates the
+        cost of large imports.
+        """
+        method = get_password_hash_method()
+        passwords = [data["password"] for data in employees_data]
+        if len(passwords) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                password_hashes = list(
+                    executor.map(_hash_password, passwords, repeat(method))
+                )
+        else:
+            password_hashes = [_hash_password(p, method) for p in passwords]
+
+        now = datetime.now(UTC)
+        employees = []
+        for data, password_hash in zip(employees_data, password_hashes):
+            department = data["department"]
+            if isinstance(department, str):
+                department = Department(department)
+            employee = Employee(
+                employee_number=self.generate_employee_number(),
+                full_name=data["full_name"],
+                email=data["email"],
+                department=department,
+                role=data["role"],
+                created_at=now,
+            )
+            employee._password_hash = password_hash
+            employees.append(employee)
+
+        self.session.add_all(employees)
+        self.session.flush()
+        audit = AuditRepository(self.session)
+        for employee in employees:
+            audit.add(
+                AuditAction.CREATE,
+                Employee.__tablename__,
+                employee.id,
+                snapshot(employee, AUDITED_FIELDS),
+            )
+        commit(self.session)
+        return employees
+
     def update(self, email: str, **kwargs) -> Employee | None:
         """Update an employee."""
         employee = self.get_by_email(email)
         if not employee:
             return None
 
+        before = snapshot(employee, AUDITED_FIELDS)
+        password_changed = False
         for key, value in kwargs.items():
-            if hasattr(employee, key) and value is not None:
+            # hasattr() is False for the write-only password attribute
+            if (key == "password" or hasattr(employee, key)) and value is not None:
                 if key == "department" and isinstance(value, str):
                     value = Department(value)
                 setattr(employee, key, value)
+                password_changed = password_changed or key == "password"
 
+        changes = diff(before, snapshot(employee, AUDITED_FIELDS))
+        if password_changed:
+            changes["password"] = "changed"
         employee.updated_at = datetime.now(UTC)
-        self.session.commit()
+        AuditRepository(self.session).add(
+            AuditAction.UPDATE, Employee.__tablename__, employee.id, changes
+        )
+        commit(self.session)
         return employee
 
     def delete(self, email: str) -> bool:
@@ -67,18 +169,75 @@ class EmployeeRepository:
         if not employee:
             return False
 
+        AuditRepository(self.session).add(
+            AuditAction.DELETE,
+            Employee.__tablename__,
+            employee.id,
+            snapshot(employee, AUDITED_FIELDS),
+        )
         self.session.delete(employee)
-        self.session.commit()
+        commit(self.session)
         return True
 
     def verify_credentials(
         self, email: str, password: str
     ) -> tuple[bool, Employee | None]:
+        """Verify credentials, rehashing the password if the policy changed."""
         employee = self.get_by_email(email)
         if employee and employee.verify_password(password):
+            if employee.password_needs_rehash():
+                employee.password = password
+                commit(self.session)
             return True, employee
         return False, None
 
     def get_by_id(self, employee_id: int) -> Employee | None:
         """Récupère un employé par son ID."""
         return self.session.query(Employee).filter(Employee.id == employee_id).first()
+
+    def get_many(self, employee_ids: Iterable[int]) -> dict[int, Employee]:
+        """Get employees by ID, keyed by ID, with one query per chunk of IDs."""
+        return get_many(self.session, Employee, employee_ids)
+
+    def count_assignments(
+        self, employee: Employee, department: Department
+    ) -> dict[str, int]:
+        """Count the rows assigned to an employee, keyed by table name."""
+        return {
+            column.class_.__tablename__: self.session.scalar(
+                select(func.count()).where(column == employee.id)
+            )
+            for column in ASSIGNMENT_COLUMNS[department]
+        }
+
+    def reassign(
+        self, from_employee: Employee, to_employee: Employee, department: Department
+    ) -> dict[str, int]:
+        """Move every row assigned to an employee to another one.
+
+        Each table is updated with a single UPDATE rather than row by row.
+        Returns the number of rows moved, keyed by table name.
+        """
+        counts = {}
+        for column in ASSIGNMENT_COLUMNS[department]:
+            result = self.session.execute(
+                update(column.class_)
+                .where(column == from_employee.id)
+                .values(
+                    {
+                        column.key: to_employee.id,
+                        # Concurrent edits of the moved rows fail rather
+                        # than undo the move
+                        "version": column.class_.version + 1,
+                    }
+                )
+            )
+            counts[column.class_.__tablename__] = result.rowcount
+        AuditRepository(self.session).add(
+            AuditAction.UPDATE,
+            Employee.__tablename__,
+            from_employee.id,
+            {"reassigned_to": to_employee.email, **counts},
+        )
+        commit(self.session)
+        return counts
@@ -1,7 +1,45 @@
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.orm import Session
+from database.unit_of_work import commit
 from models.models import Event, Contract, Client, Employee
-from typing import List, Optional
-from datetime import datetime
+from repositories.batch import get_many
+from typing import Dict, Iterable, List, Optional
+from datetime import UTC, datetime
+
+# Event fields that change the event columns of their contract
+CONTRACT_STATS_FIELDS = {"contract_id", "start_date"}
+
+
+def contract_event_stats(now: datetime) -> dict:
+    """Get UPDATE contract values recomputing the event columns of each row."""
+    return {
+        "event_count": select(func.count(Event.id))
+        .where(Event.contract_id == Contract.id)
+        .scalar_subquery(),
+        "next_event_date": select(func.min(Event.start_date))
+        .where(Event.contract_id == Contract.id, Event.start_date >= now)
+        .scalar_subquery(),
+    }
+
+
+def refresh_contract_stats(contract_ids: Iterable[int]):
+    """Get the UPDATE recomputing the event columns of the given contracts.
+
+    Contracts whose next event has started since their last refresh are
+    recomputed too, so next_event_date rolls forward with every event write.
+    """
+    now = datetime.now(UTC)
+    return (
+        update(Contract)
+        .where(
+            or_(
+                Contract.id.in_([i for i in contract_ids if i is not None]),
+                Contract.next_event_date < now,
+            )
+        )
+        .values(**contract_event_stats(now))
+        .execution_options(synchronize_session="fetch")
+    )
 
 
 class EventRepository:
@@ -12,14 +50,18 @@ class EventRepository:
         """Create a new event."""
         event = Event(**event_data)
         self.session.add(event)
-        self.session.commit()
-        self.session.refresh(event)
+        self.session.execute(refresh_contract_stats([event.contract_id]))
+        commit(self.session)
         return event
 
     def get_by_id(self, event_id: int) -> Optional[Event]:
         """Get an event by ID."""
         return self.session.query(Event).filter(Event.id == event_id).first()
 
+    def get_many(self, event_ids: Iterable[int]) -> Dict[int, Event]:
+        """Get events by ID, keyed by ID, with one query per chunk of IDs."""
+        return get_many(self.session, Event, event_ids)
+
     def get_all(self) -> List[Event]:
         """Get all events."""
         return self.session.query(Event).all()
@@ -36,14 +78,27 @@ class EventRepository:
         """Get all events that don't have a support employee assigned."""
         return self.session.query(Event).filter(Event.support_id.is_(None)).all()
 
+    def get_starting_between(self, start: datetime, end: datetime) -> List[Event]:
+        """Get the events starting in [start, end), in start order."""
+        return (
+            self.session.query(Event)
+            .filter(Event.start_date >= start, Event.start_date < end)
+            .order_by(Event.start_date)
+            .all()
+        )
+
     def update(self, event_id: int, event_data: dict) -> Optional[Event]:
         """Update an existing event."""
         event = self.get_by_id(event_id)
         if event:
+            previous_contract_id = event.contract_id
             for key, value in event_data.items():
                 setattr(event, key, value)
-            self.session.commit()
-            self.session.refresh(event)
+            if CONTRACT_STATS_FIELDS & event_data.keys():
+                self.session.execute(
+                    refresh_contract_stats([previous_contract_id, event.contract_id])
+                )
+            commit(self.session)
         return event
 
     def delete(self, event_id: int) -> bool:
@@ -51,7 +106,8 @@ class EventRepository:
         event = self.get_by_id(event_id)
         if event:
             self.session.delete(event)
-            self.session.commit()
+            self.session.execute(refresh_contract_stats([event.contract_id]))
+            commit(self.session)
             return True
         return False
 
@@ -0,0 +1,142 @@
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import List, Optional
+
+from sqlalchemy import Insert, exists, func, insert, literal, select, update
+from sqlalchemy.orm import Session
+
+from database.unit_of_work import commit
+from models.models import Contract, Payment, UTCDateTime, from_cents, to_cents
+
+
+def balance_adjustment(contract: Contract, paid_cents: int = 0) -> Optional[Payment]:
+    """Ledger entry for a balance change made outside pay, None if there is none.
+
+    paid_cents is the amount paid before the change, the total minus the
+    remaining amount; a new contract starts from 0. The entry is negative
+    when the amount paid decreases.
+    """
+    cents = contract.total_amount_cents - contract.remaining_amount_cents - paid_cents
+    if cents == 0:
+        return None
+    return Payment(contract_id=contract.id, amount_cents=cents)
+
+
+def insert_opening_balances(*criteria) -> Insert:
+    """INSERT of the opening balance of contracts without ledger entries.
+
+    Used for contracts written in bulk or recorded before the ledger; the
+    entries are dated when their contract was created. criteria restrict
+    the contracts.
+    """
+    paid_cents = Contract.total_amount_cents - Contract.remaining_amount_cents
+    created_at = func.coalesce(
+        Contract.created_at, literal(datetime.now(UTC), UTCDateTime())
+    )
+    return insert(Payment).from_select(
+        ["contract_id", "amount_cents", "created_at"],
+        select(Contract.id, paid_cents, created_at).where(
+            paid_cents > 0,
+            ~exists().where(Payment.contract_id == Contract.id),
+            *criteria,
+        ),
+    )
+
+
+class PaymentRepository:
+    """Payments ledger; the contract balances follow from its entries."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def pay(
+        self, contract_id: int, amount: Decimal, employee_id: int = None
+    ) -> Optional[Payment]:
+        """Record a payment and decrement the remaining amount of its contract.
+
+        The balance is checked and decremented by a single conditional
+        UPDATE, so concurrent payments can neither lose an update nor take
+        the balance below zero. Returns None, recording nothing, when the
+        contract does not exist or owes less than the amount, and raises
+        ValueError when the amount rounds to no cents.
+        """
+        cents = to_cents(amount)
+        if cents <= 0:
+            raise ValueError("Payment amount must be at least 0.01")
+        result = self.session.execute(
+            update(Contract)
+            .where(Contract.id == contract_id, Contract.remaining_amount_cents >= cents)
+            .values(
+                remaining_amount_cents=Contract.remaining_amount_cents - cents,
+                # Concurrent edits of the contract then fail instead of
+                # writing back the old remaining amount
+                version=Contract.version + 1,
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+        if result.rowcount != 1:
+            return None
+
+        payment = Payment(
+            contract_id=contract_id, employee_id=employee_id, amount_cents=cents
+        )
+        self.session.add(payment)
+        commit(self.session)
+        return payment
+
+    def get_by_contract(self, contract_id: int) -> List[Payment]:
+        """Get the payments of a contract, oldest first."""
+        return (
+            self.session.query(Payment)
+            .filter(Payment.contract_id == contract_id)
+            .order_by(Payment.created_at, Payment.id)
+            .all()
+        )
+
+    def reconcile(self, mismatched_only: bool = True) -> List[dict]:
+        """Compare each contract balance with its payments ledger.
+
+        Payments are summed per contract by the database, in integer cents.
+        A contract is reconciled when its total amount minus its payments
+        equals its remaining amount.
+        """
+        paid = (
+            select(
+                Payment.contract_id,
+                func.sum(Payment.amount_cents).label("paid_cents"),
+                func.count(Payment.id).label("payments"),
+            )
+            .group_by(Payment.contract_id)
+            .subquery()
+        )
+        paid_cents = func.coalesce(paid.c.paid_cents, 0)
+        difference = (
+            Contract.total_amount_cents - paid_cents - Contract.remaining_amount_cents
+        )
+        query = (
+            select(
+                Contract.id,
+                Contract.total_amount_cents,
+                Contract.remaining_amount_cents,
+                paid_cents,
+                func.coalesce(paid.c.payments, 0),
+                difference,
+            )
+            .outerjoin(paid, paid.c.contract_id == Contract.id)
+            .order_by(Contract.id)
+        )
+        if mismatched_only:
+            query = query.where(difference != 0)
+        return [
+            {
+                "contract_id": contract_id,
+                "total_amount": from_cents(total),
+                "remaining_amount": from_cents(remaining),
+                "paid_amount": from_cents(paid_total),
+                "payments": payments,
+                "difference": from_cents(diff),
+            }
+            for contract_id, total, remaining, paid_total, payments, diff in (
+                self.session.execute(query)
+            )
+        ]
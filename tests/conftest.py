@@ -0,0 +1,33 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from database.profiling import profile_queries
+from models.models import Base
+
+
+@pytest.fixture
+def sqlite_engine():
+    """Create an in-memory SQLite database with all tables."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def sqlite_session(sqlite_engine):
+    """Create a session bound to the in-memory database."""
+    with Session(sqlite_engine) as session:
+        yield session
+
+
+@pytest.fixture
+def query_profiler(sqlite_engine):
+    """Record the statements run on the in-memory database.
+
+    Use it to assert query-count budgets:
+        assert query_profiler.count <= 2
+    """
+    with profile_queries(sqlite_engine) as profiler:
+        yield profiler
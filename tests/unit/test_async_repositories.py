@@ -0,0 +1,135 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from database.connection import DatabaseConnection
+from models.models import AuditAction, AuditLog, Base, Client, Department
+from repositories.async_client_repository import AsyncClientRepository
+from repositories.async_contract_repository import AsyncContractRepository
+from repositories.async_employee_repository import AsyncEmployeeRepository
+from repositories.async_event_repository import AsyncEventRepository
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """Point DatabaseConnection at a fresh SQLite file with all tables."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'async.db'}")
+    monkeypatch.setenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:1000")
+    DatabaseConnection.dispose()
+    Base.metadata.create_all(DatabaseConnection.get_engine())
+    yield
+    asyncio.run(DatabaseConnection.dispose_async())
+    DatabaseConnection.dispose()
+
+
+def test_async_engine_uses_aiosqlite(database):
+    """Test that the async engine targets the same SQLite file through aiosqlite"""
+    engine = DatabaseConnection.get_async_engine()
+
+    assert engine.url.drivername == "sqlite+aiosqlite"
+    assert engine.url.database == DatabaseConnection.get_engine().url.database
+
+
+def test_async_repositories_round_trip(database):
+    """Test creating and reading rows through the async repositories"""
+
+    async def scenario():
+        async with DatabaseConnection.get_async_session() as session:
+            commercial = await AsyncEmployeeRepository(session).create(
+                full_name="Test Commercial",
+                email="commercial@example.com",
+                department=Department.COMMERCIAL,
+                role="Sales",
+                password="secure_password123",
+            )
+            client = await AsyncClientRepository(session).create(
+                {
+                    "full_name": "Test Client",
+                    "email": "client@example.com",
+                    "commercial_id": commercial.id,
+                }
+            )
+            contract = await AsyncContractRepository(session).create(
+                {
+                    "client_id": client.id,
+                    "commercial_id": commercial.id,
+                    "total_amount": Decimal("1000.00"),
+                    "remaining_amount": Decimal("500.00"),
+                    "is_signed": False,
+                }
+            )
+            await AsyncContractRepository(session).update(
+                contract.id, {"is_signed": True}
+            )
+            # Its opening payment keeps the contract
+            deleted = await AsyncContractRepository(session).delete(contract.id)
+
+        async with DatabaseConnection.get_async_session() as session:
+            employees = AsyncEmployeeRepository(session)
+            is_valid, _ = await employees.verify_credentials(
+                "commercial@example.com", "secure_password123"
+            )
+            clients = await AsyncClientRepository(session).get_by_commercial(
+                commercial.id
+            )
+            unpaid = await AsyncContractRepository(session).get_unpaid_contracts()
+            events = await AsyncEventRepository(session).get_by_contract(contract.id)
+            return deleted, is_valid, clients, unpaid, events
+
+    deleted, is_valid, clients, unpaid, events = asyncio.run(scenario())
+
+    assert not deleted
+    assert is_valid
+    assert [client.email for client in clients] == ["client@example.com"]
+    assert len(unpaid) == 1 and unpaid[0].is_signed
+    assert events == []
+    with DatabaseConnection.get_session() as session:
+        actions = [entry.action for entry in session.query(AuditLog).all()]
+    assert AuditAction.SIGN in actions
+
+
+def test_gather_in_sessions_runs_lookups_concurrently(database):
+    """Test that batched lookups each get a session and keep item order"""
+    with DatabaseConnection.get_session() as session:
+        session.add_all(
+            Client(full_name=f"Client {i}", email=f"client{i}@example.com")
+            for i in range(20)
+        )
+        session.commit()
+
+    async def lookup(session, client_id):
+        client = await AsyncClientRepository(session).get_by_id(client_id)
+        return client.email if client else None
+
+    emails = asyncio.run(
+        DatabaseConnection.gather_in_sessions(lookup, range(1, 23), concurrency=4)
+    )
+
+    assert emails[:3] == [
+        "client0@example.com",
+        "client1@example.com",
+        "client2@example.com",
+    ]
+    assert emails[-2:] == [None, None]
+
+
+def test_async_get_many(database):
+    """Test batch lookups through the async repositories"""
+    with DatabaseConnection.get_session() as session:
+        session.add_all(
+            Client(full_name=f"Client {i}", email=f"client{i}@example.com")
+            for i in range(3)
+        )
+        session.commit()
+
+    async def lookup():
+        async with DatabaseConnection.get_async_session() as session:
+            return await AsyncClientRepository(session).get_many([3, 1, 7])
+
+    clients = asyncio.run(lookup())
+
+    assert {client_id: c.email for client_id, c in clients.items()} == {
+        3: "client2@example.com",
+        1: "client0@example.com",
+    }
@@ -0,0 +1,165 @@
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from commands.audit_commands import audit
+from models.models import AuditAction, AuditLog, Client, Department
+from repositories.audit_repository import AuditRepository
+from repositories.contract_repository import ContractRepository
+from repositories.employee_repository import EmployeeRepository
+
+
+@pytest.fixture
+def runner():
+    """Create a CLI runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def cheap_hashing(monkeypatch):
+    """Use a fast password hash so repository tests stay quick."""
+    monkeypatch.setenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:1000")
+
+
+def test_employee_changes_are_audited(sqlite_session, cheap_hashing):
+    """Test that employee create, update and delete write audit entries"""
+    repository = EmployeeRepository(sqlite_session)
+    employee = repository.create(
+        full_name="Test User",
+        email="test@example.com",
+        department=Department.COMMERCIAL,
+        role="Sales",
+        password="secure_password123",
+    )
+    repository.update("test@example.com", role="Manager", password="new_password")
+    repository.delete("test@example.com")
+
+    entries = AuditRepository(sqlite_session).list(entity="employee")
+
+    assert [entry.action for entry in entries] == [
+        AuditAction.DELETE,
+        AuditAction.UPDATE,
+        AuditAction.CREATE,
+    ]
+    assert all(entry.entity_id == employee.id for entry in entries)
+    assert entries[1].changes == {"role": ["Sales", "Manager"], "password": "changed"}
+    assert entries[2].changes["department"] == "commercial"
+    assert "password" not in entries[2].changes
+
+
+def test_contract_signature_is_audited(sqlite_session):
+    """Test that signing a contract writes a signature entry with its diff"""
+    sqlite_session.add(Client(id=1, full_name="Test Client", email="c@example.com"))
+    sqlite_session.commit()
+    repository = ContractRepository(sqlite_session)
+    contract = repository.create(
+        {
+            "client_id": 1,
+            "total_amount": Decimal("1000.00"),
+            "remaining_amount": Decimal("1000.00"),
+            "is_signed": False,
+        }
+    )
+
+    repository.update(contract.id, {"is_signed": True})
+
+    entry = AuditRepository(sqlite_session).list(entity="contract", limit=1)[0]
+    assert entry.action == AuditAction.SIGN
+    assert entry.changes == {"is_signed": [False, True]}
+
+
+def test_audit_list_since_filter(sqlite_session):
+    """Test that --since filtering excludes older entries"""
+    repository = AuditRepository(sqlite_session)
+    old_entry = repository.add(AuditAction.UPDATE, "client", 1, {})
+    old_entry.created_at = datetime.now(UTC) - timedelta(days=10)
+    repository.add(AuditAction.UPDATE, "client", 2, {})
+    sqlite_session.commit()
+
+    entries = repository.list(since=datetime.now(UTC) - timedelta(days=1))
+
+    assert [entry.entity_id for entry in entries] == [2]
+
+
+class TestAuditCommands:
+    """Test audit log commands."""
+
+    @patch("commands.audit_commands.DatabaseConnection.get_read_session")
+    @patch("commands.audit_commands.AuditRepository")
+    @patch("commands.audit_commands.AuthService")
+    def test_list_audit_success(
+        self, mock_auth, mock_repo_class, mock_get_session, runner
+    ):
+        """Test successful audit log listing with filters."""
+        mock_get_session.return_value.__enter__.return_value = Mock()
+        mock_auth.return_value.has_permission.return_value = True
+        mock_repo_class.return_value.list.return_value = [
+            AuditLog(
+                id=1,
+                created_at=datetime(2025, 1, 1, 12, 0),
+                action=AuditAction.SIGN,
+                entity="contract",
+                entity_id=3,
+                changes={"is_signed": [False, True]},
+            )
+        ]
+
+        result = runner.invoke(
+            audit, ["list", "--entity", "contract", "--since", "2025-01-01"]
+        )
+
+        assert result.exit_code == 0
+        assert "Action: sign" in result.output
+        assert "Entity: contract 3" in result.output
+        assert 'Changes: {"is_signed": [false, true]}' in result.output
+        mock_repo_class.return_value.list.assert_called_once_with(
+            entity="contract",
+            entity_id=None,
+            since=datetime(2025, 1, 1).astimezone(),  # Entered in local time
+            limit=None,
+        )
+
+    @patch("commands.audit_commands.DatabaseConnection.get_read_session")
+    @patch("commands.audit_commands.AuditRepository")
+    @patch("commands.audit_commands.AuthService")
+    def test_list_audit_unauthorized(
+        self, mock_auth, mock_repo_class, mock_get_session, runner
+    ):
+        """Test audit log listing with a non-management user."""
+        mock_auth.return_value.has_permission.return_value = False
+
+        result = runner.invoke(audit, ["list"])
+
+        assert result.exit_code == 0
+        assert "Error: Only management users can view the audit log" in result.output
+        mock_repo_class.return_value.list.assert_not_called()
+
+    @patch("commands.audit_commands.DatabaseConnection.get_read_session")
+    @patch("commands.audit_commands.AuditRepository")
+    @patch("commands.audit_commands.AuthService")
+    def test_list_audit_invalid_since(
+        self, mock_auth, mock_repo_class, mock_get_session, runner
+    ):
+        """Test audit log listing with an invalid date."""
+        mock_auth.return_value.has_permission.return_value = True
+
+        result = runner.invoke(audit, ["list", "--since", "yesterday"])
+
+        assert result.exit_code == 0
+        assert "Error: Invalid date format" in result.output
+        mock_repo_class.return_value.list.assert_not_called()
+
+    @patch("commands.audit_commands.AuditRepository")
+    @patch("commands.audit_commands.AuthService")
+    def test_list_audit_unaudited_entity(self, mock_auth, mock_repo_class, runner):
+        """Test that only audited entities can be filtered on."""
+        mock_auth.return_value.has_permission.return_value = True
+
+        result = runner.invoke(audit, ["list", "--entity", "client"])
+
+        assert result.exit_code != 0
+        assert "Invalid value for '--entity'" in result.output
+        mock_repo_class.return_value.list.assert_not_called()
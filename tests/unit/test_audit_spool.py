@@ -0,0 +1,90 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from logging_config import AuditSpool, log_contract_signature
+
+
+@pytest.fixture
+def spool(tmp_path):
+    """Create an audit spool with a long flush interval."""
+    spool = AuditSpool(tmp_path / "audit.jsonl", flush_interval=60)
+    yield spool
+    spool.close(timeout=1)
+
+
+@patch("logging_config.sentry_sdk")
+def test_put_appends_to_spool_file(mock_sentry, spool):
+    """Test that spooling writes a line without calling Sentry"""
+    spool.put("Employee created: Test User", extras={"action": "created"})
+    spool.put("Employee deleted: Test User", extras={"action": "deleted"})
+
+    lines = spool.path.read_text().splitlines()
+    assert [json.loads(line)["message"] for line in lines] == [
+        "Employee created: Test User",
+        "Employee deleted: Test User",
+    ]
+    mock_sentry.capture_message.assert_not_called()
+
+
+@patch("logging_config.sentry_sdk")
+def test_deliver_sends_batch_and_empties_spool(mock_sentry, spool):
+    """Test that delivery captures every spooled message once"""
+    spool.put("Contract signed: Contract ID 1", extras={"contract_id": 1})
+    spool.put("Contract signed: Contract ID 2", extras={"contract_id": 2})
+
+    assert spool.deliver() == 2
+    assert spool.deliver() == 0
+
+    assert mock_sentry.capture_message.call_count == 2
+    mock_sentry.capture_message.assert_any_call(
+        "Contract signed: Contract ID 2", level="info", extras={"contract_id": 2}
+    )
+    assert not spool.path.exists()
+
+
+@patch("logging_config.sentry_sdk")
+def test_messages_stay_spooled_until_flushed(mock_sentry, spool):
+    """Test that a delivery interrupted before the flush loses nothing"""
+    spool.put("Contract signed: Contract ID 1")
+    mock_sentry.flush.side_effect = SystemExit  # Thread stopped mid-flush
+
+    with pytest.raises(SystemExit):
+        spool.deliver()
+
+    assert len(spool.path.read_text().splitlines()) == 1
+
+
+@patch("logging_config.sentry_sdk")
+def test_messages_spooled_during_delivery_are_kept(mock_sentry, spool):
+    """Test that only the delivered messages are removed from the spool"""
+    spool.put("Contract signed: Contract ID 1")
+    mock_sentry.flush.side_effect = lambda: spool.put("Contract signed: Contract ID 2")
+
+    assert spool.deliver() == 1
+
+    lines = spool.path.read_text().splitlines()
+    assert [json.loads(line)["message"] for line in lines] == [
+        "Contract signed: Contract ID 2"
+    ]
+
+
+@patch("logging_config.sentry_sdk")
+def test_close_flushes_remaining_messages(mock_sentry, spool):
+    """Test that closing delivers spooled messages in the background thread"""
+    spool.put("Employee updated: Test User")
+
+    spool.close(timeout=5)
+
+    mock_sentry.capture_message.assert_called_once()
+    mock_sentry.flush.assert_called_once()
+    assert not spool.path.exists()
+
+
+@patch("logging_config.get_audit_spool")
+def test_audit_not_spooled_without_sentry_transport(mock_get_spool):
+    """Test that nothing is spooled when Sentry is not configured"""
+    log_contract_signature({"id": 1, "client_id": 1, "total_amount": 1000.0})
+
+    mock_get_spool.assert_not_called()
@@ -0,0 +1,23 @@
+import json
+
+from benchmarks.run import main
+from database.connection import DatabaseConnection
+
+
+def test_runner_completes_on_a_tiny_database(tmp_path, monkeypatch):
+    """Test that every repository and CLI benchmark runs without error"""
+    # The runner points DATABASE_URL at its own databases; restore it after
+    monkeypatch.setenv("DATABASE_URL", "sqlite://")
+    monkeypatch.setenv("JWT_SECRET", "test-secret")
+    monkeypatch.setenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:1000")
+    output = tmp_path / "results.json"
+
+    try:
+        main(["--sizes", "5", "--repeat", "1", "--output", str(output)])
+    finally:
+        DatabaseConnection.dispose()
+
+    results = json.loads(output.read_text())["results"]
+    names = {result["name"] for result in results}
+    assert {"contract.delete", "cli.contract update"} <= names
+    assert all(result["runs"] == 1 for result in results)
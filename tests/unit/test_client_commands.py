@@ -306,7 +306,7 @@ class TestClientCommands:
         assert "Error: You can only update clients assigned to you" in result.output
         mock_repository.update.assert_not_called()
 
-    @patch("commands.client_commands.DatabaseConnection.get_session")
+    @patch("commands.client_commands.DatabaseConnection.get_read_session")
     @patch("commands.client_commands.ClientRepository")
     @patch("commands.client_commands.AuthService")
     def test_list_clients_success(
@@ -335,7 +335,7 @@ class TestClientCommands:
         assert "Commercial: Test Commercial" in result.output
         mock_repository.get_all.assert_called_once()
 
-    @patch("commands.client_commands.DatabaseConnection.get_session")
+    @patch("commands.client_commands.DatabaseConnection.get_read_session")
     @patch("commands.client_commands.ClientRepository")
     @patch("commands.client_commands.AuthService")
     def test_list_clients_empty(
@@ -360,7 +360,7 @@ class TestClientCommands:
         assert "No clients found" in result.output
         mock_repository.get_all.assert_called_once()
 
-    @patch("commands.client_commands.DatabaseConnection.get_session")
+    @patch("commands.client_commands.DatabaseConnection.get_read_session")
     @patch("commands.client_commands.ClientRepository")
     @patch("commands.client_commands.AuthService")
     def test_list_clients_unauthorized(
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from click.testing import CliRunner
+from sqlalchemy.orm.exc import StaleDataError
 from commands.contract_commands import contract
 from models.models import Department, Contract, Client, Employee
 from decimal import Decimal
@@ -473,7 +474,7 @@ class TestContractCommands:
         assert "Error: Contract with ID 999 not found" in result.output
         mock_repository.update.assert_not_called()
 
-    @patch("commands.contract_commands.DatabaseConnection.get_session")
+    @patch("commands.contract_commands.DatabaseConnection.get_read_session")
     @patch("commands.contract_commands.ContractRepository")
     @patch("commands.contract_commands.AuthService")
     def test_list_contracts_success(
@@ -501,7 +502,7 @@ class TestContractCommands:
         assert "Signed: False" in result.output
         mock_repository.get_all.assert_called_once()
 
-    @patch("commands.contract_commands.DatabaseConnection.get_session")
+    @patch("commands.contract_commands.DatabaseConnection.get_read_session")
     @patch("commands.contract_commands.ContractRepository")
     @patch("commands.contract_commands.AuthService")
     def test_list_contracts_empty(
@@ -608,7 +609,7 @@ class TestContractCommands:
         assert "Error: You can only update contracts assigned to you" in result.output
         mock_repository.update.assert_not_called()
 
-    @patch("commands.contract_commands.DatabaseConnection.get_session")
+    @patch("commands.contract_commands.DatabaseConnection.get_read_session")
     @patch("commands.contract_commands.ContractRepository")
     @patch("commands.contract_commands.AuthService")
     def test_list_contracts_unsigned(
@@ -633,7 +634,7 @@ class TestContractCommands:
         assert "Signed: False" in result.output
         mock_repository.get_unsigned_contracts.assert_called_once()
 
-    @patch("commands.contract_commands.DatabaseConnection.get_session")
+    @patch("commands.contract_commands.DatabaseConnection.get_read_session")
     @patch("commands.contract_commands.ContractRepository")
     @patch("commands.contract_commands.AuthService")
     def test_list_contracts_unpaid(
@@ -658,7 +659,62 @@ class TestContractCommands:
         assert "Remaining Amount: 500.00" in result.output
         mock_repository.get_unpaid_contracts.assert_called_once()
 
-    @patch("commands.contract_commands.DatabaseConnection.get_session")
+    @patch("commands.contract_commands.DatabaseConnection.get_read_session")
+    @patch("commands.contract_commands.ContractRepository")
+    @patch("commands.contract_commands.AuthService")
+    def test_list_contracts_without_events(
+        self,
+        mock_auth,
+        mock_repo_class,
+        mock_get_session,
+        runner,
+        mock_repository,
+        mock_session,
+        mock_auth_service,
+    ):
+        """Test listing signed contracts without events."""
+        mock_get_session.return_value.__enter__.return_value = mock_session
+        mock_repo_class.return_value = mock_repository
+        mock_auth.return_value = mock_auth_service
+        mock_repository.get_without_events.return_value = []
+
+        result = runner.invoke(contract, ["list", "--without-events"])
+
+        assert result.exit_code == 0
+        assert "No contracts found" in result.output
+        mock_repository.get_without_events.assert_called_once()
+        mock_repository.get_all.assert_not_called()
+
+    @patch("commands.contract_commands.DatabaseConnection.get_read_session")
+    @patch("commands.contract_commands.ContractRepository")
+    @patch("commands.contract_commands.AuthService")
+    def test_list_contracts_next_event_before(
+        self,
+        mock_auth,
+        mock_repo_class,
+        mock_get_session,
+        runner,
+        mock_repository,
+        mock_session,
+        mock_auth_service,
+    ):
+        """Test listing contracts with an upcoming event before a date."""
+        mock_get_session.return_value.__enter__.return_value = mock_session
+        mock_repo_class.return_value = mock_repository
+        mock_auth.return_value = mock_auth_service
+        mock_repository.get_with_next_event_before.return_value = (
+            mock_repository.get_all.return_value
+        )
+
+        result = runner.invoke(contract, ["list", "--next-event-before", "2025-06-01"])
+
+        assert result.exit_code == 0
+        assert "Contract ID: 1" in result.output
+        mock_repository.get_with_next_event_before.assert_called_once_with(
+            datetime(2025, 6, 1).astimezone()
+        )
+
+    @patch("commands.contract_commands.DatabaseConnection.get_read_session")
     @patch("commands.contract_commands.ContractRepository")
     @patch("commands.contract_commands.AuthService")
     def test_list_contracts_commercial(
@@ -888,3 +944,207 @@ class TestContractCommands:
             in result.output
         )
         mock_repository.update.assert_not_called()
+
+    @patch("commands.contract_commands.DatabaseConnection.get_read_session")
+    @patch("commands.contract_commands.ContractRepository")
+    @patch("commands.contract_commands.AuthService")
+    def test_contract_summary(
+        self,
+        mock_auth,
+        mock_repo_class,
+        mock_get_read_session,
+        runner,
+        mock_repository,
+        mock_session,
+        mock_auth_service,
+    ):
+        """Test showing the contract totals of a commercial."""
+        mock_get_read_session.return_value.__enter__.return_value = mock_session
+        mock_repo_class.return_value = mock_repository
+        mock_auth.return_value = mock_auth_service
+        mock_repository.get_totals.return_value = {
+            "contracts": 2,
+            "total_amount": Decimal("3000.00"),
+            "remaining_amount": Decimal("1000.50"),
+            "paid_amount": Decimal("1999.50"),
+        }
+
+        result = runner.invoke(contract, ["summary", "--commercial-id", "1"])
+
+        assert result.exit_code == 0
+        assert "Contracts: 2" in result.output
+        assert "Total Amount: 3000.00" in result.output
+        assert "Paid Amount: 1999.50" in result.output
+        assert "Remaining Amount: 1000.50" in result.output
+        mock_repository.get_totals.assert_called_once_with(1)
+
+    @patch("commands.contract_commands.DatabaseConnection.get_session")
+    @patch("commands.contract_commands.PaymentRepository")
+    @patch("commands.contract_commands.ContractRepository")
+    @patch("commands.contract_commands.AuthService")
+    def test_pay_contract_success(
+        self,
+        mock_auth,
+        mock_repo_class,
+        mock_payment_repo_class,
+        mock_get_session,
+        runner,
+        mock_repository,
+        mock_session,
+        mock_auth_service,
+    ):
+        """Test recording a payment on an owned contract."""
+        mock_get_session.return_value.__enter__.return_value = mock_session
+        mock_repo_class.return_value = mock_repository
+        mock_auth.return_value = mock_auth_service
+        mock_payment_repo_class.return_value.pay.return_value = Mock(
+            amount=Decimal("100.00")
+        )
+
+        result = runner.invoke(
+            contract, ["pay", "--contract-id", "1", "--amount", "100.00"]
+        )
+
+        assert result.exit_code == 0
+        assert "Recorded payment of 100.00 on contract 1" in result.output
+        mock_payment_repo_class.return_value.pay.assert_called_once_with(
+            1, Decimal("100.00"), 1
+        )
+
+    @patch("commands.contract_commands.DatabaseConnection.get_session")
+    @patch("commands.contract_commands.PaymentRepository")
+    @patch("commands.contract_commands.ContractRepository")
+    @patch("commands.contract_commands.AuthService")
+    def test_pay_contract_more_than_remaining(
+        self,
+        mock_auth,
+        mock_repo_class,
+        mock_payment_repo_class,
+        mock_get_session,
+        runner,
+        mock_repository,
+        mock_session,
+        mock_auth_service,
+    ):
+        """Test that a payment above the remaining amount is refused."""
+        mock_get_session.return_value.__enter__.return_value = mock_session
+        mock_repo_class.return_value = mock_repository
+        mock_auth.return_value = mock_auth_service
+        mock_payment_repo_class.return_value.pay.return_value = None
+
+        result = runner.invoke(
+            contract, ["pay", "--contract-id", "1", "--amount", "600.00"]
+        )
+
+        assert result.exit_code == 0
+        assert "Error: Amount is greater than the remaining amount" in result.output
+
+    @patch("commands.contract_commands.PaymentRepository")
+    @patch("commands.contract_commands.AuthService")
+    def test_pay_contract_invalid_amount(
+        self, mock_auth, mock_payment_repo_class, runner, mock_auth_service
+    ):
+        """Test that a payment amount must be a positive number."""
+        mock_auth.return_value = mock_auth_service
+
+        for amount in ("abc", "0", "-5", "0.001", "10.005"):
+            result = runner.invoke(
+                contract, ["pay", "--contract-id", "1", "--amount", amount]
+            )
+            assert result.exit_code == 0
+            assert "Error:" in result.output
+        mock_payment_repo_class.return_value.pay.assert_not_called()
+
+    @patch("commands.contract_commands.DatabaseConnection.get_read_session")
+    @patch("commands.contract_commands.PaymentRepository")
+    @patch("commands.contract_commands.AuthService")
+    def test_reconcile_payments(
+        self, mock_auth, mock_payment_repo_class, mock_get_read_session, runner
+    ):
+        """Test listing the contracts whose balance differs from the ledger."""
+        mock_get_read_session.return_value.__enter__.return_value = Mock()
+        mock_auth.return_value.has_permission.return_value = True
+        mock_payment_repo_class.return_value.reconcile.return_value = [
+            {
+                "contract_id": 2,
+                "total_amount": Decimal("100.00"),
+                "remaining_amount": Decimal("70.00"),
+                "paid_amount": Decimal("0.00"),
+                "payments": 0,
+                "difference": Decimal("30.00"),
+            }
+        ]
+
+        result = runner.invoke(contract, ["reconcile"])
+
+        assert result.exit_code == 0
+        assert "Contract ID: 2" in result.output
+        assert "Difference: 30.00" in result.output
+        mock_payment_repo_class.return_value.reconcile.assert_called_once_with(
+            mismatched_only=True
+        )
+
+    @patch("commands.contract_commands.DatabaseConnection.get_session")
+    @patch("commands.contract_commands.ContractRepository")
+    @patch("commands.contract_commands.AuthService")
+    def test_update_contract_concurrent_change(
+        self,
+        mock_auth,
+        mock_repo_class,
+        mock_get_session,
+        runner,
+        mock_repository,
+        mock_session,
+        mock_auth_service,
+    ):
+        """Test that a contract changed during the update is reported."""
+        mock_get_session.return_value.__enter__.return_value = mock_session
+        mock_repo_class.return_value = mock_repository
+        mock_auth.return_value = mock_auth_service
+        mock_repository.update.side_effect = StaleDataError()
+
+        result = runner.invoke(
+            contract,
+            ["update", "--contract-id", "1", "--total-amount", "2000.00"],
+            input="\n\n",
+        )
+
+        assert result.exit_code == 0
+        assert "Error: Contract 1 was changed by another user" in result.output
+
+    @patch("commands.contract_commands.DatabaseConnection.get_session")
+    @patch("commands.contract_commands.ContractRepository")
+    @patch("commands.contract_commands.AuthService")
+    def test_update_contract_expected_version(
+        self,
+        mock_auth,
+        mock_repo_class,
+        mock_get_session,
+        runner,
+        mock_repository,
+        mock_session,
+        mock_auth_service,
+    ):
+        """Test that an update based on an outdated listing is refused."""
+        mock_get_session.return_value.__enter__.return_value = mock_session
+        mock_repo_class.return_value = mock_repository
+        mock_auth.return_value = mock_auth_service
+        mock_repository.get_by_id.return_value.version = 2
+
+        result = runner.invoke(
+            contract,
+            [
+                "update",
+                "--contract-id",
+                "1",
+                "--total-amount",
+                "2000.00",
+                "--expected-version",
+                "1",
+            ],
+            input="\n\n",
+        )
+
+        assert result.exit_code == 0
+        assert "Error: Contract 1 was changed by another user" in result.output
+        mock_repository.update.assert_not_called()
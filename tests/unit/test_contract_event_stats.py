@@ -0,0 +1,132 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, insert, inspect, text, update
+from sqlalchemy.orm import Session
+
+from models.models import Client, Contract, Event
+from repositories.contract_repository import ContractRepository
+from repositories.event_repository import EventRepository
+from utils.migrate import migrate
+
+NOW = datetime.now(UTC)
+
+
+@pytest.fixture
+def contracts(sqlite_session):
+    """Create a client with two signed contracts and one unsigned contract."""
+    sqlite_session.add(Client(id=1, full_name="Test Client", email="c@example.com"))
+    sqlite_session.add_all(
+        Contract(
+            id=contract_id,
+            client_id=1,
+            total_amount=1000,
+            remaining_amount=0,
+            is_signed=contract_id != 3,
+        )
+        for contract_id in (1, 2, 3)
+    )
+    sqlite_session.commit()
+    return {c.id: c for c in sqlite_session.query(Contract)}
+
+
+def event_data(contract_id, days):
+    start_date = NOW + timedelta(days=days)
+    return {
+        "contract_id": contract_id,
+        "name": f"Event in {days} days",
+        "start_date": start_date,
+        "end_date": start_date + timedelta(hours=2),
+    }
+
+
+def test_event_writes_maintain_contract_columns(sqlite_session, contracts):
+    """Test that creating, moving and deleting events updates their contracts"""
+    repo = EventRepository(sqlite_session)
+    repo.create(event_data(1, 10))
+    soon = repo.create(event_data(1, 2))
+    repo.create(event_data(1, -5))  # Past events are counted but not upcoming
+
+    assert contracts[1].event_count == 3
+    assert contracts[1].next_event_date == NOW + timedelta(days=2)
+
+    repo.update(soon.id, {"contract_id": 2})
+    assert contracts[1].event_count == 2
+    assert contracts[1].next_event_date == NOW + timedelta(days=10)
+    assert contracts[2].event_count == 1
+
+    repo.delete(soon.id)
+    assert contracts[2].event_count == 0
+    assert contracts[2].next_event_date is None
+
+
+def test_get_without_events(sqlite_session, contracts):
+    """Test that only signed contracts without events are returned"""
+    EventRepository(sqlite_session).create(event_data(1, 3))
+
+    without_events = ContractRepository(sqlite_session).get_without_events()
+
+    assert [contract.id for contract in without_events] == [2]
+
+
+def test_get_with_next_event_before(sqlite_session, contracts):
+    """Test filtering on the next upcoming event, even when it has passed since"""
+    repo = EventRepository(sqlite_session)
+    repo.create(event_data(1, 3))
+    repo.create(event_data(2, 20))
+    # Contract 2's stored next event started after the last refresh
+    repo.create(event_data(2, 5))
+    sqlite_session.execute(
+        update(Contract)
+        .where(Contract.id == 2)
+        .values(next_event_date=NOW - timedelta(days=1))
+    )
+    sqlite_session.commit()
+
+    before = NOW + timedelta(days=10)
+    contracts_found = ContractRepository(sqlite_session).get_with_next_event_before(
+        before
+    )
+
+    assert [contract.id for contract in contracts_found] == [2, 1]
+    later = ContractRepository(sqlite_session).get_with_next_event_before(
+        NOW + timedelta(days=1)
+    )
+    assert later == []
+
+
+def test_migrate_adds_and_backfills_columns(tmp_path):
+    """Test that an existing database gets the contract event columns"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE contract (id INTEGER PRIMARY KEY, client_id INTEGER, "
+                "commercial_id INTEGER, total_amount NUMERIC(10, 2) NOT NULL, "
+                "remaining_amount NUMERIC(10, 2) NOT NULL, created_at DATETIME, "
+                "is_signed BOOLEAN)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE TABLE event (id INTEGER PRIMARY KEY, contract_id INTEGER, "
+                "support_id INTEGER, name VARCHAR NOT NULL, "
+                "start_date DATETIME NOT NULL, end_date DATETIME NOT NULL, "
+                "location VARCHAR, attendees INTEGER, notes VARCHAR)"
+            )
+        )
+        conn.execute(
+            text("INSERT INTO contract VALUES (1, NULL, NULL, 10, 0, NULL, 1)")
+        )
+        # Only the columns of the old table
+        conn.execute(insert(Event.__table__), [event_data(1, 4), event_data(1, -4)])
+
+    migrate(engine)
+    migrate(engine)  # Running again changes nothing
+
+    columns = {c["name"] for c in inspect(engine).get_columns("contract")}
+    assert {"event_count", "next_event_date"} <= columns
+    with Session(engine) as session:
+        contract = session.get(Contract, 1)
+        assert contract.event_count == 2
+        assert contract.next_event_date == NOW + timedelta(days=4)
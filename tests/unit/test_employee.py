@@ -1,6 +1,16 @@
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
 import pytest
-from models.models import Employee, Department
-from werkzeug.security import check_password_hash
+from models.models import (
+    Client,
+    Contract,
+    Department,
+    Employee,
+    get_password_hash_method,
+)
+from repositories.employee_repository import EmployeeRepository
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, check_password_hash
 
 
 @pytest.fixture
@@ -74,3 +84,161 @@ def test_password_hash_uniqueness(employee):
     hash2 = employee._password_hash
 
     assert hash1 != hash2
+
+
+def test_password_hash_method_configurable(employee, monkeypatch):
+    """Test that the hashing policy is read from the environment"""
+    monkeypatch.setenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:1000")
+    employee.password = "secure_password123"
+
+    assert employee._password_hash.startswith("pbkdf2:sha256:1000$")
+    assert employee.password_hash_method == "pbkdf2:sha256:1000"
+    assert employee.verify_password("secure_password123")
+
+
+def test_password_needs_rehash(employee, monkeypatch):
+    """Test that a policy change flags existing hashes for rehash"""
+    monkeypatch.setenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:1000")
+    employee.password = "secure_password123"
+    assert not employee.password_needs_rehash()
+
+    monkeypatch.setenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:2000")
+    assert employee.password_needs_rehash()
+
+
+@pytest.mark.parametrize("method", ["pbkdf2", "pbkdf2:sha256", "scrypt"])
+def test_short_password_hash_method_needs_no_rehash(employee, monkeypatch, method):
+    """Test that short policies compare equal to the expanded hash prefix"""
+    monkeypatch.setenv("PASSWORD_HASH_METHOD", method)
+    employee.password = "secure_password123"
+
+    assert employee.password_hash_method.startswith(method)
+    assert not employee.password_needs_rehash()
+
+
+def test_short_password_hash_method_is_expanded_without_hashing(monkeypatch):
+    """Test that the defaults are filled in without paying for a hash"""
+    monkeypatch.setenv("PASSWORD_HASH_METHOD", "pbkdf2:sha512")
+
+    with patch("models.models.generate_password_hash") as generate:
+        method = get_password_hash_method()
+
+    generate.assert_not_called()
+    assert method == f"pbkdf2:sha512:{DEFAULT_PBKDF2_ITERATIONS}"
+
+
+def test_verify_credentials_rehashes_outdated_hash(employee, monkeypatch):
+    """Test that a successful login upgrades the hash to the current policy"""
+    monkeypatch.setenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:1000")
+    employee.password = "secure_password123"
+    session = Mock()
+    repository = EmployeeRepository(session)
+    repository.get_by_email = Mock(return_value=employee)
+
+    monkeypatch.setenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:2000")
+    is_valid, _ = repository.verify_credentials(
+        "test@example.com", "secure_password123"
+    )
+
+    assert is_valid
+    assert employee.password_hash_method == "pbkdf2:sha256:2000"
+    session.commit.assert_called_once()
+
+
+def test_verify_credentials_keeps_current_hash(employee, monkeypatch):
+    """Test that no write happens when the hash matches the policy"""
+    monkeypatch.setenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:1000")
+    employee.password = "secure_password123"
+    session = Mock()
+    repository = EmployeeRepository(session)
+    repository.get_by_email = Mock(return_value=employee)
+
+    is_valid, _ = repository.verify_credentials(
+        "test@example.com", "secure_password123"
+    )
+
+    assert is_valid
+    session.commit.assert_not_called()
+
+
+def test_bulk_create_hashes_passwords(monkeypatch):
+    """Test that bulk creation hashes every password with the current policy"""
+    monkeypatch.setenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:1000")
+    session = Mock()
+    repository = EmployeeRepository(session)
+
+    employees = repository.bulk_create(
+        [
+            {
+                "full_name": f"User {i}",
+                "email": f"user{i}@example.com",
+                "department": "support",
+                "role": "Support",
+                "password": f"password{i}",
+            }
+            for i in range(3)
+        ],
+        max_workers=2,
+    )
+
+    assert len(employees) == 3
+    for i, created in enumerate(employees):
+        assert created.department == Department.SUPPORT
+        assert created.password_hash_method == "pbkdf2:sha256:1000"
+        assert created.verify_password(f"password{i}")
+    session.add_all.assert_called_once_with(employees)
+    session.commit.assert_called_once()
+
+
+def test_reassign_moves_portfolio_in_one_update_per_table(
+    sqlite_session, query_profiler
+):
+    """Test that reassigning runs one UPDATE per table, not one per row"""
+    leaving, taking, other = (
+        Employee(
+            employee_number=f"EMP00{i}",
+            full_name=f"User {i}",
+            email=f"user{i}@example.com",
+            department=Department.COMMERCIAL,
+            role="Sales",
+            _password_hash="hash",
+        )
+        for i in range(3)
+    )
+    sqlite_session.add_all([leaving, taking, other])
+    sqlite_session.flush()
+    clients = [
+        Client(full_name=f"Client {i}", email=f"c{i}@example.com", commercial=leaving)
+        for i in range(20)
+    ]
+    kept = Client(full_name="Kept", email="kept@example.com", commercial=other)
+    contracts = [
+        Contract(
+            client=client,
+            commercial=leaving,
+            total_amount=Decimal("100.00"),
+            remaining_amount=Decimal("0.00"),
+        )
+        for client in clients
+    ]
+    sqlite_session.add_all([*clients, kept, *contracts])
+    sqlite_session.commit()
+    repository = EmployeeRepository(sqlite_session)
+
+    assert repository.count_assignments(leaving, Department.COMMERCIAL) == {
+        "client": 20,
+        "contract": 20,
+    }
+    sqlite_session.refresh(taking)  # Only count the reassignment itself
+    query_profiler.reset()
+    counts = repository.reassign(leaving, taking, Department.COMMERCIAL)
+
+    assert counts == {"client": 20, "contract": 20}
+    # One UPDATE per table and the audit entry
+    assert query_profiler.count == 3
+    assert all(client.commercial_id == taking.id for client in clients)
+    assert kept.commercial_id == other.id
+    assert repository.count_assignments(leaving, Department.COMMERCIAL) == {
+        "client": 0,
+        "contract": 0,
+    }
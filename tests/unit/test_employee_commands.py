@@ -311,7 +311,7 @@ class TestEmployeeCommands:
             in result.output
         )
 
-    @patch("commands.employee_commands.DatabaseConnection.get_session")
+    @patch("commands.employee_commands.DatabaseConnection.get_read_session")
     @patch("commands.employee_commands.EmployeeRepository")
     @patch("commands.employee_commands.AuthService")
     def test_list_employees_success(
@@ -351,7 +351,7 @@ class TestEmployeeCommands:
         assert "Employee Number: TEST123" in result.output
         mock_repository.get_all.assert_called_once()
 
-    @patch("commands.employee_commands.DatabaseConnection.get_session")
+    @patch("commands.employee_commands.DatabaseConnection.get_read_session")
     @patch("commands.employee_commands.EmployeeRepository")
     @patch("commands.employee_commands.AuthService")
     def test_list_employees_empty(
@@ -385,3 +385,245 @@ class TestEmployeeCommands:
         assert result.exit_code == 0
         assert "No employees found" in result.output
         mock_repository.get_all.assert_called_once()
+
+    @patch("commands.employee_commands.DatabaseConnection.get_session")
+    @patch("commands.employee_commands.EmployeeRepository")
+    @patch("commands.employee_commands.AuthService")
+    def test_import_employees_success(
+        self,
+        mock_auth,
+        mock_repo_class,
+        mock_get_session,
+        runner,
+        mock_repository,
+        mock_session,
+    ):
+        """Test successful bulk employee import."""
+        mock_get_session.return_value.__enter__.return_value = mock_session
+        mock_repo_class.return_value = mock_repository
+        mock_repository.get_existing_emails.return_value = set()
+        mock_repository.bulk_create.return_value = mock_repository.get_all.return_value
+
+        # Mock AuthService to return management permissions
+        mock_auth_instance = Mock()
+        mock_auth_instance.has_permission.return_value = True
+        mock_auth.return_value = mock_auth_instance
+
+        with runner.isolated_filesystem():
+            with open("employees.csv", "w") as csv_file:
+                csv_file.write("full_name,email,department,role,password\n")
+                csv_file.write("Test User,test@example.com,commercial,Sales,Pass1!\n")
+
+            result = runner.invoke(employee, ["import", "--file", "employees.csv"])
+
+        assert result.exit_code == 0
+        assert "Successfully imported 1 employees" in result.output
+        mock_repository.bulk_create.assert_called_once_with(
+            [
+                {
+                    "full_name": "Test User",
+                    "email": "test@example.com",
+                    "department": "commercial",
+                    "role": "Sales",
+                    "password": "Pass1!",
+                }
+            ]
+        )
+
+    @patch("commands.employee_commands.DatabaseConnection.get_session")
+    @patch("commands.employee_commands.EmployeeRepository")
+    @patch("commands.employee_commands.AuthService")
+    def test_import_employees_existing_email(
+        self,
+        mock_auth,
+        mock_repo_class,
+        mock_get_session,
+        runner,
+        mock_repository,
+        mock_session,
+    ):
+        """Test bulk employee import with an already registered email."""
+        mock_get_session.return_value.__enter__.return_value = mock_session
+        mock_repo_class.return_value = mock_repository
+        mock_repository.get_existing_emails.return_value = {"test@example.com"}
+
+        # Mock AuthService to return management permissions
+        mock_auth_instance = Mock()
+        mock_auth_instance.has_permission.return_value = True
+        mock_auth.return_value = mock_auth_instance
+
+        with runner.isolated_filesystem():
+            with open("employees.csv", "w") as csv_file:
+                csv_file.write("full_name,email,department,role,password\n")
+                csv_file.write("Test User,test@example.com,commercial,Sales,Pass1!\n")
+
+            result = runner.invoke(employee, ["import", "--file", "employees.csv"])
+
+        assert result.exit_code == 0
+        assert (
+            "Error: Employees with these emails already exist: test@example.com"
+            in result.output
+        )
+        mock_repository.bulk_create.assert_not_called()
+
+    @patch("commands.employee_commands.DatabaseConnection.get_session")
+    @patch("commands.employee_commands.EmployeeRepository")
+    @patch("commands.employee_commands.AuthService")
+    def test_import_employees_invalid_department(
+        self,
+        mock_auth,
+        mock_repo_class,
+        mock_get_session,
+        runner,
+        mock_repository,
+        mock_session,
+    ):
+        """Test bulk employee import with an unknown department."""
+        mock_get_session.return_value.__enter__.return_value = mock_session
+        mock_repo_class.return_value = mock_repository
+
+        # Mock AuthService to return management permissions
+        mock_auth_instance = Mock()
+        mock_auth_instance.has_permission.return_value = True
+        mock_auth.return_value = mock_auth_instance
+
+        with runner.isolated_filesystem():
+            with open("employees.csv", "w") as csv_file:
+                csv_file.write("full_name,email,department,role,password\n")
+                csv_file.write("Test User,test@example.com,finance,Sales,Pass1!\n")
+
+            result = runner.invoke(employee, ["import", "--file", "employees.csv"])
+
+        assert result.exit_code == 0
+        assert "Error: Line 2: invalid department finance" in result.output
+        mock_repository.bulk_create.assert_not_called()
+
+    @patch("commands.employee_commands.DatabaseConnection.unit_of_work")
+    @patch("commands.employee_commands.EmployeeRepository")
+    @patch("commands.employee_commands.AuthService")
+    def test_reassign_employee_success(
+        self,
+        mock_auth,
+        mock_repo_class,
+        mock_unit_of_work,
+        runner,
+        mock_repository,
+        mock_session,
+    ):
+        """Test moving the portfolio of a commercial to another one."""
+        mock_unit_of_work.return_value.__enter__.return_value = mock_session
+        mock_repo_class.return_value = mock_repository
+        leaving = Employee(
+            id=1, email="old@example.com", department=Department.COMMERCIAL
+        )
+        taking = Employee(
+            id=2, email="new@example.com", department=Department.COMMERCIAL
+        )
+        mock_repository.get_by_email.side_effect = [leaving, taking]
+        mock_repository.reassign.return_value = {"client": 3, "contract": 5}
+
+        # Mock AuthService to return management permissions
+        mock_auth_instance = Mock()
+        mock_auth_instance.has_permission.return_value = True
+        mock_auth.return_value = mock_auth_instance
+
+        result = runner.invoke(
+            employee,
+            ["reassign", "--from", "old@example.com", "--to", "new@example.com"],
+        )
+
+        assert result.exit_code == 0
+        assert "Moved 3 client(s) from old@example.com to new@example.com" in (
+            result.output
+        )
+        assert "Moved 5 contract(s)" in result.output
+        mock_repository.reassign.assert_called_once_with(
+            leaving, taking, Department.COMMERCIAL
+        )
+
+    @patch("commands.employee_commands.DatabaseConnection.unit_of_work")
+    @patch("commands.employee_commands.EmployeeRepository")
+    @patch("commands.employee_commands.AuthService")
+    def test_reassign_employee_dry_run(
+        self,
+        mock_auth,
+        mock_repo_class,
+        mock_unit_of_work,
+        runner,
+        mock_repository,
+        mock_session,
+    ):
+        """Test that a dry run only counts the assignments."""
+        mock_unit_of_work.return_value.__enter__.return_value = mock_session
+        mock_repo_class.return_value = mock_repository
+        leaving = Employee(
+            id=1, email="old@example.com", department=Department.SUPPORT
+        )
+        taking = Employee(
+            id=2, email="new@example.com", department=Department.SUPPORT
+        )
+        mock_repository.get_by_email.side_effect = [leaving, taking]
+        mock_repository.count_assignments.return_value = {"event": 4}
+
+        # Mock AuthService to return management permissions
+        mock_auth_instance = Mock()
+        mock_auth_instance.has_permission.return_value = True
+        mock_auth.return_value = mock_auth_instance
+
+        result = runner.invoke(
+            employee,
+            [
+                "reassign",
+                "--from",
+                "old@example.com",
+                "--to",
+                "new@example.com",
+                "--dry-run",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "Would move 4 event(s)" in result.output
+        mock_repository.count_assignments.assert_called_once_with(
+            leaving, Department.SUPPORT
+        )
+        mock_repository.reassign.assert_not_called()
+
+    @patch("commands.employee_commands.DatabaseConnection.unit_of_work")
+    @patch("commands.employee_commands.EmployeeRepository")
+    @patch("commands.employee_commands.AuthService")
+    def test_reassign_employee_department_mismatch(
+        self,
+        mock_auth,
+        mock_repo_class,
+        mock_unit_of_work,
+        runner,
+        mock_repository,
+        mock_session,
+    ):
+        """Test that assignments only move within a department."""
+        mock_unit_of_work.return_value.__enter__.return_value = mock_session
+        mock_repo_class.return_value = mock_repository
+        leaving = Employee(
+            id=1, email="old@example.com", department=Department.COMMERCIAL
+        )
+        taking = Employee(
+            id=2, email="new@example.com", department=Department.SUPPORT
+        )
+        mock_repository.get_by_email.side_effect = [leaving, taking]
+
+        # Mock AuthService to return management permissions
+        mock_auth_instance = Mock()
+        mock_auth_instance.has_permission.return_value = True
+        mock_auth.return_value = mock_auth_instance
+
+        result = runner.invoke(
+            employee,
+            ["reassign", "--from", "old@example.com", "--to", "new@example.com"],
+        )
+
+        assert result.exit_code == 0
+        assert "Error: new@example.com is not in the commercial department" in (
+            result.output
+        )
+        mock_repository.reassign.assert_not_called()
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from click.testing import CliRunner
+from sqlalchemy.orm.exc import StaleDataError
 from commands.event_commands import event
 from models.models import Department, Event, Contract, Client, Employee
 from datetime import datetime, UTC
@@ -364,6 +365,38 @@ class TestEventCommands:
         assert "Successfully updated event 1" in result.output
         mock_repository.update.assert_called_once()
 
+    @patch("commands.event_commands.DatabaseConnection.get_session")
+    @patch("commands.event_commands.EventRepository")
+    @patch("commands.event_commands.ContractRepository")
+    @patch("commands.event_commands.AuthService")
+    def test_update_event_concurrent_change(
+        self,
+        mock_auth,
+        mock_contract_repo_class,
+        mock_repo_class,
+        mock_get_session,
+        runner,
+        mock_repository,
+        mock_contract_repository,
+        mock_session,
+        mock_auth_service,
+    ):
+        """Test that an event changed during the update is reported."""
+        mock_get_session.return_value.__enter__.return_value = mock_session
+        mock_repo_class.return_value = mock_repository
+        mock_contract_repo_class.return_value = mock_contract_repository
+        mock_auth.return_value = mock_auth_service
+        mock_repository.update.side_effect = StaleDataError()
+
+        result = runner.invoke(
+            event,
+            ["update", "--event-id", "1", "--name", "Updated Event"],
+            input="\n" * 6,
+        )
+
+        assert result.exit_code == 0
+        assert "Error: Event 1 was changed by another user" in result.output
+
     @patch("commands.event_commands.DatabaseConnection.get_session")
     @patch("commands.event_commands.EventRepository")
     @patch("commands.event_commands.ContractRepository")
@@ -418,7 +451,7 @@ class TestEventCommands:
         )
         mock_repository.update.assert_not_called()
 
-    @patch("commands.event_commands.DatabaseConnection.get_session")
+    @patch("commands.event_commands.DatabaseConnection.get_read_session")
     @patch("commands.event_commands.EventRepository")
     @patch("commands.event_commands.ContractRepository")
     @patch("commands.event_commands.AuthService")
@@ -451,8 +484,12 @@ class TestEventCommands:
         assert "Location: Test Location" in result.output
         assert "Attendees: 10" in result.output
         assert "Notes: Test Notes" in result.output
+        # Dates are stored in UTC and shown in local time, like they are entered
+        listed = mock_repository.get_all.return_value[0]
+        assert f"Start Date: {listed.start_date.astimezone()}" in result.output
+        assert f"End Date: {listed.end_date.astimezone()}" in result.output
 
-    @patch("commands.event_commands.DatabaseConnection.get_session")
+    @patch("commands.event_commands.DatabaseConnection.get_read_session")
     @patch("commands.event_commands.EventRepository")
     @patch("commands.event_commands.ContractRepository")
     @patch("commands.event_commands.AuthService")
@@ -483,7 +520,7 @@ class TestEventCommands:
         assert result.exit_code == 0
         assert "No events found" in result.output
 
-    @patch("commands.event_commands.DatabaseConnection.get_session")
+    @patch("commands.event_commands.DatabaseConnection.get_read_session")
     @patch("commands.event_commands.EventRepository")
     @patch("commands.event_commands.ContractRepository")
     @patch("commands.event_commands.AuthService")
@@ -546,7 +583,7 @@ class TestEventCommands:
         assert "Support ID: None" in result.output
         mock_repository.get_without_support.assert_called_once()
 
-    @patch("commands.event_commands.DatabaseConnection.get_session")
+    @patch("commands.event_commands.DatabaseConnection.get_read_session")
     @patch("commands.event_commands.EventRepository")
     @patch("commands.event_commands.ContractRepository")
     @patch("commands.event_commands.AuthService")
@@ -0,0 +1,253 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.dialects import mysql, postgresql
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from database.backends import SQLiteBackend
+from database.profiling import profile_queries
+from models.models import (
+    Base,
+    Client,
+    Contract,
+    Department,
+    Employee,
+    Event,
+    Payment,
+)
+from repositories.client_repository import ClientRepository
+from repositories.contract_repository import ContractRepository
+from repositories.employee_repository import EmployeeRepository
+from utils.init_db import install_version_triggers
+from utils.migrate import migrate, replace_foreign_keys
+
+# Tables as created before foreign keys had ON DELETE rules
+OLD_SCHEMA = [
+    "CREATE TABLE employee (id INTEGER PRIMARY KEY, "
+    "employee_number VARCHAR NOT NULL UNIQUE, full_name VARCHAR NOT NULL, "
+    "email VARCHAR NOT NULL UNIQUE, password VARCHAR NOT NULL, "
+    "department VARCHAR(10) NOT NULL, role VARCHAR NOT NULL, "
+    "created_at DATETIME, updated_at DATETIME)",
+    "CREATE TABLE client (id INTEGER PRIMARY KEY, full_name VARCHAR NOT NULL, "
+    "email VARCHAR NOT NULL UNIQUE, phone VARCHAR, company_name VARCHAR, "
+    "created_at DATETIME, updated_at DATETIME, "
+    "commercial_id INTEGER REFERENCES employee (id))",
+    "CREATE TABLE contract (id INTEGER PRIMARY KEY, "
+    "client_id INTEGER REFERENCES client (id), "
+    "commercial_id INTEGER REFERENCES employee (id), "
+    "total_amount NUMERIC(10, 2) NOT NULL, "
+    "remaining_amount NUMERIC(10, 2) NOT NULL, "
+    "created_at DATETIME, is_signed BOOLEAN)",
+    "CREATE TABLE event (id INTEGER PRIMARY KEY, "
+    "contract_id INTEGER REFERENCES contract (id), "
+    "support_id INTEGER REFERENCES employee (id), name VARCHAR NOT NULL, "
+    "start_date DATETIME NOT NULL, end_date DATETIME NOT NULL, location VARCHAR, "
+    "attendees INTEGER, notes VARCHAR)",
+]
+
+
+def make_engine(url):
+    engine = create_engine(url)
+    SQLiteBackend().configure(engine)
+    return engine
+
+
+@pytest.fixture
+def engine():
+    """Create an in-memory database enforcing foreign keys."""
+    engine = make_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def add_commercial_with_portfolio(session, clients=20):
+    """Add a commercial with clients, each with a contract and an event."""
+    commercial = Employee(
+        id=1,
+        employee_number="EMP00001",
+        full_name="Test Commercial",
+        email="commercial@example.com",
+        department=Department.COMMERCIAL,
+        role="Sales",
+        _password_hash="hash",
+    )
+    session.add(commercial)
+    for i in range(1, clients + 1):
+        session.add(
+            Client(
+                id=i, full_name=f"Client {i}", email=f"c{i}@ex.com", commercial_id=1
+            )
+        )
+        session.add(
+            Contract(
+                id=i,
+                client_id=i,
+                commercial_id=1,
+                total_amount=100,
+                remaining_amount=0,
+                is_signed=True,
+            )
+        )
+        session.add(
+            Event(
+                contract_id=i,
+                support_id=1,
+                name=f"Event {i}",
+                start_date=datetime(2025, 6, 1, 9),
+                end_date=datetime(2025, 6, 1, 17),
+            )
+        )
+    session.commit()
+    session.expunge_all()
+
+
+def test_foreign_keys_are_enforced(engine):
+    """Test that rows cannot reference missing parents"""
+    with Session(engine) as session:
+        session.add(Contract(client_id=42, total_amount=1, remaining_amount=1))
+        with pytest.raises(IntegrityError, match="FOREIGN KEY"):
+            session.commit()
+
+
+@pytest.mark.parametrize("clients", [1, 50])
+def test_employee_delete_does_not_load_children(engine, clients):
+    """Test that deleting an employee costs the same statements at any size"""
+    with Session(engine) as session:
+        add_commercial_with_portfolio(session, clients)
+
+        with profile_queries(engine) as profiler:
+            assert EmployeeRepository(session).delete("commercial@example.com")
+
+        # SELECT employee, INSERT audit entry, DELETE employee
+        assert profiler.count == 3
+        assert session.query(Client).filter(Client.commercial_id == 1).count() == 0
+        assert session.query(Contract).count() == clients
+        assert session.query(Event).filter(Event.support_id == 1).count() == 0
+
+
+def test_client_delete_keeps_contracts(engine):
+    """Test that the contracts of a deleted client are kept, unassigned"""
+    with Session(engine) as session:
+        add_commercial_with_portfolio(session, 3)
+
+        with profile_queries(engine) as profiler:
+            assert ClientRepository(session).delete(2)
+
+        assert profiler.count == 2
+        assert session.get(Contract, 2).client_id is None
+        assert session.get(Contract, 1).client_id == 1
+
+
+def test_migrate_adds_delete_rules_to_existing_tables(tmp_path):
+    """Test that migrating rebuilds old tables with their rows and triggers"""
+    engine = make_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        for statement in OLD_SCHEMA:
+            conn.execute(text(statement))
+    Base.metadata.create_all(engine)
+    install_version_triggers(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO employee (id, employee_number, full_name, email, "
+                "password, department, role) VALUES "
+                "(1, 'EMP1', 'Test', 'e@ex.com', 'hash', 'COMMERCIAL', 'Sales')"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO client (id, full_name, email, commercial_id) "
+                "VALUES (1, 'Client', 'c@ex.com', 1)"
+            )
+        )
+
+    migrate(engine)
+    migrate(engine)  # Running again changes nothing
+
+    inspector = inspect(engine)
+    for table in ("client", "contract", "event"):
+        foreign_keys = inspector.get_foreign_keys(table)
+        assert {fk["options"].get("ondelete") for fk in foreign_keys} == {"SET NULL"}
+    assert "ix_client_commercial_id" in {
+        index["name"] for index in inspector.get_indexes("client")
+    }
+    with Session(engine) as session:
+        assert session.get(Client, 1).commercial_id == 1
+        EmployeeRepository(session).delete("e@ex.com")
+        assert session.get(Client, 1).commercial_id is None
+        version = session.execute(
+            text("SELECT version FROM table_version WHERE table_name = 'client'")
+        ).scalar()
+        # Insert and SET NULL update: the rebuilt table still has its triggers
+        assert version == 2
+
+
+def test_migrate_baseline_database(tmp_path):
+    """Test that migrating a database created before every new table allows writes"""
+    engine = make_engine(f"sqlite:///{tmp_path / 'baseline.db'}")
+    with engine.begin() as conn:
+        for statement in OLD_SCHEMA:
+            conn.execute(text(statement))
+        conn.execute(
+            text(
+                "INSERT INTO client (id, full_name, email) "
+                "VALUES (1, 'Client', 'c@ex.com')"
+            )
+        )
+
+    migrate(engine)
+
+    tables = set(inspect(engine).get_table_names())
+    assert {"audit_log", "payment", "table_version"} <= tables
+    with Session(engine) as session:
+        contract = ContractRepository(session).create(
+            {"client_id": 1, "total_amount": 100, "remaining_amount": 100}
+        )
+        assert contract.id is not None
+        versions = dict(
+            session.execute(
+                text("SELECT table_name, version FROM table_version")
+            ).all()
+        )
+        assert versions["contract"] == 1
+        assert versions["audit_log"] == 1
+
+
+@pytest.mark.parametrize(
+    "dialect, drop",
+    [
+        (postgresql.dialect(), "DROP CONSTRAINT"),
+        (mysql.dialect(), "DROP FOREIGN KEY"),
+    ],
+)
+def test_replace_foreign_keys_on_server_databases(dialect, drop):
+    """Test that only the foreign keys with another rule are recreated"""
+    conn = Mock(dialect=dialect)
+    reflected = [
+        {
+            "name": "payment_contract_id_fkey",
+            "constrained_columns": ["contract_id"],
+            "options": {},
+        },
+        {
+            "name": "payment_employee_id_fkey",
+            "constrained_columns": ["employee_id"],
+            "options": {"ondelete": "SET NULL"},
+        },
+    ]
+
+    replace_foreign_keys(conn, Payment.__table__, reflected)
+
+    statements = [
+        str(call.args[0].compile(dialect=dialect)).replace("`", "")
+        for call in conn.execute.call_args_list
+    ]
+    assert statements == [
+        f"ALTER TABLE payment {drop} payment_contract_id_fkey",
+        "ALTER TABLE payment ADD FOREIGN KEY(contract_id) "
+        "REFERENCES contract (id) ON DELETE RESTRICT",
+    ]
@@ -0,0 +1,73 @@
+from models.models import Client, Department, Employee
+from repositories.batch import get_many
+from repositories.client_repository import ClientRepository
+from repositories.employee_repository import EmployeeRepository
+
+
+def add_clients(session, count):
+    session.add_all(
+        Client(full_name=f"Client {i}", email=f"client{i}@example.com")
+        for i in range(count)
+    )
+    session.commit()
+    session.expunge_all()
+
+
+def test_get_many_keys_existing_rows_by_id(sqlite_session, query_profiler):
+    """Test that unknown IDs are left out and duplicates are fetched once"""
+    add_clients(sqlite_session, 5)
+    query_profiler.reset()
+
+    clients = ClientRepository(sqlite_session).get_many([4, 2, 99, 2])
+
+    assert sorted(clients) == [2, 4]
+    assert clients[4].email == "client3@example.com"
+    assert query_profiler.count == 1
+
+
+def test_get_many_queries_one_chunk_at_a_time(sqlite_session, query_profiler):
+    """Test that large batches cost one query per chunk of IDs"""
+    add_clients(sqlite_session, 25)
+    query_profiler.reset()
+
+    clients = get_many(sqlite_session, Client, range(1, 26), chunk_size=10)
+
+    assert len(clients) == 25
+    assert query_profiler.count == 3
+
+
+def test_get_many_reuses_loaded_objects(sqlite_session, query_profiler):
+    """Test that objects already in the session are not queried again"""
+    add_clients(sqlite_session, 3)
+    repo = ClientRepository(sqlite_session)
+    loaded = repo.get_by_id(1)
+    query_profiler.reset()
+
+    clients = repo.get_many([1, 2])
+
+    assert clients[1] is loaded
+    assert query_profiler.count == 1
+    query_profiler.reset()
+    assert repo.get_many([1, 2]) == clients
+    assert query_profiler.count == 0
+
+
+def test_employee_get_many(sqlite_session):
+    """Test batch lookups on the employee repository"""
+    sqlite_session.add(
+        Employee(
+            employee_number="EMP00001",
+            full_name="Test Support",
+            email="support@example.com",
+            department=Department.SUPPORT,
+            role="Support",
+            _password_hash="hash",
+        )
+    )
+    sqlite_session.commit()
+
+    employees = EmployeeRepository(sqlite_session).get_many([1, 2])
+
+    assert [employee.email for employee in employees.values()] == [
+        "support@example.com"
+    ]
@@ -0,0 +1,116 @@
+import json
+from unittest.mock import Mock, patch
+
+from click.testing import CliRunner
+
+from epicevents import cli
+from metrics import (
+    SECONDS_BUCKETS,
+    CommandMetrics,
+    estimate_quantile,
+    new_histogram,
+    observe,
+    render_prometheus,
+    update_state,
+)
+from models.models import Client
+
+
+def test_observe_fills_matching_bucket():
+    """Test that values land in the first bucket whose bound they don't exceed"""
+    histogram = new_histogram(SECONDS_BUCKETS)
+    observe(histogram, SECONDS_BUCKETS, 0.004)
+    observe(histogram, SECONDS_BUCKETS, 0.3)
+    observe(histogram, SECONDS_BUCKETS, 60)
+
+    assert histogram["buckets"][0] == 1
+    assert histogram["buckets"][SECONDS_BUCKETS.index(0.5)] == 1
+    assert histogram["buckets"][-1] == 1
+    assert histogram["count"] == 3
+
+
+def test_estimate_quantile():
+    """Test quantile estimation from bucket counts"""
+    histogram = new_histogram(SECONDS_BUCKETS)
+    for _ in range(99):
+        observe(histogram, SECONDS_BUCKETS, 0.007)
+    observe(histogram, SECONDS_BUCKETS, 3)
+
+    assert 0.005 < estimate_quantile(histogram, SECONDS_BUCKETS, 0.5) <= 0.01
+    assert estimate_quantile(histogram, SECONDS_BUCKETS, 1.0) == 5
+    empty = new_histogram(SECONDS_BUCKETS)
+    assert estimate_quantile(empty, SECONDS_BUCKETS, 0.5) is None
+
+
+def test_render_prometheus_cumulative_buckets():
+    """Test that rendered buckets are cumulative and end with +Inf"""
+    metrics = CommandMetrics("contract list")
+    metrics.duration = 0.02
+    metrics.db_time = 0.01
+    metrics.rows = 12
+    metrics.errors = 1
+    state = update_state(update_state({}, metrics), metrics)
+
+    text = render_prometheus(state)
+
+    assert (
+        'epicevents_command_duration_seconds_bucket{command="contract list",le="0.025"} 2'
+        in text
+    )
+    assert (
+        'epicevents_command_duration_seconds_bucket{command="contract list",le="+Inf"} 2'
+        in text
+    )
+    assert 'epicevents_command_rows_count{command="contract list"} 2' in text
+    assert 'epicevents_command_errors_total{command="contract list"} 2' in text
+
+
+@patch("commands.client_commands.DatabaseConnection.get_read_session")
+@patch("commands.client_commands.AuthService")
+def test_cli_writes_metrics_file(
+    mock_auth, mock_get_session, sqlite_engine, sqlite_session, tmp_path
+):
+    """Test that each command execution is merged into the metrics file"""
+    sqlite_session.add(Client(full_name="Test Client", email="client@example.com"))
+    sqlite_session.commit()
+    mock_get_session.return_value.__enter__.return_value = sqlite_session
+    mock_auth.return_value.get_current_user.return_value = Mock(id=1)
+    metrics_path = tmp_path / "epicevents.prom"
+
+    with patch(
+        "epicevents.DatabaseConnection.get_engines", return_value=[sqlite_engine]
+    ):
+        for _ in range(2):
+            result = CliRunner().invoke(
+                cli, ["client", "list"], env={"METRICS_FILE": str(metrics_path)}
+            )
+            assert result.exit_code == 0
+
+    text = metrics_path.read_text()
+    assert 'epicevents_command_duration_seconds_count{command="client list"} 2' in text
+    assert 'epicevents_command_errors_total{command="client list"} 0' in text
+    state = json.loads((tmp_path / "epicevents.prom.json").read_text())
+    assert state["commands"]["client list"]["rows"]["sum"] == 2
+
+
+@patch("commands.contract_commands.DatabaseConnection.get_read_session")
+@patch("commands.contract_commands.AuthService")
+def test_cli_metrics_count_errors(mock_auth, mock_get_session, sqlite_engine, tmp_path):
+    """Test that unexpected errors logged by a command are counted"""
+    mock_get_session.side_effect = RuntimeError("database unavailable")
+    mock_auth.return_value.get_current_user.return_value = Mock(id=1)
+    metrics_path = tmp_path / "epicevents.prom"
+
+    with patch(
+        "epicevents.DatabaseConnection.get_engines", return_value=[sqlite_engine]
+    ):
+        with patch("logging_config.sentry_sdk"):
+            result = CliRunner().invoke(
+                cli, ["contract", "list"], env={"METRICS_FILE": str(metrics_path)}
+            )
+
+    assert "Error listing contracts: database unavailable" in result.output
+    assert (
+        'epicevents_command_errors_total{command="contract list"} 1'
+        in metrics_path.read_text()
+    )
@@ -0,0 +1,124 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, inspect, select, text, update
+from sqlalchemy.orm import Session
+
+from models.models import Base, Contract, from_cents, to_cents
+from repositories.contract_repository import ContractRepository
+from utils.migrate import migrate
+
+
+@pytest.mark.parametrize(
+    "amount, cents",
+    [
+        (Decimal("1000.00"), 100000),
+        ("0.10", 10),
+        (19.99, 1999),
+        (3, 300),
+        (Decimal("10.005"), 1001),  # Half a cent rounds up
+    ],
+)
+def test_to_cents(amount, cents):
+    """Test converting amounts to integer cents"""
+    assert to_cents(amount) == cents
+
+
+def test_from_cents():
+    """Test converting cents back to two-decimal amounts"""
+    assert str(from_cents(123456)) == "1234.56"
+    assert str(from_cents(0)) == "0.00"
+
+
+def test_amounts_are_stored_as_cents(sqlite_session):
+    """Test that contracts read and write Decimal amounts over cents columns"""
+    contract = Contract(total_amount=Decimal("1000.10"), remaining_amount="0.20")
+    sqlite_session.add(contract)
+    sqlite_session.commit()
+
+    row = sqlite_session.execute(
+        text("SELECT total_amount_cents, remaining_amount_cents FROM contract")
+    ).one()
+    assert tuple(row) == (100010, 20)
+    assert contract.total_amount == Decimal("1000.10")
+    contract.remaining_amount = Decimal("0.30")
+    assert contract.remaining_amount_cents == 30
+
+
+def test_amount_filters_compare_cents(sqlite_session):
+    """Test that filters on amounts are rewritten to the cents columns"""
+    query = select(Contract.id).where(Contract.remaining_amount > Decimal("0.5"))
+    assert "remaining_amount_cents >" in str(query)
+    assert query.compile().params == {"remaining_amount_cents_1": 50}
+
+    statement = update(Contract).values(remaining_amount=Decimal("1.5"))
+    assert statement.compile().params == {"remaining_amount_cents": 150}
+
+
+def test_totals_are_exact(sqlite_session):
+    """Test that totals are summed as integer cents"""
+    sqlite_session.add_all(
+        Contract(
+            commercial_id=1 if i < 10 else 2,
+            total_amount=Decimal("0.10"),
+            remaining_amount=Decimal("0.10") if i % 2 else 0,
+        )
+        for i in range(11)
+    )
+    sqlite_session.commit()
+    repository = ContractRepository(sqlite_session)
+
+    assert repository.get_totals() == {
+        "contracts": 11,
+        "total_amount": Decimal("1.10"),
+        "remaining_amount": Decimal("0.50"),
+        "paid_amount": Decimal("0.60"),
+    }
+    assert repository.get_totals(commercial_id=2)["contracts"] == 1
+    assert [c.id for c in repository.get_unpaid_contracts(commercial_id=1)] == [
+        2,
+        4,
+        6,
+        8,
+        10,
+    ]
+
+
+def test_migrate_converts_amounts_to_cents(tmp_path):
+    """Test that migrating an existing database keeps the contract amounts"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE contract (id INTEGER PRIMARY KEY, client_id INTEGER, "
+                "commercial_id INTEGER, total_amount NUMERIC(10, 2) NOT NULL, "
+                "remaining_amount NUMERIC(10, 2) NOT NULL, created_at DATETIME, "
+                "is_signed BOOLEAN)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO contract VALUES "
+                "(1, NULL, NULL, 1000.1, 0.29, NULL, 1), "
+                "(2, NULL, NULL, 20, 20, NULL, 0)"
+            )
+        )
+    Base.metadata.create_all(engine)  # The other tables are up to date
+
+    migrate(engine)
+    migrate(engine)  # Running again changes nothing
+
+    columns = {c["name"] for c in inspect(engine).get_columns("contract")}
+    assert "total_amount" not in columns
+    with Session(engine) as session:
+        rows = session.execute(
+            text(
+                "SELECT total_amount_cents, remaining_amount_cents, "
+                "typeof(total_amount_cents) FROM contract ORDER BY id"
+            )
+        ).all()
+        assert [tuple(row) for row in rows] == [
+            (100010, 29, "integer"),
+            (2000, 2000, "integer"),
+        ]
+        assert session.get(Contract, 1).total_amount == Decimal("1000.10")
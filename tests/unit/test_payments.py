@@ -0,0 +1,228 @@
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, insert, inspect, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from database.backends import SQLiteBackend
+from models.models import Base, Contract, Payment
+from repositories.contract_repository import ContractRepository
+from repositories.payment_repository import PaymentRepository
+from utils.migrate import migrate
+
+
+def add_contract(session, total, remaining, contract_id=1):
+    session.add(
+        Contract(
+            id=contract_id,
+            total_amount=Decimal(total),
+            remaining_amount=Decimal(remaining),
+        )
+    )
+    session.commit()
+
+
+def test_pay_records_payment_and_decrements_balance(sqlite_session, query_profiler):
+    """Test that a payment is one conditional UPDATE and one INSERT"""
+    add_contract(sqlite_session, "1000.00", "1000.00")
+    contract = sqlite_session.get(Contract, 1)
+    query_profiler.reset()
+
+    payment = PaymentRepository(sqlite_session).pay(1, Decimal("250.10"), None)
+
+    assert query_profiler.count == 2
+    assert payment.amount == Decimal("250.10")
+    assert contract.remaining_amount == Decimal("749.90")
+
+
+def test_pay_more_than_remaining_records_nothing(sqlite_session):
+    """Test that the balance cannot go below zero"""
+    add_contract(sqlite_session, "100.00", "50.00")
+    repository = PaymentRepository(sqlite_session)
+
+    assert repository.pay(1, Decimal("50.01")) is None
+    assert repository.pay(2, Decimal("1.00")) is None  # Unknown contract
+    assert sqlite_session.query(Payment).count() == 0
+    assert sqlite_session.get(Contract, 1).remaining_amount == Decimal("50.00")
+    assert repository.pay(1, Decimal("50.00")) is not None
+
+
+@pytest.mark.parametrize("amount", ["0", "0.001", "-5.00"])
+def test_pay_requires_a_positive_amount_of_cents(sqlite_session, amount):
+    """Test that amounts rounding to no cents are refused"""
+    add_contract(sqlite_session, "100.00", "50.00")
+
+    with pytest.raises(ValueError):
+        PaymentRepository(sqlite_session).pay(1, Decimal(amount))
+
+    assert sqlite_session.query(Payment).count() == 0
+    assert sqlite_session.get(Contract, 1).remaining_amount == Decimal("50.00")
+
+
+def test_pay_checks_the_current_balance_not_a_stale_read(tmp_path):
+    """Test that a payment made since the contract was read is not lost"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'payments.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as first, Session(engine) as second:
+        add_contract(first, "100.00", "100.00")
+        stale = first.get(Contract, 1)
+        first.commit()
+        assert stale.remaining_amount == Decimal("100.00")
+
+        assert PaymentRepository(second).pay(1, Decimal("60.00"))
+        # The first session still sees 100.00 but cannot pay 60.00 again
+        assert PaymentRepository(first).pay(1, Decimal("60.00")) is None
+        assert PaymentRepository(first).pay(1, Decimal("40.00"))
+        assert first.get(Contract, 1).remaining_amount == Decimal("0.00")
+    engine.dispose()
+
+
+def test_concurrent_payments_lose_no_update(tmp_path):
+    """Test that concurrent payments all apply, and never overdraw"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'payments.db'}", connect_args={"timeout": 30}
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        add_contract(session, "100.00", "100.00")
+
+    def pay(_):
+        with Session(engine) as session:
+            return PaymentRepository(session).pay(1, Decimal("10.00")) is not None
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(pay, range(12)))
+
+    assert results.count(True) == 10
+    with Session(engine) as session:
+        assert session.get(Contract, 1).remaining_amount == Decimal("0.00")
+        assert session.query(Payment).count() == 10
+    engine.dispose()
+
+
+@pytest.mark.parametrize("show_all", [False, True])
+def test_reconcile_compares_balances_with_ledger(sqlite_session, show_all):
+    """Test that the report flags balances not explained by the ledger"""
+    add_contract(sqlite_session, "100.00", "100.00", contract_id=1)
+    add_contract(sqlite_session, "100.00", "70.00", contract_id=2)  # No ledger
+    add_contract(sqlite_session, "300.00", "300.00", contract_id=3)
+    repository = PaymentRepository(sqlite_session)
+    repository.pay(1, Decimal("25.00"))
+    repository.pay(1, Decimal("25.00"))
+
+    rows = repository.reconcile(mismatched_only=not show_all)
+
+    by_id = {row["contract_id"]: row for row in rows}
+    assert by_id[2] == {
+        "contract_id": 2,
+        "total_amount": Decimal("100.00"),
+        "remaining_amount": Decimal("70.00"),
+        "paid_amount": Decimal("0.00"),
+        "payments": 0,
+        "difference": Decimal("30.00"),
+    }
+    if show_all:
+        assert list(by_id) == [1, 2, 3]
+        assert by_id[1]["paid_amount"] == Decimal("50.00")
+        assert by_id[1]["payments"] == 2
+        assert by_id[1]["difference"] == Decimal("0.00")
+    else:
+        assert list(by_id) == [2]
+
+
+def test_create_records_the_amount_already_paid(sqlite_session):
+    """Test that a contract created partly paid gets an opening ledger entry"""
+    repository = ContractRepository(sqlite_session)
+    repository.create({"total_amount": Decimal("100.00"), "remaining_amount": 40})
+    repository.create({"total_amount": Decimal("100.00"), "remaining_amount": 100})
+
+    payments = sqlite_session.query(Payment).all()
+    assert [(p.contract_id, p.amount) for p in payments] == [(1, Decimal("60.00"))]
+    assert PaymentRepository(sqlite_session).reconcile() == []
+
+
+def test_update_records_balance_adjustments(sqlite_session):
+    """Test that balance corrections keep the contract reconciled"""
+    add_contract(sqlite_session, "100.00", "100.00")
+    PaymentRepository(sqlite_session).pay(1, Decimal("10.00"))
+    repository = ContractRepository(sqlite_session)
+
+    repository.update(1, {"remaining_amount": Decimal("50.00")})
+    repository.update(1, {"total_amount": Decimal("80.00")})
+    repository.update(1, {"is_signed": True})  # No balance change
+
+    amounts = [p.amount for p in PaymentRepository(sqlite_session).get_by_contract(1)]
+    assert amounts == [Decimal("10.00"), Decimal("40.00"), Decimal("-20.00")]
+    assert PaymentRepository(sqlite_session).reconcile() == []
+
+
+def test_migrate_records_opening_balances(tmp_path):
+    """Test that migrating records the amounts paid before the ledger"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Contract),
+            [
+                {"id": 1, "total_amount_cents": 10000, "remaining_amount_cents": 4000},
+                {"id": 2, "total_amount_cents": 10000, "remaining_amount_cents": 10000},
+            ],
+        )
+
+    migrate(engine)
+    migrate(engine)  # Running again records nothing more
+
+    with Session(engine) as session:
+        payments = session.query(Payment).all()
+        assert [(p.contract_id, p.amount) for p in payments] == [(1, Decimal("60.00"))]
+        assert payments[0].employee_id is None
+        assert PaymentRepository(session).reconcile() == []
+
+
+def test_contract_with_payments_cannot_be_deleted(tmp_path):
+    """Test that the ledger keeps the contract of every payment"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'crm.db'}")
+    SQLiteBackend().configure(engine)  # Enforces foreign keys
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        add_contract(session, "100.00", "100.00")
+        add_contract(session, "100.00", "100.00", contract_id=2)
+        payment = PaymentRepository(session).pay(1, Decimal("10.00"))
+        repository = ContractRepository(session)
+
+        assert repository.delete(1) is False
+        assert repository.delete(2) is True
+        assert session.get(Contract, 1) is not None
+        # The database refuses the delete as well
+        with pytest.raises(IntegrityError):
+            session.delete(session.get(Contract, 1))
+            session.commit()
+        session.rollback()
+
+        assert session.get(Payment, payment.id).contract_id == 1
+
+
+def test_migrate_restricts_contract_deletes(tmp_path):
+    """Test that migrating replaces the SET NULL rule of payments"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE payment"))
+        conn.execute(
+            text(
+                "CREATE TABLE payment (id INTEGER PRIMARY KEY, "
+                "contract_id INTEGER REFERENCES contract (id) ON DELETE SET NULL, "
+                "employee_id INTEGER REFERENCES employee (id) ON DELETE SET NULL, "
+                "amount_cents BIGINT NOT NULL, created_at BIGINT NOT NULL)"
+            )
+        )
+
+    migrate(engine)
+
+    rules = {
+        fk["referred_table"]: fk["options"].get("ondelete")
+        for fk in inspect(engine).get_foreign_keys("payment")
+    }
+    assert rules == {"contract": "RESTRICT", "employee": "SET NULL"}
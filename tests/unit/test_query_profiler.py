@@ -0,0 +1,152 @@
+import pstats
+from unittest.mock import Mock, patch
+
+from click.testing import CliRunner
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from database.connection import DatabaseConnection
+from database.profiling import SlowQueryLogger
+from epicevents import cli
+from models.models import Client
+from repositories.client_repository import ClientRepository
+
+
+def test_profiler_counts_statements(sqlite_session, query_profiler):
+    """Test that every executed statement is counted and timed"""
+    sqlite_session.execute(text("SELECT 1"))
+    sqlite_session.execute(text("SELECT 2"))
+
+    assert query_profiler.count == 2
+    assert query_profiler.total_time > 0
+    assert {statement for _, statement, _ in query_profiler.slowest} == {
+        "SELECT 1",
+        "SELECT 2",
+    }
+
+
+def test_profiler_keeps_slowest_statements(sqlite_session, query_profiler):
+    """Test that only the configured number of slowest statements is kept"""
+    for i in range(10):
+        sqlite_session.execute(text(f"SELECT {i}"))
+
+    assert query_profiler.count == 10
+    assert len(query_profiler.slowest) == 5
+    durations = [duration for duration, _, _ in query_profiler.slowest]
+    assert durations == sorted(durations, reverse=True)
+
+
+def test_repository_get_by_id_query_budget(sqlite_session, query_profiler):
+    """Test that fetching a client by ID costs a single statement"""
+    sqlite_session.add(Client(full_name="Test Client", email="client@example.com"))
+    sqlite_session.commit()
+    query_profiler.reset()
+
+    ClientRepository(sqlite_session).get_by_id(1)
+
+    assert query_profiler.count == 1
+
+
+def test_repository_writes_skip_reload(sqlite_engine, query_profiler):
+    """Test that creates and updates return populated objects without a SELECT"""
+    with Session(sqlite_engine, **DatabaseConnection.get_session_options()) as session:
+        repo = ClientRepository(session)
+
+        client = repo.create(
+            {"full_name": "Test Client", "email": "client@example.com"}
+        )
+        assert query_profiler.count == 1  # INSERT
+        assert client.id == 1 and client.created_at is not None
+
+        query_profiler.reset()
+        client = repo.update(client.id, {"phone": "0102030405"})
+        assert query_profiler.count == 2  # SELECT by id, UPDATE
+        assert client.phone == "0102030405" and client.updated_at is not None
+
+
+@patch("commands.client_commands.DatabaseConnection.get_read_session")
+@patch("commands.client_commands.AuthService")
+def test_cli_profile_flag_reports_statements(
+    mock_auth, mock_get_session, sqlite_engine, sqlite_session
+):
+    """Test that --profile prints the SQL statistics after the command"""
+    mock_get_session.return_value.__enter__.return_value = sqlite_session
+    mock_auth.return_value.get_current_user.return_value = Mock(id=1)
+
+    with patch(
+        "epicevents.DatabaseConnection.get_engines", return_value=[sqlite_engine]
+    ):
+        result = CliRunner(mix_stderr=False).invoke(
+            cli, ["--profile", "client", "list"]
+        )
+
+    assert result.exit_code == 0
+    assert "No clients found" in result.stdout
+    assert "SQL statements: 1" in result.stderr
+    assert "FROM client" in result.stderr
+
+
+def test_slow_query_log_records_query_plan(sqlite_engine, sqlite_session, tmp_path):
+    """Test that slow statements are logged with parameters and query plan"""
+    log_path = tmp_path / "slow_queries.log"
+    slow_query_logger = SlowQueryLogger(str(log_path), threshold_ms=0)
+    slow_query_logger.attach(sqlite_engine)
+    try:
+        ClientRepository(sqlite_session).get_by_commercial(42)
+    finally:
+        slow_query_logger.detach(sqlite_engine)
+        slow_query_logger.close()
+
+    log = log_path.read_text()
+    assert "slow query:" in log
+    assert "WHERE client.commercial_id = ?" in log
+    assert "params: (42," in log
+    assert "query plan:" in log
+    assert "SEARCH client USING INDEX ix_client_commercial_id" in log
+
+
+def test_slow_query_log_ignores_fast_statements(
+    sqlite_engine, sqlite_session, tmp_path
+):
+    """Test that statements under the threshold are not logged"""
+    log_path = tmp_path / "slow_queries.log"
+    slow_query_logger = SlowQueryLogger(str(log_path), threshold_ms=60_000)
+    slow_query_logger.attach(sqlite_engine)
+    try:
+        ClientRepository(sqlite_session).get_by_id(1)
+    finally:
+        slow_query_logger.detach(sqlite_engine)
+        slow_query_logger.close()
+
+    assert log_path.read_text() == ""
+
+
+@patch("commands.client_commands.AuthService")
+def test_cli_profile_python_prints_stats(mock_auth):
+    """Test that --profile-python prints the cProfile stats after the command"""
+    mock_auth.return_value.get_current_user.return_value = None
+
+    result = CliRunner(mix_stderr=False).invoke(
+        cli, ["--profile-python", "client", "list"]
+    )
+
+    assert result.exit_code == 0
+    assert "Error: No authenticated user found" in result.stdout
+    assert "function calls" in result.stderr
+    assert "cumulative" in result.stderr
+
+
+@patch("commands.client_commands.AuthService")
+def test_cli_profile_env_writes_output_file(mock_auth, tmp_path):
+    """Test that EPICEVENTS_PROFILE_OUTPUT dumps the raw stats to a file"""
+    mock_auth.return_value.get_current_user.return_value = None
+    output_path = tmp_path / "command.prof"
+
+    result = CliRunner(mix_stderr=False).invoke(
+        cli,
+        ["client", "list"],
+        env={"EPICEVENTS_PROFILE_OUTPUT": str(output_path)},
+    )
+
+    assert result.exit_code == 0
+    assert pstats.Stats(str(output_path)).total_calls > 0
@@ -0,0 +1,137 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.orm import Session
+
+from database.backends import (
+    MariaDBBackend,
+    MSSQLBackend,
+    MySQLBackend,
+    PostgreSQLBackend,
+)
+from database.connection import DatabaseConnection
+from models.models import Base, Client
+from utils.init_db import install_version_triggers
+
+
+@pytest.fixture
+def engine():
+    """Create an in-memory database with version triggers installed."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    install_version_triggers(engine)
+    return engine
+
+
+def test_versions_start_at_zero(engine):
+    """Test that every tracked table starts at version 0"""
+    with patch.object(DatabaseConnection, "get_engine", return_value=engine):
+        versions = DatabaseConnection.get_table_versions()
+
+    assert versions == {
+        "employee": 0,
+        "client": 0,
+        "contract": 0,
+        "event": 0,
+        "payment": 0,
+        "audit_log": 0,
+    }
+
+
+def test_versions_bumped_on_change(engine):
+    """Test that inserts, updates and deletes bump the table version"""
+    with Session(engine) as session:
+        client = Client(full_name="Test Client", email="client@example.com")
+        session.add(client)
+        session.commit()
+        client.phone = "0102030405"
+        session.commit()
+        session.delete(client)
+        session.commit()
+
+    with patch.object(DatabaseConnection, "get_engine", return_value=engine):
+        versions = DatabaseConnection.get_table_versions()
+
+    assert versions["client"] == 3
+    assert versions["contract"] == 0
+
+
+def test_install_is_idempotent(engine):
+    """Test that installing triggers twice does not reset versions"""
+    with Session(engine) as session:
+        session.add(Client(full_name="Test Client", email="client@example.com"))
+        session.commit()
+
+    install_version_triggers(engine)
+
+    with patch.object(DatabaseConnection, "get_engine", return_value=engine):
+        assert DatabaseConnection.get_table_versions()["client"] == 1
+
+
+def test_versions_not_tracked_on_other_databases():
+    """Test that databases without version triggers refuse to report versions"""
+    engine = Mock(url=make_url("oracle+oracledb://user@host/crm"))
+
+    with patch.object(DatabaseConnection, "get_engine", return_value=engine):
+        with pytest.raises(NotImplementedError):
+            DatabaseConnection.get_table_versions()
+
+    engine.connect.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "backend, expected",
+    [
+        (
+            PostgreSQLBackend(),
+            [
+                "CREATE OR REPLACE FUNCTION bump_table_version()",
+                "CREATE OR REPLACE TRIGGER client_version "
+                "AFTER INSERT OR UPDATE OR DELETE ON client FOR EACH STATEMENT",
+            ],
+        ),
+        (
+            MySQLBackend(),
+            [
+                "CREATE TRIGGER IF NOT EXISTS client_version_insert "
+                "AFTER INSERT ON client FOR EACH ROW",
+                "CREATE TRIGGER IF NOT EXISTS client_version_update "
+                "AFTER UPDATE ON client FOR EACH ROW",
+                "CREATE TRIGGER IF NOT EXISTS client_version_delete "
+                "AFTER DELETE ON client FOR EACH ROW",
+            ],
+        ),
+        (
+            MariaDBBackend(),
+            [
+                "CREATE TRIGGER IF NOT EXISTS client_version_insert "
+                "AFTER INSERT ON client FOR EACH ROW",
+                "CREATE TRIGGER IF NOT EXISTS client_version_update "
+                "AFTER UPDATE ON client FOR EACH ROW",
+                "CREATE TRIGGER IF NOT EXISTS client_version_delete "
+                "AFTER DELETE ON client FOR EACH ROW",
+            ],
+        ),
+        (
+            MSSQLBackend(),
+            [
+                "CREATE OR ALTER TRIGGER client_version "
+                "ON client AFTER INSERT, UPDATE, DELETE AS BEGIN SET NOCOUNT ON;"
+            ],
+        ),
+    ],
+)
+def test_server_databases_track_versions(backend, expected):
+    """Test that every registered server backend installs version triggers"""
+    conn = Mock()
+
+    backend.create_version_triggers(conn, ["client"])
+
+    statements = [str(call.args[0]) for call in conn.execute.call_args_list]
+    assert backend.tracks_table_versions
+    assert len(statements) == len(expected)
+    for statement, start in zip(statements, expected):
+        assert statement.startswith(start)
+    bump = "UPDATE table_version SET version = version + 1"
+    assert any(bump in statement for statement in statements)
@@ -0,0 +1,77 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from database.unit_of_work import in_unit_of_work, unit_of_work
+from models.models import AuditLog, Client
+from repositories.client_repository import ClientRepository
+from repositories.contract_repository import ContractRepository
+
+
+@pytest.fixture
+def commits(sqlite_session):
+    """Count the transactions committed by the session."""
+    counter = []
+    event.listen(sqlite_session, "after_commit", lambda session: counter.append(1))
+    return counter
+
+
+def test_repositories_commit_each_write_by_default(sqlite_session, commits):
+    """Test that repositories commit on their own outside a unit of work"""
+    repo = ClientRepository(sqlite_session)
+    repo.create({"full_name": "Test Client", "email": "client@example.com"})
+    repo.update(1, {"phone": "0102030405"})
+
+    assert len(commits) == 2
+
+
+def test_unit_of_work_commits_once(sqlite_session, commits):
+    """Test that the writes of a unit of work share a single commit"""
+    with unit_of_work(sqlite_session):
+        client = ClientRepository(sqlite_session).create(
+            {"full_name": "Test Client", "email": "client@example.com"}
+        )
+        contracts = ContractRepository(sqlite_session)
+        contract = contracts.create(
+            {
+                "client_id": client.id,
+                "total_amount": Decimal("1000.00"),
+                "remaining_amount": Decimal("1000.00"),
+                "is_signed": False,
+            }
+        )
+        contracts.update(contract.id, {"is_signed": True})
+        assert commits == []
+
+    assert len(commits) == 1
+    assert not in_unit_of_work(sqlite_session)
+    assert sqlite_session.query(AuditLog).count() == 2
+
+
+def test_unit_of_work_rolls_back_on_error(sqlite_session, commits):
+    """Test that a failing step discards the earlier writes"""
+    with pytest.raises(RuntimeError):
+        with unit_of_work(sqlite_session):
+            ClientRepository(sqlite_session).create(
+                {"full_name": "Test Client", "email": "client@example.com"}
+            )
+            raise RuntimeError("contract rejected")
+
+    assert commits == []
+    assert sqlite_session.query(Client).count() == 0
+    assert not in_unit_of_work(sqlite_session)
+
+
+def test_nested_unit_of_work_joins_outer(sqlite_session, commits):
+    """Test that only the outermost unit of work commits"""
+    with unit_of_work(sqlite_session):
+        with unit_of_work(sqlite_session):
+            ClientRepository(sqlite_session).create(
+                {"full_name": "Test Client", "email": "client@example.com"}
+            )
+        assert commits == []
+        assert in_unit_of_work(sqlite_session)
+
+    assert len(commits) == 1
+    assert sqlite_session.query(Client).count() == 1
@@ -0,0 +1,136 @@
+import time
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, inspect, select, text
+from sqlalchemy.orm import Session
+
+from models.models import Base, Contract, Event
+from repositories.event_repository import EventRepository
+from utils.migrate import migrate
+
+PARIS_SUMMER = timezone(timedelta(hours=2))
+
+
+def add_event(session, start_date, name="Event"):
+    event = Event(
+        name=name, start_date=start_date, end_date=start_date + timedelta(hours=2)
+    )
+    session.add(event)
+    session.commit()
+    return event
+
+
+@pytest.fixture
+def paris_local_time(monkeypatch):
+    """Run in the Europe/Paris local time zone."""
+    monkeypatch.setenv("TZ", "Europe/Paris")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_datetimes_are_stored_as_epoch_microseconds(sqlite_session):
+    """Test that datetimes are stored as UTC integers and read back aware"""
+    start = datetime(2025, 6, 1, 20, 30, 0, 123456, tzinfo=PARIS_SUMMER)
+    event = add_event(sqlite_session, start)
+    sqlite_session.expire_all()
+
+    raw = sqlite_session.execute(text("SELECT start_date FROM event")).scalar()
+    assert raw == int(start.timestamp()) * 1_000_000 + 123456
+    assert event.start_date == start
+    assert event.start_date.tzinfo == UTC
+    assert event.start_date.hour == 18
+
+
+def test_naive_datetimes_are_taken_as_utc(sqlite_session):
+    """Test that naive datetimes keep their wall time, in UTC"""
+    event = add_event(sqlite_session, datetime(2025, 6, 1, 18, 30))
+    sqlite_session.expire_all()
+
+    assert event.start_date == datetime(2025, 6, 1, 18, 30, tzinfo=UTC)
+
+
+def test_date_range_uses_start_date_index(sqlite_session):
+    """Test that event date ranges are integer index scans"""
+    base = datetime(2025, 1, 1, tzinfo=UTC)
+    for days in (40, 10, 20, 0):
+        add_event(sqlite_session, base + timedelta(days=days), f"Day {days}")
+
+    events = EventRepository(sqlite_session).get_starting_between(
+        base + timedelta(days=5), base + timedelta(days=40)
+    )
+
+    assert [event.name for event in events] == ["Day 10", "Day 20"]
+    query = select(Event).where(Event.start_date >= base, Event.start_date < base)
+    compiled = query.compile(
+        sqlite_session.bind, compile_kwargs={"literal_binds": True}
+    )
+    assert f"start_date >= {int(base.timestamp()) * 1_000_000}" in str(compiled)
+    plan = sqlite_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    assert "USING INDEX ix_event_start_date" in " ".join(row[-1] for row in plan)
+
+
+def test_migrate_converts_datetime_strings(tmp_path, paris_local_time):
+    """Test that migrating converts event local times and UTC timestamps"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE event (id INTEGER PRIMARY KEY, contract_id INTEGER, "
+                "support_id INTEGER, name VARCHAR NOT NULL, "
+                "start_date DATETIME NOT NULL, end_date DATETIME NOT NULL, "
+                "location VARCHAR, attendees INTEGER, notes VARCHAR)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO event (id, name, start_date, end_date) VALUES "
+                "(1, 'Gala', '2025-06-01 18:30:00.250000', '2025-06-01 23:00:00')"
+            )
+        )
+    Base.metadata.create_all(engine)  # The other tables are up to date
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO contract (id, total_amount_cents, "
+                "remaining_amount_cents, created_at) "
+                "VALUES (1, 0, 0, '2025-06-01 10:00:00.000000'), (2, 0, 0, NULL)"
+            )
+        )
+
+    migrate(engine)
+    migrate(engine)  # Running again changes nothing
+
+    with Session(engine) as session:
+        event = session.get(Event, 1)
+        # Event dates were entered in local time
+        assert event.start_date == datetime(
+            2025, 6, 1, 18, 30, 0, 250000, tzinfo=PARIS_SUMMER
+        )
+        assert event.end_date == datetime(2025, 6, 1, 23, tzinfo=PARIS_SUMMER)
+        # Timestamps were recorded in UTC
+        contract = session.get(Contract, 1)
+        assert contract.created_at == datetime(2025, 6, 1, 10, tzinfo=UTC)
+        assert session.get(Contract, 2).created_at is None
+
+
+def test_migrate_checks_datetime_conversion_before_any_step(tmp_path):
+    """Test that databases without a datetime conversion are left untouched"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE event (id INTEGER PRIMARY KEY, name VARCHAR NOT NULL, "
+                "start_date DATETIME NOT NULL, end_date DATETIME NOT NULL)"
+            )
+        )
+    # Reflection still goes through SQLite; only the dialect name differs
+    engine.dialect.name = "mssql"
+
+    with pytest.raises(NotImplementedError, match="event.start_date"):
+        migrate(engine)
+
+    engine.dialect.name = "sqlite"
+    assert inspect(engine).get_table_names() == ["event"]
@@ -0,0 +1,109 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+from models.models import Base, Client, Contract, Department, Employee
+from repositories.contract_repository import ContractRepository
+from repositories.employee_repository import EmployeeRepository
+from repositories.payment_repository import PaymentRepository
+from utils.migrate import migrate
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Create a file database, shared by several sessions."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'versions.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(
+            Contract(
+                id=1, total_amount=Decimal("100.00"), remaining_amount=Decimal("100")
+            )
+        )
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+def test_version_is_bumped_on_every_update(engine):
+    """Test that each update of a row increments its version"""
+    with Session(engine) as session:
+        repository = ContractRepository(session)
+        assert repository.get_by_id(1).version == 1
+
+        repository.update(1, {"is_signed": True})
+        repository.update(1, {"total_amount": Decimal("200.00")})
+
+        assert repository.get_by_id(1).version == 3
+
+
+def test_concurrent_update_raises_conflict(engine):
+    """Test that the second of two concurrent edits fails instead of overwriting"""
+    with Session(engine) as first, Session(engine) as second:
+        first_repository = ContractRepository(first)
+        second_repository = ContractRepository(second)
+        # Both edits start from the same version, as the update commands do
+        loaded = [first_repository.get_by_id(1), second_repository.get_by_id(1)]
+        assert [contract.version for contract in loaded] == [1, 1]
+
+        first_repository.update(1, {"total_amount": Decimal("150.00")})
+        with pytest.raises(StaleDataError):
+            second_repository.update(1, {"total_amount": Decimal("120.00")})
+        second.rollback()
+
+        assert second_repository.get_by_id(1).total_amount == Decimal("150.00")
+
+
+def test_payment_conflicts_with_a_concurrent_edit(engine):
+    """Test that an edit cannot write back a remaining amount paid since"""
+    with Session(engine) as editor, Session(engine) as cashier:
+        contract = ContractRepository(editor).get_by_id(1)
+        assert contract.remaining_amount == Decimal("100.00")
+
+        assert PaymentRepository(cashier).pay(1, Decimal("40.00"))
+        with pytest.raises(StaleDataError):
+            ContractRepository(editor).update(
+                1, {"remaining_amount": Decimal("90.00")}
+            )
+
+
+def test_reassign_bumps_versions(engine):
+    """Test that a bulk reassignment conflicts with edits of the moved rows"""
+    with Session(engine) as session:
+        leaving, taking = (
+            Employee(
+                employee_number=f"EMP00{i}",
+                full_name=f"User {i}",
+                email=f"user{i}@example.com",
+                department=Department.COMMERCIAL,
+                role="Sales",
+                _password_hash="hash",
+            )
+            for i in range(2)
+        )
+        session.add_all([leaving, taking])
+        session.add(Client(id=1, full_name="Client", email="c@ex.com"))
+        session.flush()
+        session.get(Client, 1).commercial_id = leaving.id
+        session.commit()
+
+        EmployeeRepository(session).reassign(leaving, taking, Department.COMMERCIAL)
+
+        assert session.get(Client, 1).version == 3
+
+
+def test_migrate_adds_version_columns(engine):
+    """Test that existing rows get version 1"""
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE contract DROP COLUMN version"))
+
+    migrate(engine)
+    migrate(engine)  # Running again changes nothing
+
+    columns = {c["name"] for c in inspect(engine).get_columns("contract")}
+    assert "version" in columns
+    with Session(engine) as session:
+        assert session.get(Contract, 1).version == 1
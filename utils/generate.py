@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Synthetic data generator for EpicEvents CRM
+Creates large, reproducible datasets of clients, contracts and events for load testing
+"""
+
+import argparse
+import random
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import func, insert, update
+from werkzeug.security import generate_password_hash
+
+from database.connection import DatabaseConnection
+from models.models import (
+    Client,
+    Contract,
+    Department,
+    Employee,
+    Event,
+    get_password_hash_method,
+)
+from repositories.event_repository import contract_event_stats
+from repositories.payment_repository import insert_opening_balances
+
+# fmt: off
+FIRST_NAMES = [
+    "Alice", "Bruno", "Chloe", "David", "Emma", "Farid", "Gabriel", "Hugo",
+    "Ines", "Jules", "Karima", "Louis", "Manon", "Nathan", "Olivia", "Paul",
+    "Quentin", "Rose", "Sofia", "Thomas", "Ugo", "Victor", "Wendy", "Yanis",
+]
+LAST_NAMES = [
+    "Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit",
+    "Durand", "Leroy", "Moreau", "Simon", "Laurent", "Lefebvre", "Michel",
+    "Garcia", "David", "Bertrand", "Roux", "Vincent", "Fournier", "Morel",
+]
+COMPANY_WORDS = [
+    "Acme", "Global", "Digital", "Smart", "Future", "Nextgen", "Blue", "Prime",
+    "Nova", "Vertex", "Summit", "Pioneer", "Quantum", "Urban", "Bright",
+]
+COMPANY_SUFFIXES = ["Corp", "Labs", "Solutions", "Systems", "Group", "Events"]
+EVENT_KINDS = [
+    "Conference", "Workshop", "Product Launch", "Networking Dinner", "Seminar",
+    "Team Building", "Trade Show", "Gala", "Training Session", "Demo Day",
+]
+LOCATIONS = [
+    "Paris", "Lyon", "Marseille", "Bordeaux", "Lille", "Nantes", "Toulouse",
+    "Nice", "Strasbourg", "Montpellier",
+]
+# fmt: on
+
+# Fixed reference date so generated datasets are identical across runs
+BASE_DATE = datetime(2025, 1, 1, tzinfo=UTC)
+DEFAULT_PASSWORD = "Password123!"
+
+
+def scaled_int(value):
+    """Parse counts written as integers or in scientific notation (1e6)."""
+    return int(float(value))
+
+
+def next_id(session, model):
+    """Get the first free primary key of a table."""
+    return (session.query(func.max(model.id)).scalar() or 0) + 1
+
+
+def create_employees(session, rng, count):
+    """Create employees spread across departments, sharing one password hash."""
+    if count <= 0:
+        return
+    # Hashing is deliberately slow, so every generated employee shares one hash
+    password_hash = generate_password_hash(
+        DEFAULT_PASSWORD, method=get_password_hash_method()
+    )
+    first_id = next_id(session, Employee)
+    departments = [Department.COMMERCIAL, Department.SUPPORT, Department.MANAGEMENT]
+    rows = []
+    for employee_id in range(first_id, first_id + count):
+        department = departments[employee_id % len(departments)]
+        rows.append(
+            {
+                "id": employee_id,
+                "employee_number": f"GEN{employee_id:08d}",
+                "full_name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "email": f"employee{employee_id}@epicevents.com",
+                "_password_hash": password_hash,
+                "department": department,
+                "role": f"Generated {department.value}",
+                "created_at": BASE_DATE,
+                "updated_at": BASE_DATE,
+            }
+        )
+    session.execute(insert(Employee), rows)
+    session.commit()
+    print(f"Created {count} employees")
+
+
+def generate_chunk(
+    rng,
+    client_ids,
+    first_contract_id,
+    commercial_ids,
+    support_ids,
+    contracts_per_client,
+    events_per_contract,
+):
+    """Generate the rows of one chunk of clients with their contracts and events."""
+    clients, contracts, events = [], [], []
+    contract_id = first_contract_id
+    for client_id in client_ids:
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        created_at = BASE_DATE - timedelta(minutes=rng.randrange(0, 3 * 365 * 24 * 60))
+        commercial_id = rng.choice(commercial_ids)
+        clients.append(
+            {
+                "id": client_id,
+                "full_name": f"{first_name} {last_name}",
+                "email": f"{first_name.lower()}.{last_name.lower()}.{client_id}@example.com",
+                "phone": f"+33 6 {rng.randrange(10**8):08d}",
+                "company_name": f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)}",
+                "commercial_id": commercial_id,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+        )
+
+        for _ in range(contracts_per_client):
+            total_cents = rng.randrange(100_000, 5_000_000)
+            is_signed = rng.random() < 0.8
+            remaining_cents = rng.choice([0, total_cents // 2, total_cents])
+            contracts.append(
+                {
+                    "id": contract_id,
+                    "client_id": client_id,
+                    "commercial_id": commercial_id,
+                    "total_amount_cents": total_cents,
+                    "remaining_amount_cents": remaining_cents,
+                    "created_at": created_at,
+                    "is_signed": is_signed,
+                }
+            )
+
+            if is_signed:
+                for _ in range(events_per_contract):
+                    start_date = BASE_DATE + timedelta(
+                        hours=rng.randrange(-365 * 24, 365 * 24)
+                    )
+                    support_id = (
+                        rng.choice(support_ids) if rng.random() < 0.8 else None
+                    )
+                    events.append(
+                        {
+                            "contract_id": contract_id,
+                            "support_id": support_id,
+                            "name": f"{rng.choice(EVENT_KINDS)} {last_name}",
+                            "start_date": start_date,
+                            "end_date": start_date
+                            + timedelta(hours=rng.randrange(1, 12)),
+                            "location": rng.choice(LOCATIONS),
+                            "attendees": rng.randrange(5, 500),
+                            "notes": None,
+                        }
+                    )
+            contract_id += 1
+    return clients, contracts, events
+
+
+def generate(
+    clients,
+    contracts_per_client=2,
+    events_per_contract=1,
+    employees=0,
+    chunk_size=10_000,
+    seed=42,
+):
+    """Generate a synthetic dataset, committing one chunk of clients at a time."""
+    rng = random.Random(seed)
+
+    with DatabaseConnection.get_session() as session:
+        create_employees(session, rng, employees)
+
+        commercial_ids = [
+            employee_id
+            for (employee_id,) in session.query(Employee.id)
+            .filter(Employee.department == Department.COMMERCIAL)
+            .order_by(Employee.id)
+        ]
+        support_ids = [
+            employee_id
+            for (employee_id,) in session.query(Employee.id)
+            .filter(Employee.department == Department.SUPPORT)
+            .order_by(Employee.id)
+        ]
+        if not commercial_ids or not support_ids:
+            print(
+                "No commercial or support employees found. "
+                "Please run seed_db.py first or use --employees."
+            )
+            return
+
+        first_client_id = next_id(session, Client)
+        contract_id = next_id(session, Contract)
+        totals = {"clients": 0, "contracts": 0, "events": 0}
+
+        last_client_id = first_client_id + clients
+        for chunk_start in range(first_client_id, last_client_id, chunk_size):
+            chunk_end = min(chunk_start + chunk_size, last_client_id)
+            client_rows, contract_rows, event_rows = generate_chunk(
+                rng,
+                range(chunk_start, chunk_end),
+                contract_id,
+                commercial_ids,
+                support_ids,
+                contracts_per_client,
+                events_per_contract,
+            )
+            session.execute(insert(Client), client_rows)
+            if contract_rows:
+                session.execute(insert(Contract), contract_rows)
+                session.execute(insert_opening_balances(Contract.id >= contract_id))
+            if event_rows:
+                session.execute(insert(Event), event_rows)
+                # Fill the event columns of this chunk's contracts in one UPDATE
+                session.execute(
+                    update(Contract)
+                    .where(Contract.id >= contract_id)
+                    .values(**contract_event_stats(datetime.now(UTC))),
+                    execution_options={"synchronize_session": False},
+                )
+            session.commit()
+            # Drop references to the inserted rows so memory stays constant
+            session.expunge_all()
+
+            contract_id += len(contract_rows)
+            totals["clients"] += len(client_rows)
+            totals["contracts"] += len(contract_rows)
+            totals["events"] += len(event_rows)
+            print(
+                f"Committed {totals['clients']}/{clients} clients, "
+                f"{totals['contracts']} contracts, {totals['events']} events"
+            )
+
+    return totals
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate a large synthetic EpicEvents dataset."
+    )
+    parser.add_argument(
+        "--clients", type=scaled_int, required=True, help="Number of clients"
+    )
+    parser.add_argument(
+        "--contracts-per-client",
+        type=scaled_int,
+        default=2,
+        help="Contracts created for each client",
+    )
+    parser.add_argument(
+        "--events-per-contract",
+        type=scaled_int,
+        default=1,
+        help="Events created for each signed contract",
+    )
+    parser.add_argument(
+        "--employees",
+        type=scaled_int,
+        default=0,
+        help="Employees to create first (spread across departments)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=scaled_int,
+        default=10_000,
+        help="Clients inserted per transaction",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=42, help="Random seed for reproducible data"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        print("Starting synthetic data generation...")
+        generate(
+            clients=args.clients,
+            contracts_per_client=args.contracts_per_client,
+            events_per_contract=args.events_per_contract,
+            employees=args.employees,
+            chunk_size=args.chunk_size,
+            seed=args.seed,
+        )
+        print("Synthetic data generation complete!")
+    except Exception as e:
+        print(f"Error generating data: {str(e)}")
+        exit(1)
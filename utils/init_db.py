@@ -1,6 +1,7 @@
+from database.backends import get_backend
 from database.connection import DatabaseConnection
-from models.models import Base
-from sqlalchemy import text
+from models.models import Base, TableVersion
+from sqlalchemy import insert, inspect, select, text
 import time
 
 
@@ -21,6 +22,29 @@ def wait_for_db(engine, max_retries=5, delay=2):
     return False
 
 
+def install_version_triggers(engine):
+    """Install triggers bumping table_version on every change of a table."""
+    with engine.begin() as conn:
+        create_version_triggers(conn)
+
+
+def create_version_triggers(conn):
+    """Create the table_version rows and triggers missing on the connection."""
+    tracked_tables = [
+        table.name
+        for table in Base.metadata.sorted_tables
+        if table.name != TableVersion.__tablename__
+    ]
+    existing = set(conn.execute(select(TableVersion.table_name)).scalars())
+    missing = [name for name in tracked_tables if name not in existing]
+    if missing:
+        conn.execute(
+            insert(TableVersion),
+            [{"table_name": name, "version": 0} for name in missing],
+        )
+    get_backend(conn.engine.url).create_version_triggers(conn, tracked_tables)
+
+
 def init_db():
     """Initialize the database by creating all tables."""
     print("Initializing database connection...")
@@ -33,13 +57,17 @@ def init_db():
     print("Creating tables...")
     Base.metadata.create_all(engine)
 
-    # Verify tables were created (SQLite compatible)
-    with engine.connect() as conn:
-        result = conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'"))
-        tables = [row[0] for row in result]
-        print("\nCreated tables:")
-        for table in sorted(tables):
-            print(f"- {table}")
+    if get_backend(engine.url).tracks_table_versions:
+        print("Installing table version triggers...")
+        install_version_triggers(engine)
+    else:
+        print(f"Skipping table version triggers (none for {engine.dialect.name})")
+
+    # Verify tables were created
+    tables = inspect(engine).get_table_names()
+    print("\nCreated tables:")
+    for table in sorted(tables):
+        print(f"- {table}")
 
 
 if __name__ == "__main__":
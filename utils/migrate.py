@@ -0,0 +1,350 @@
+"""
+Upgrade an existing database to the current models.
+
+Databases created by init_db are already up to date; this adds the tables,
+columns and indexes introduced since, and backfills them. Every step can be run
+again safely.
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import Column, Integer, MetaData, Table, inspect, text, update
+from sqlalchemy.schema import AddConstraint, CreateTable
+
+from database.backends import get_backend
+from database.connection import DatabaseConnection
+from models.models import (
+    Base,
+    Client,
+    Contract,
+    Event,
+    TableVersion,
+    UTCDateTime,
+)
+from repositories.event_repository import contract_event_stats
+from repositories.payment_repository import insert_opening_balances
+from utils.init_db import create_version_triggers
+
+
+def add_column(conn, column: Column) -> bool:
+    """Add a model column to its existing table, returning False if present."""
+    table_name = column.table.name
+    existing = {c["name"] for c in inspect(conn).get_columns(table_name)}
+    if column.name in existing:
+        return False
+
+    ddl = (
+        f"ALTER TABLE {table_name} ADD COLUMN {column.name} "
+        f"{column.type.compile(dialect=conn.dialect)}"
+    )
+    if column.server_default is not None:
+        ddl += f" DEFAULT {column.server_default.arg}"
+    if not column.nullable:
+        ddl += " NOT NULL"
+    conn.execute(text(ddl))
+    return True
+
+
+def create_indexes(conn, *models):
+    """Create the indexes declared on the models' existing tables, if missing."""
+    tables = inspect(conn).get_table_names()
+    for model in models:
+        if model.__tablename__ in tables:
+            for index in model.__table__.indexes:
+                index.create(conn, checkfirst=True)
+
+
+def create_missing_tables(conn):
+    """Create the tables added since the database was created."""
+    Base.metadata.create_all(conn)
+    if get_backend(conn.engine.url).tracks_table_versions:
+        create_version_triggers(conn)
+
+
+# Event dates were entered, and stored, as naive local times; the next event
+# date of contracts is copied from them. The other datetimes were naive UTC.
+LOCAL_TIME_COLUMNS = {
+    ("event", "start_date"),
+    ("event", "end_date"),
+    ("contract", "next_event_date"),
+}
+
+
+# Dialects whose datetime columns store_datetimes_as_epoch can convert
+DATETIME_CONVERSION_DIALECTS = {"sqlite", "postgresql", "mysql", "mariadb"}
+
+
+def unconverted_datetime_columns(conn) -> list[tuple[Table, Column]]:
+    """Get the datetime columns that may still hold datetimes, not integers.
+
+    SQLite columns keep their declared type, so all of them are returned;
+    elsewhere the columns already reflected as integers are left out.
+    """
+    tables = inspect(conn).get_table_names()
+    columns = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in tables:
+            continue
+        existing = {c["name"]: c["type"] for c in inspect(conn).get_columns(table.name)}
+        for column in table.columns:
+            if not isinstance(column.type, UTCDateTime) or column.name not in existing:
+                continue
+            if conn.dialect.name == "sqlite" or not isinstance(
+                existing[column.name], Integer
+            ):
+                columns.append((table, column))
+    return columns
+
+
+def check_datetime_conversion(conn):
+    """Refuse to migrate a database whose datetimes cannot be converted."""
+    if conn.dialect.name in DATETIME_CONVERSION_DIALECTS:
+        return
+    columns = [
+        f"{table.name}.{column.name}"
+        for table, column in unconverted_datetime_columns(conn)
+    ]
+    if columns:
+        raise NotImplementedError(
+            f"Convert {', '.join(columns)} to epoch microseconds manually "
+            f"before migrating a {conn.dialect.name} database"
+        )
+
+
+def store_datetimes_as_epoch(conn):
+    """Store the datetime columns as integer microseconds since the epoch."""
+    for table, column in unconverted_datetime_columns(conn):
+        name = column.name
+        local_time = (table.name, name) in LOCAL_TIME_COLUMNS
+        if conn.dialect.name == "sqlite":
+            # SQLite keeps the integers whatever the declared type; the
+            # old values are "YYYY-MM-DD HH:MM:SS.ffffff" strings. The
+            # 'utc' modifier converts local times, in the zone of this
+            # process (TZ), to UTC
+            modifier = ", 'utc'" if local_time else ""
+            conn.execute(
+                text(
+                    f"UPDATE {table.name} SET {name} = "
+                    f"CAST(strftime('%s', {name}{modifier}) AS INTEGER) * 1000000 "
+                    f"+ CAST(substr({name}, 21, 6) AS INTEGER) "
+                    f"WHERE typeof({name}) = 'text'"
+                )
+            )
+        elif conn.dialect.name == "postgresql":
+            # Casting to TIMESTAMPTZ reads local times in the TimeZone of
+            # the session (PGTZ); the other columns are read as UTC
+            value = f"CAST({name} AS TIMESTAMPTZ)" if local_time else name
+            conn.execute(
+                text(
+                    f"ALTER TABLE {table.name} ALTER COLUMN {name} TYPE BIGINT "
+                    f"USING (EXTRACT(EPOCH FROM {value}) * 1000000)::BIGINT"
+                )
+            )
+        elif conn.dialect.name in ("mysql", "mariadb"):
+            # UNIX_TIMESTAMP reads local times in the time_zone of the
+            # session; the other columns are read as UTC
+            value = (
+                f"CAST(UNIX_TIMESTAMP({name}) * 1000000 AS SIGNED)"
+                if local_time
+                else f"TIMESTAMPDIFF(MICROSECOND, '1970-01-01 00:00:00', {name})"
+            )
+            null = "NULL" if column.nullable else "NOT NULL"
+            # MySQL cannot convert a column with an expression, so the
+            # values go through a new column that replaces the old one
+            for statement in (
+                f"ALTER TABLE {table.name} ADD COLUMN {name}_epoch BIGINT",
+                f"UPDATE {table.name} SET {name}_epoch = {value}",
+                f"ALTER TABLE {table.name} DROP COLUMN {name}",
+                f"ALTER TABLE {table.name} CHANGE {name}_epoch {name} BIGINT {null}",
+            ):
+                conn.execute(text(statement))
+            # Dropping the column dropped its indexes
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+        else:
+            raise NotImplementedError(
+                f"Convert {table.name}.{name} to epoch microseconds manually"
+            )
+
+
+def add_contract_event_stats(conn):
+    """Add the event_count and next_event_date columns of contracts."""
+    added = add_column(conn, Contract.__table__.c.event_count)
+    added = add_column(conn, Contract.__table__.c.next_event_date) or added
+    create_indexes(conn, Contract, Event)
+    if added:
+        conn.execute(update(Contract).values(**contract_event_stats(datetime.now(UTC))))
+
+
+def copy_models() -> MetaData:
+    """Copy the whole model schema, so the foreign keys of copied tables resolve."""
+    metadata = MetaData()
+    for model_table in Base.metadata.sorted_tables:
+        model_table.to_metadata(metadata)
+    return metadata
+
+
+def rebuild_table(conn, table: Table, expressions: dict[str, str] | None = None):
+    """Recreate a SQLite table from its model, keeping its rows.
+
+    SQLite cannot alter constraints, so the table is copied into a new one
+    built from the model, then swapped in. Foreign keys must be off.
+    Columns are copied by name; expressions gives the SQL computing new
+    columns from the old ones.
+    """
+    expressions = expressions or {}
+    new_table = table.to_metadata(copy_models(), name=f"new_{table.name}")
+    conn.execute(CreateTable(new_table))
+    existing = {c["name"] for c in inspect(conn).get_columns(table.name)}
+    copied = {c.name: c.name for c in table.columns if c.name in existing}
+    copied.update(expressions)
+    conn.execute(
+        text(
+            f"INSERT INTO {new_table.name} ({', '.join(copied)}) "
+            f"SELECT {', '.join(copied.values())} FROM {table.name}"
+        )
+    )
+    conn.execute(text(f"DROP TABLE {table.name}"))
+    conn.execute(text(f"ALTER TABLE {new_table.name} RENAME TO {table.name}"))
+    for index in table.indexes:
+        index.create(conn, checkfirst=True)
+
+
+def replace_foreign_keys(conn, table: Table, reflected: list[dict]):
+    """Recreate the foreign keys of a table whose ON DELETE rule differs.
+
+    For databases that can alter constraints; the rest of the table is kept.
+    """
+    current = {tuple(fk["constrained_columns"]): fk for fk in reflected}
+    # MySQL names foreign keys apart from the other constraints
+    drop = (
+        "DROP FOREIGN KEY"
+        if conn.dialect.name in ("mysql", "mariadb")
+        else "DROP CONSTRAINT"
+    )
+    # Adding a constraint marks it as created; keep the models' own intact
+    for constraint in copy_models().tables[table.name].foreign_key_constraints:
+        if not constraint.ondelete:
+            continue
+        existing = current.get(tuple(constraint.column_keys))
+        if existing and existing["options"].get("ondelete") == constraint.ondelete:
+            continue
+        if existing:
+            name = conn.dialect.identifier_preparer.quote(existing["name"])
+            conn.execute(text(f"ALTER TABLE {table.name} {drop} {name}"))
+        conn.execute(AddConstraint(constraint))
+
+
+def add_foreign_key_rules(conn):
+    """Add the ON DELETE rules of foreign keys and index the referencing columns."""
+    tables = inspect(conn).get_table_names()
+    rebuilt = False
+    for table in Base.metadata.sorted_tables:
+        if table.name not in tables:
+            continue
+        reflected = inspect(conn).get_foreign_keys(table.name)
+        current = {
+            tuple(fk["constrained_columns"]): fk["options"].get("ondelete")
+            for fk in reflected
+        }
+        expected = {
+            (fk.parent.name,): fk.ondelete for fk in table.foreign_keys if fk.ondelete
+        }
+        if all(current.get(columns) == rule for columns, rule in expected.items()):
+            continue
+        if conn.dialect.name == "sqlite":
+            rebuild_table(conn, table)
+            rebuilt = True
+        else:
+            replace_foreign_keys(conn, table, reflected)
+    # Dropping a table drops its table version triggers
+    if rebuilt and TableVersion.__tablename__ in tables:
+        create_version_triggers(conn)
+    create_indexes(conn, *Base.__subclasses__())
+
+
+def store_amounts_in_cents(conn):
+    """Store the contract amounts as integer cents."""
+    tables = inspect(conn).get_table_names()
+    if Contract.__tablename__ not in tables:
+        return
+    existing = {c["name"] for c in inspect(conn).get_columns(Contract.__tablename__)}
+    if "total_amount_cents" in existing:
+        return
+
+    amounts = {
+        "total_amount_cents": "CAST(ROUND(total_amount * 100) AS INTEGER)",
+        "remaining_amount_cents": "CAST(ROUND(remaining_amount * 100) AS INTEGER)",
+    }
+    if conn.dialect.name == "sqlite":
+        rebuild_table(conn, Contract.__table__, amounts)
+        if TableVersion.__tablename__ in tables:
+            create_version_triggers(conn)
+        return
+
+    # Other databases alter the table in place; the new columns stay nullable
+    for name, expression in amounts.items():
+        column_type = Contract.__table__.c[name].type.compile(dialect=conn.dialect)
+        conn.execute(text(f"ALTER TABLE contract ADD COLUMN {name} {column_type}"))
+        conn.execute(text(f"UPDATE contract SET {name} = {expression}"))
+    conn.execute(text("ALTER TABLE contract DROP COLUMN total_amount"))
+    conn.execute(text("ALTER TABLE contract DROP COLUMN remaining_amount"))
+
+
+def add_version_columns(conn):
+    """Add the version columns of clients, contracts and events."""
+    tables = inspect(conn).get_table_names()
+    for model in (Client, Contract, Event):
+        if model.__tablename__ in tables:
+            add_column(conn, model.__table__.c.version)
+
+
+def add_opening_balances(conn):
+    """Record the amounts paid before the payments ledger as opening payments."""
+    conn.execute(insert_opening_balances())
+
+
+# New tables are created first, with their version triggers, so the steps
+# rebuilding a table can put its triggers back.
+# Datetimes are converted next, since the other migrations compare them.
+# Rebuilding a SQLite table copies the columns it shares with its model, so
+# the amounts must be converted before add_foreign_key_rules rebuilds contract
+# and before the opening balances are computed from them
+MIGRATIONS = [
+    create_missing_tables,
+    store_datetimes_as_epoch,
+    add_contract_event_stats,
+    store_amounts_in_cents,
+    add_foreign_key_rules,
+    add_version_columns,
+    add_opening_balances,
+]
+
+
+def migrate(engine):
+    """Run every migration in a single transaction."""
+    with engine.connect() as conn:
+        # Some databases cannot roll back DDL; fail before changing anything
+        check_datetime_conversion(conn)
+        if conn.dialect.name == "sqlite":
+            # Tables are dropped while being rebuilt, which must not fire the
+            # ON DELETE rules; the pragma is ignored inside a transaction
+            conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+            # pysqlite only opens a transaction before DML; include the DDL
+            conn.exec_driver_sql("BEGIN")
+        for migration in MIGRATIONS:
+            print(f"- {migration.__doc__}")
+            migration(conn)
+        conn.commit()
+        if conn.dialect.name == "sqlite":
+            conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+
+if __name__ == "__main__":
+    try:
+        print("Migrating database...")
+        migrate(DatabaseConnection.get_engine())
+        print("\nDatabase migration complete!")
+    except Exception as e:
+        print(f"\nError migrating database: {str(e)}")
+        exit(1)
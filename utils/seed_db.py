@@ -1,13 +1,6 @@
 from database.connection import DatabaseConnection
-from models.models import Employee, Department
-from datetime import datetime, UTC
-import random
-import string
-
-
-def generate_employee_number():
-    """Generate a random employee number."""
-    return "".join(random.choices(string.ascii_uppercase + string.digits, k=8))
+from models.models import Department
+from repositories.employee_repository import EmployeeRepository
 
 
 def generate_email(full_name):
@@ -43,20 +36,20 @@ def create_employees():
     default_password = "Password123!"
 
     with DatabaseConnection.get_session() as session:
-        for full_name, department, role in employees:
-            employee = Employee(
-                employee_number=generate_employee_number(),
-                full_name=full_name,
-                email=generate_email(full_name),
-                department=department,
-                role=role,
-                created_at=datetime.now(UTC),
-            )
-            employee.password = default_password
-            session.add(employee)
-
-        session.commit()
-        print(f"Created {len(employees)} employees")
+        repository = EmployeeRepository(session)
+        created = repository.bulk_create(
+            [
+                {
+                    "full_name": full_name,
+                    "email": generate_email(full_name),
+                    "department": department,
+                    "role": role,
+                    "password": default_password,
+                }
+                for full_name, department, role in employees
+            ]
+        )
+        print(f"Created {len(created)} employees")
 
 
 if __name__ == "__main__":
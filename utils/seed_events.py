@@ -6,6 +6,9 @@ Creates sample clients, contracts, and events for testing
 
 from database.connection import DatabaseConnection
 from models.models import Employee, Client, Contract, Event, Department
+from repositories.event_repository import contract_event_stats
+from repositories.payment_repository import insert_opening_balances
+from sqlalchemy import update
 from datetime import datetime, UTC, timedelta
 import random
 import string
@@ -175,6 +178,9 @@ def create_sample_data():
             session.add(contract)
             contracts.append(contract)
 
+        # The payments ledger starts with what partly paid contracts received
+        session.flush()
+        session.execute(insert_opening_balances())
         session.commit()
         print(f"Created {len(contracts)} contracts")
 
@@ -330,6 +336,10 @@ def create_sample_data():
                 session.add(event)
                 events.append(event)
 
+        # Events are added directly, so fill in the event columns of contracts
+        session.execute(
+            update(Contract).values(**contract_event_stats(datetime.now(UTC)))
+        )
         session.commit()
         print(f"Created {len(events)} events")
 